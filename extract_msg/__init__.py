@@ -27,8 +27,8 @@ https://github.com/TeamMsgExtractor/msg-extractor
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 __author__ = 'Destiny Peterson & Matthew Walker'
-__date__ = '2025-04-10'
-__version__ = '0.54.1'
+__date__ = '2026-10-16'
+__version__ = '0.55.0'
 
 __all__ = [
     # Modules:
@@ -38,20 +38,28 @@ __all__ = [
     'exceptions',
     'msg_classes',
     'null_date',
+    'pdf_backend',
     'properties',
+    'rtf_cache',
     'structures',
 
     # Classes:
     'Attachment',
     'AttachmentBase',
+    'DiskRtfCache',
+    'MemoryRtfCache',
     'Message',
     'MSGFile',
     'Named',
     'NamedProperties',
     'OleWriter',
+    'PdfBackend',
+    'PdfBatch',
     'PropertiesStore',
     'Recipient',
+    'RtfCache',
     'SignedAttachment',
+    'WkHtmlToPdfBackend',
 
     # Functions:
     'openMsg',
@@ -59,13 +67,58 @@ __all__ = [
 ]
 
 
-# Ensure these are imported before anything else.
-from . import constants, enums, exceptions
+import importlib
 
-from . import attachments, msg_classes, null_date, properties, structures
-from .attachments import Attachment, AttachmentBase, SignedAttachment
-from .msg_classes import Message, MSGFile
-from .ole_writer import OleWriter
-from .open_msg import openMsg, openMsgBulk
-from .properties import Named, NamedProperties, PropertiesStore
-from .recipient import Recipient
+from typing import Any, List
+
+# This registers the custom codecs with Python, so it can't wait until the
+# module is used.
+from . import encoding
+
+
+# Everything else is imported when it is first accessed, as some of the
+# submodules are large and importing everything would make importing this
+# module slow.
+# This maps each class and function to the submodule it comes from.
+_LAZY_ATTRIBUTES = {
+    'Attachment': 'attachments',
+    'AttachmentBase': 'attachments',
+    'DiskRtfCache': 'rtf_cache',
+    'MemoryRtfCache': 'rtf_cache',
+    'Message': 'msg_classes',
+    'MSGFile': 'msg_classes',
+    'Named': 'properties',
+    'NamedProperties': 'properties',
+    'OleWriter': 'ole_writer',
+    'PdfBackend': 'pdf_backend',
+    'PdfBatch': 'pdf_backend',
+    'PropertiesStore': 'properties',
+    'Recipient': 'recipient',
+    'RtfCache': 'rtf_cache',
+    'SignedAttachment': 'attachments',
+    'WkHtmlToPdfBackend': 'pdf_backend',
+    'openMsg': 'open_msg',
+    'openMsgBulk': 'open_msg',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+    else:
+        # Submodules, including ones not in __all__, were always available as
+        # attributes when everything was imported up front.
+        try:
+            value = importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    # Store the value so this is only called once for each name.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()).union(__all__))
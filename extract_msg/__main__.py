@@ -3,14 +3,128 @@ __all__ = [
 ]
 
 
+import collections
+import concurrent.futures
 import os
+import pathlib
+import shutil
 import sys
+import tempfile
 import traceback
 import zipfile
 
 from extract_msg import __doc__, openMsg, utils
-from extract_msg.enums import ErrorBehavior
-from typing import List
+from extract_msg.enums import ErrorBehavior, SaveType
+from extract_msg.pdf_backend import PdfBatch, WkHtmlToPdfBackend
+from extract_msg.rtf_cache import DiskRtfCache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def _saveMsg(x, kwargs: Dict[str, Any], openKwargs: Dict[str, Any], dumpStdout: bool, noFolders: bool) -> Tuple[Optional[str], Any]:
+    """
+    Opens and saves a single MSG file, returning a tuple of the text to print
+    to stdout (if any) and the return of the save function.
+    """
+    with openMsg(x, **openKwargs) as msg:
+        if dumpStdout:
+            return msg.body, None
+        elif noFolders:
+            return None, msg.saveAttachments(**kwargs)
+        else:
+            return None, msg.save(**kwargs)
+
+
+def _saveMsgWorker(x, kwargs: Dict[str, Any], openKwargs: Dict[str, Any], dumpStdout: bool, noFolders: bool, useZip: bool) -> Tuple[Optional[str], Any, Optional[str], Optional[str]]:
+    """
+    Function run by the worker processes when using ``--jobs``.
+
+    If :param useZip: is ``True``, the output is saved to a temporary zip file
+    which the main process is then responsible for merging into the real one.
+
+    :returns: A tuple of the text to print, the return of the save function,
+        the path to the temporary zip file (if any), and the formatted
+        traceback if an error occured.
+    """
+    tempZip = None
+    try:
+        if useZip:
+            fd, tempZip = tempfile.mkstemp(suffix = '.zip')
+            os.close(fd)
+            # The entries are copied to the real zip file as they are, so
+            # they are created the same way as when saving to it directly.
+            with zipfile.ZipFile(tempZip, 'w', zipfile.ZIP_DEFLATED) as _zip:
+                kwargs = dict(kwargs, zip = _zip)
+                output, ret = _saveMsg(x, kwargs, openKwargs, dumpStdout, noFolders)
+        else:
+            output, ret = _saveMsg(x, kwargs, openKwargs, dumpStdout, noFolders)
+        return output, ret, tempZip, None
+    except Exception:
+        if tempZip:
+            os.remove(tempZip)
+        return None, None, None, traceback.format_exc()
+
+
+def _addZipNames(names: Set[str], folders: Set[str], newNames: Iterable[str]) -> None:
+    """
+    Adds entries that were written to the target zip to the sets of the names
+    and folder prefixes (ending with "/") that it contains, so that checking
+    for conflicts doesn't need to list the zip file every time.
+    """
+    for name in newNames:
+        names.add(name)
+        # If a folder is already known, so are all of its parents.
+        index = len(name)
+        while (index := name.rfind('/', 0, index)) != -1 and (prefix := name[:index + 1]) not in folders:
+            folders.add(prefix)
+
+
+def _mergeZip(sourcePath: str, target: zipfile.ZipFile, saveReturn: Any, overwriteExisting: bool, names: Set[str], folders: Set[str]) -> None:
+    """
+    Copies all of the entries from the temporary zip file created by a worker
+    into the target zip, resolving name conflicts the same way saving directly
+    to the zip would.
+
+    :param names: The names of the entries in the target zip. Updated with the
+        entries that are added.
+    :param folders: The folder prefixes of the entries in the target zip.
+        Updated with the entries that are added.
+    """
+    nameMap = {}
+    with zipfile.ZipFile(sourcePath, 'r') as source:
+        infos = source.infolist()
+        if saveReturn and saveReturn[0] is SaveType.FOLDER:
+            # The whole folder may need to be renamed.
+            oldPath = pathlib.Path(saveReturn[1])
+            oldPrefix = str(oldPath).replace('\\', '/').rstrip('/') + '/'
+            if oldPrefix in folders:
+                for i in range(2, 100):
+                    newDirName = oldPath.with_name(oldPath.name + f' ({i})')
+                    if (newPrefix := str(newDirName).replace('\\', '/').rstrip('/') + '/') not in folders:
+                        break
+                else:
+                    raise Exception(f'Failed to create directory "{saveReturn[1]}". Does it already exist?')
+                nameMap = {x.filename: newPrefix + x.filename[len(oldPrefix):] for x in infos if x.filename.startswith(oldPrefix)}
+        elif not overwriteExisting:
+            # Files were saved directly, so check each one.
+            for info in infos:
+                if (x := info.filename) in names:
+                    name, ext = os.path.splitext(x)
+                    for i in range(2, 100):
+                        if (testName := f'{name} ({i}){ext}') not in names:
+                            nameMap[x] = testName
+                            break
+                    else:
+                        raise FileExistsError(f'Could not create the specified file because it already exists ("{x}").')
+
+        for info in infos:
+            # Keep everything about the entry except its name, so that it
+            # matches what saving directly to the zip would create.
+            newInfo = zipfile.ZipInfo(nameMap.get(info.filename, info.filename), info.date_time)
+            newInfo.external_attr = info.external_attr
+            newInfo.compress_type = info.compress_type
+            with source.open(info, 'r') as src, target.open(newInfo, 'w') as dst:
+                shutil.copyfileobj(src, dst)
+            _addZipNames(names, folders, (newInfo.filename,))
 
 
 def main(argv: List[str] = sys.argv) -> None:
@@ -51,6 +165,7 @@ def main(argv: List[str] = sys.argv) -> None:
         'extractEmbedded': args.extractEmbedded,
         'html': args.html,
         'json': args.json,
+        'linkAttachments': args.linkAttachments,
         'overwriteExisting': args.overwriteExisting,
         'pdf': args.pdf,
         'preparedHtml': args.preparedHtml,
@@ -68,8 +183,12 @@ def main(argv: List[str] = sys.argv) -> None:
 
     openKwargs = {
         'errorBehavior': ErrorBehavior.RTFDE if args.ignoreRtfDeErrors else ErrorBehavior.THROW,
+        'htmlParser': args.htmlParser,
     }
 
+    if args.rtfCache:
+        openKwargs['rtfCache'] = DiskRtfCache(args.rtfCache)
+
     # If we are skipping the NotImplementedError attachments, we need to
     # suppress the error.
     if args.skipNotImplemented:
@@ -85,7 +204,7 @@ def main(argv: List[str] = sys.argv) -> None:
                 f'\\u{ord(x):04X}' if ord(x) <= 0xFFFF else
                 f'\\U{ord(x):08X}') for x in repr(inp))
 
-    for x in args.msgs:
+    def printProgress(x):
         if args.progress:
             # This may throw an error sometimes and not othertimes.
             # Unclear why, so let's just silence it.
@@ -93,19 +212,92 @@ def main(argv: List[str] = sys.argv) -> None:
                 print(f'Saving file "{x}"...')
             except UnicodeEncodeError:
                 print(f'Saving file "{strSanitize(x)}" (failed to print without repr)...')
+
+    def printError(x, tb: str):
         try:
-            with openMsg(x, **openKwargs) as msg:
-                if args.dumpStdout:
-                    print(msg.body)
-                elif args.noFolders:
-                    msg.saveAttachments(**kwargs)
-                else:
-                    msg.save(**kwargs)
-        except Exception as e:
+            print(f'Error with file "{x}": {tb}')
+        except UnicodeEncodeError:
+            print(f'Error with file "{strSanitize(x)}": {tb}')
+
+    if args.pdf and args.pdfBatch:
+        # The messages are all handled by this process, as the work of
+        # converting them is done by the wkhtmltopdf processes for each batch.
+        backend = WkHtmlToPdfBackend(args.wkPath, args.wkOptions, batchSize = args.pdfBatch, maxProcesses = args.jobs)
+        pdfBatch = PdfBatch(backend)
+        kwargs['pdfBatch'] = pdfBatch
+    else:
+        pdfBatch = None
+
+    def flushPdfBatch():
+        for path, e in pdfBatch.flush():
+            printError(path, ''.join(traceback.format_exception(type(e), e, e.__traceback__)))
+
+    if args.jobs == 1 or pdfBatch is not None:
+        for x in args.msgs:
+            printProgress(x)
             try:
-                print(f'Error with file "{x}": {traceback.format_exc()}')
-            except UnicodeEncodeError:
-                print(f'Error with file "{strSanitize(x)}": {traceback.format_exc()}')
+                output, _ = _saveMsg(x, kwargs, openKwargs, args.dumpStdout, args.noFolders)
+                if output is not None:
+                    print(output)
+            except Exception as e:
+                printError(x, traceback.format_exc())
+            if pdfBatch is not None and len(pdfBatch) >= args.pdfBatch * args.jobs:
+                flushPdfBatch()
+        if pdfBatch is not None:
+            flushPdfBatch()
+    else:
+        # The zip file can't be shared between processes, so the workers each
+        # write to their own temporary one and this process is the only one
+        # that ever writes to the real one.
+        workerKwargs = dict(kwargs, zip = None)
+        useZip = _zip is not None
+        # Only this process writes to the zip file, so it keeps track of what
+        # is in it.
+        zipNames = set()
+        zipFolders = set()
+        if useZip:
+            _addZipNames(zipNames, zipFolders, _zip.namelist())
+
+        def handleResult(x, future: concurrent.futures.Future) -> None:
+            # If a worker dies, such as from running out of memory, the pool
+            # is broken and every file still in it fails. Those are reported
+            # like any other error instead of stopping the whole run.
+            try:
+                output, ret, tempZip, tb = future.result()
+            except Exception:
+                printError(x, traceback.format_exc())
+                return
+            if tb is not None:
+                printError(x, tb)
+                return
+            if output is not None:
+                print(output)
+            if tempZip:
+                try:
+                    _mergeZip(tempZip, _zip, ret, args.overwriteExisting, zipNames, zipFolders)
+                except Exception:
+                    printError(x, traceback.format_exc())
+                finally:
+                    os.remove(tempZip)
+
+        initArgs = () if args.dumpStdout else (args.configPath, args.logLevel, args.log, args.fileLogging)
+        with concurrent.futures.ProcessPoolExecutor(args.jobs, initializer = utils.setupLogging if initArgs else None, initargs = initArgs) as executor:
+            # Limit how many files are in flight at once so we don't queue up
+            # millions of futures, and handle the results in order so that
+            # the output (and any renaming in the zip) is deterministic.
+            pending = collections.deque()
+            for x in args.msgs:
+                printProgress(x)
+                try:
+                    pending.append((x, executor.submit(_saveMsgWorker, x, workerKwargs, openKwargs, args.dumpStdout, args.noFolders, useZip)))
+                except Exception:
+                    # A broken pool won't take any more files.
+                    printError(x, traceback.format_exc())
+                    continue
+                if len(pending) >= args.jobs * 2:
+                    handleResult(*pending.popleft())
+            while pending:
+                handleResult(*pending.popleft())
 
     # Close the zip file if we opened it.
     if createdZip:
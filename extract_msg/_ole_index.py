@@ -0,0 +1,102 @@
+"""
+Internal index of the directory of an OLE file.
+
+``olefile`` resolves every path by scanning the children of each storage along
+the way, which becomes very slow for MSG files with hundreds of properties.
+This index is built once when the file is opened so that lookups are simple
+dictionary accesses.
+"""
+
+from __future__ import annotations
+
+
+__all__ = [
+    'buildDirectoryIndex',
+    'DirectoryNode',
+]
+
+
+import olefile
+
+from typing import Dict, List, Optional
+
+
+class DirectoryNode:
+    """
+    A single directory entry in the index.
+    """
+
+    __slots__ = ('children', 'entry', 'name', 'props')
+
+    def __init__(self, entry: olefile.olefile.OleDirectoryEntry):
+        self.entry = entry
+        self.name: str = entry.name
+        # Children of a storage, keyed by their lowercase name as names are
+        # case-insensitive.
+        self.children: Dict[str, DirectoryNode] = {}
+        # The property entries of a storage, keyed by the uppercase 4
+        # character property ID. This includes the streams for each value of a
+        # multiple property (those with a "-" in the name) and storages, like
+        # the one for an embedded MSG file.
+        self.props: Dict[str, List[DirectoryNode]] = {}
+
+    def find(self, path: List[str]) -> Optional[DirectoryNode]:
+        """
+        Finds the node at the path relative to this node, returning ``None``
+        if it does not exist.
+        """
+        node = self
+        for name in path:
+            if (node := node.children.get(name.lower())) is None:
+                return None
+        return node
+
+    def listDir(self, streams: bool = True, storages: bool = False, prefix: Optional[List[str]] = None) -> List[List[str]]:
+        """
+        Lists the entries under this node in the same order as
+        ``OleFileIO.listdir``.
+
+        :param prefix: If provided, is added to the start of every path.
+        """
+        entries: List[List[str]] = []
+        self._list(entries, prefix or [], streams, storages)
+        return entries
+
+    def _list(self, entries: List[List[str]], path: List[str], streams: bool, storages: bool) -> None:
+        for child in self.children.values():
+            childPath = path + [child.name]
+            if child.entry.entry_type == olefile.STGTY_STORAGE:
+                if storages:
+                    entries.append(childPath)
+                child._list(entries, childPath, streams, storages)
+            elif streams and child.entry.entry_type == olefile.STGTY_STREAM:
+                entries.append(childPath)
+
+    @property
+    def isStorage(self) -> bool:
+        return self.entry.entry_type in (olefile.STGTY_STORAGE, olefile.STGTY_ROOT)
+
+    @property
+    def isStream(self) -> bool:
+        return self.entry.entry_type == olefile.STGTY_STREAM
+
+
+def buildDirectoryIndex(ole: olefile.OleFileIO) -> DirectoryNode:
+    """
+    Builds the index for the entire OLE file, returning the root node.
+    """
+    root = DirectoryNode(ole.root)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for kid in node.entry.kids:
+            child = DirectoryNode(kid)
+            # If there are somehow duplicate names, olefile uses the first one.
+            node.children.setdefault(kid.name.lower(), child)
+            if kid.entry_type == olefile.STGTY_STORAGE:
+                stack.append(child)
+            name = kid.name
+            if len(name) >= 16 and name[:12].lower() == '__substg1.0_':
+                node.props.setdefault(name[12:16].upper(), []).append(child)
+
+    return root
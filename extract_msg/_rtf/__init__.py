@@ -9,13 +9,26 @@ __all__ = [
 
     # Functions:
     'createDocument',
+    'deencapsulateHtml',
+    'extractText',
+    'findStartRTFInjection',
     'injectStartRTF',
+    'injectStartRTFSpliced',
     'injectStartRTFTokenized',
+    'iterTokenizeRTF',
+    'scanText',
+    'spliceStartRTF',
     'tokenizeRTF',
 ]
 
 
 from .create_doc import createDocument
-from .inject_rtf import injectStartRTF, injectStartRTFTokenized
+from .deencapsulate import deencapsulateHtml
+from .extract_text import extractText
+from .inject_rtf import (
+        findStartRTFInjection, injectStartRTF, injectStartRTFSpliced,
+        injectStartRTFTokenized, spliceStartRTF
+    )
+from .scan_text import scanText
 from .token import Token, TokenType
-from .tokenize_rtf import tokenizeRTF
+from .tokenize_rtf import iterTokenizeRTF, tokenizeRTF
@@ -0,0 +1,73 @@
+"""
+Fast deencapsulation of HTML from RTF, as described in [MS-OXRTFEX].
+
+RTFDE parses the entire document into a tree before doing anything with it,
+which is very slow for large bodies. Outlook only uses a small part of RTF
+when it encapsulates HTML, so this reads the document in a single pass with
+:func:`.scanText` and only handles that part. Anything it does not understand should be given to
+RTFDE instead.
+"""
+
+__all__ = [
+    'deencapsulateHtml',
+]
+
+
+from typing import Optional, Union
+
+from .scan_text import scanText
+from ..constants.re import RTF_TOKEN
+
+
+# The number of tokens at the start of the document to look through for the
+# ``\fromhtml1`` control word.
+_HEADER_TOKENS = 10
+
+
+def _isEncapsulatedHtml(data: Union[bytes, memoryview]) -> bool:
+    """
+    Checks the start of the document for the ``\\fromhtml1`` control word,
+    following the rules in [MS-OXRTFEX] section 2.2.3.1.
+    """
+    if bytes(data[:6]) != b'{\\rtf1':
+        return False
+
+    match = RTF_TOKEN.match
+    pos = 0
+    count = 0
+    while count < _HEADER_TOKENS and (m := match(data, pos)) is not None:
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == 'groupStart':
+            count += 1
+        elif kind == 'control':
+            count += 1
+            name = m.group('name')
+            if name == b'fromhtml':
+                return m.group('param') == b'1'
+            if name in (b'fromtext', b'fonttbl'):
+                return False
+    return False
+
+
+def deencapsulateHtml(data: Union[bytes, memoryview]) -> Optional[bytes]:
+    """
+    Deencapsulates the HTML from the RTF data, returning it encoded as UTF-8.
+
+    Returns ``None`` if the data is not RTF containing encapsulated HTML. Any
+    data after the end of the RTF document is ignored.
+
+    :param data: The RTF data. May be any bytes-like object, which is read
+        without being copied.
+
+    :raises ValueError: The RTF data was malformed.
+    :raises UnknownCodepageError: The RTF data used a code page that was not
+        recognized.
+    :raises UnsupportedEncodingError: The RTF data used a code page that is
+        not supported.
+    """
+    if not _isEncapsulatedHtml(data):
+        return None
+
+    html = scanText(data, 1, html = True, strict = True)
+    return html.replace('\xA0', '&nbsp;').encode('utf-8')
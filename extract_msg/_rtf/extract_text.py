@@ -0,0 +1,34 @@
+"""
+Fast extraction of the text from RTF, for when only an approximation of the
+plain text is needed, such as for search indexing.
+
+This uses the same reader as :mod:`.deencapsulate`, but keeps the text an RTF
+reader would display instead of the encapsulated HTML, so it works on any RTF
+body. Formatting, tables, and fields are ignored, and nothing in the data will
+cause an error.
+"""
+
+__all__ = [
+    'extractText',
+]
+
+
+from typing import Optional, Union
+
+from .scan_text import scanText
+
+
+def extractText(data: Union[bytes, memoryview], maxLength: Optional[int] = None) -> str:
+    """
+    Extracts the text that an RTF reader would display from the RTF data.
+
+    Unlike :func:`deencapsulateHtml`, malformed data does not raise an
+    exception. Anything that cannot be read is skipped or replaced with
+    U+FFFD, and if the data ends early, the text found so far is returned.
+
+    :param data: The RTF data. May be any bytes-like object, which is read
+        without being copied.
+    :param maxLength: If given, stops reading the data once this many
+        characters have been found and returns only that many.
+    """
+    return scanText(data, maxLength = maxLength)
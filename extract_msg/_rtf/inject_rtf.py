@@ -1,13 +1,16 @@
 __all__ = [
+    'findStartRTFInjection',
     'injectStartRTF',
+    'injectStartRTFSpliced',
     'injectStartRTFTokenized',
+    'spliceStartRTF',
 ]
 
 
 from .token import Token, TokenType
-from .tokenize_rtf import tokenizeRTF
+from .tokenize_rtf import iterTokenizeRTF, tokenizeRTF
 
-from typing import List, Iterable, TypeVar, Union
+from typing import List, Iterable, Tuple, TypeVar, Union
 
 
 _T = TypeVar('_T')
@@ -66,6 +69,110 @@ def _listInsertMult(dest: List[_T], source: Iterable[_T], index: int = -1):
             dest.insert(index + offset, item)
 
 
+def findStartRTFInjection(document: Union[bytes, memoryview]) -> int:
+    """
+    Finds the offset in the document just before the first rendered character,
+    which is the same place that :function injectStartRTF: injects at.
+
+    Unlike :function injectStartRTF:, only the header of the document is
+    tokenized, so the rest of the document is not validated.
+
+    :raises TypeError: The data is not recognized as RTF.
+    :raises ValueError: An issue with basic parsing occured.
+    """
+    tokens = iterTokenizeRTF(document)
+    # The first item is always the group start and "\rtf1".
+    offset = next(tokens)[1]
+    # Current number of open groups.
+    groupCount = 1
+    # Set to True when looking for if the group is a destination.
+    checkingDest = False
+
+    # This follows the same rules as injectStartRTFTokenized, except that
+    # instead of counting the tokens before the insert point, we record the
+    # offset just after the last token that was part of the header.
+    for newTokens, end in tokens:
+        item = newTokens[0]
+        if groupCount == 1:
+            if item.type is TokenType.GROUP_END:
+                return offset
+            elif item.type is TokenType.GROUP_START:
+                groupCount += 1
+                checkingDest = True
+            elif item.type is TokenType.CONTROL and item.name in _HEADER_SKIPPABLE:
+                offset = end
+            else:
+                return offset
+        elif checkingDest:
+            if item.type is TokenType.DESTINATION:
+                if item.name in _HEADER_DESTINATIONS:
+                    offset = end
+                else:
+                    return offset
+            elif item.type is TokenType.IGNORABLE_DESTINATION:
+                offset = end
+            else:
+                return offset
+            checkingDest = False
+        else:
+            # Skip the current tokens, keeping track of groups.
+            if item.type is TokenType.GROUP_START:
+                groupCount += 1
+            elif item.type is TokenType.GROUP_END:
+                groupCount -= 1
+            offset = end
+
+    # A valid document always ends the header with the final group close.
+    raise ValueError('Number of group opens did not match number of group closes.')
+
+
+def injectStartRTFSpliced(document: Union[bytes, memoryview], injectData: bytes) -> bytes:
+    """
+    Like :function injectStartRTF:, injects the data just before the first
+    rendered character, except that the data is inserted directly into the
+    bytes of the document, leaving the rest of it unchanged. Only the header of
+    the document is tokenized.
+
+    :param document: The bytes representing the RTF document.
+    :param injectData: The bytes to inject into the document.
+
+    :raises TypeError: The data is not recognized as RTF.
+    :raises ValueError: An issue with basic parsing occured.
+    """
+    return b''.join(spliceStartRTF(document, injectData))
+
+
+def spliceStartRTF(document: Union[bytes, memoryview], injectData: bytes) -> Tuple[memoryview, bytes, memoryview]:
+    """
+    Like :function injectStartRTFSpliced:, except that the parts of the
+    document before and after the injected data are returned with the data
+    between them instead of being joined, so they can be written out without
+    copying the document.
+
+    :param document: The bytes representing the RTF document.
+    :param injectData: The bytes to inject into the document.
+
+    :raises TypeError: The data is not recognized as RTF.
+    :raises ValueError: An issue with basic parsing occured.
+    """
+    offset = findStartRTFInjection(document)
+    view = memoryview(document)
+    return (view[:offset], _delimit(document, offset, injectData), view[offset:])
+
+
+def _delimit(document: Union[bytes, memoryview], offset: int, injectData: bytes) -> bytes:
+    """
+    Adds a space to the start of the injected data if it would otherwise
+    become part of a control word that ends at :param offset:.
+    """
+    # The offset is only ever after a control word or the end of a group, so
+    # if the last byte is a letter or digit, a control word ends there without
+    # a delimiter.
+    if injectData[:1] not in (b'\\', b'{', b'}', b'') and bytes(document[offset - 1:offset]).isalnum():
+        return b' ' + injectData
+    return injectData
+
+
 def injectStartRTF(document: bytes, injectTokens: Union[bytes, List[Token]]) -> List[Token]:
     """
     Injects the specified tokens into the document, returning a new copy of the
@@ -0,0 +1,335 @@
+"""
+Single pass reading of text from RTF, shared by :mod:`.deencapsulate` and
+:mod:`.extract_text`.
+
+RTFDE parses the entire document into a tree before doing anything with it,
+which is very slow for large bodies. This reads only the small part of RTF that
+affects which characters are produced: groups, destinations, fonts and code
+pages, and the control words and symbols that produce characters.
+"""
+
+__all__ = [
+    'scanText',
+]
+
+
+import itertools
+import re
+
+from typing import Dict, List, Optional, Union
+
+from ..constants import RTF_DESTINATIONS
+from ..constants.re import RTF_TOKEN
+from ..encoding import lookupCodePage
+from ..exceptions import UnknownCodepageError, UnsupportedEncodingError
+
+
+# The control words that produce characters. Every other control word is
+# either handled directly or produces nothing.
+_CONTROL_CHARS: Dict[bytes, str] = {
+    b'par': '\n',
+    b'line': '\n',
+    b'tab': '\t',
+    b'lquote': '‘',
+    b'rquote': '’',
+    b'ldblquote': '“',
+    b'rdblquote': '”',
+    b'bullet': '•',
+    b'endash': '–',
+    b'emdash': '—',
+}
+
+# Control words that separate parts of tables and pages produce text as well,
+# but not in encapsulated HTML.
+_TEXT_CONTROL_CHARS: Dict[bytes, str] = {
+    **_CONTROL_CHARS,
+    b'cell': '\t',
+    b'row': '\n',
+    b'page': '\n',
+    b'sect': '\n',
+}
+
+# The control symbols that produce characters.
+_SYMBOL_CHARS: Dict[bytes, str] = {
+    b'\\{': '{',
+    b'\\}': '}',
+    b'\\\\': '\\',
+    b'\\~': '\xA0',
+    b'\\_': '‑',
+    b'\\-': '\xAD',
+    b'\\\r': '\n',
+    b'\\\n': '\n',
+}
+
+# The value of each valid ``\'hh`` control symbol. Anything else is malformed.
+_HEX_VALUES: Dict[bytes, int] = {
+    bytes(x): int(bytes(x), 16)
+    for x in itertools.product(b'0123456789abcdefABCDEF', repeat = 2)
+}
+
+# The code page to use for each value of ``\fcharset``. Any others use the code
+# page of the document.
+_CHARSET_CODE_PAGES: Dict[int, int] = {
+    0: 1252,
+    128: 932,
+    129: 949,
+    134: 936,
+    136: 950,
+    161: 1253,
+    162: 1254,
+    163: 1258,
+    177: 1255,
+    178: 1256,
+    186: 1257,
+    204: 1251,
+    222: 874,
+    238: 1250,
+}
+
+# Destinations whose contents are never part of the HTML. Ignorable
+# destinations other than ``\*\htmltag`` are always skipped as well. The font
+# table is read rather than skipped, as it is needed to decode text.
+_SKIPPED_DESTINATIONS = frozenset(RTF_DESTINATIONS).union((b'context', b'info')).difference((b'fonttbl',))
+
+# Field instructions are not always marked as ignorable, but are never shown.
+_TEXT_SKIPPED_DESTINATIONS = _SKIPPED_DESTINATIONS.union((b'fldinst',))
+
+# Used to find the end of a skipped group without looking at what is in it.
+_SKIP_RE = re.compile(rb'[^\\{}]+|\\bin(-?[0-9]+)\x20?|\\.|\{|\}', re.DOTALL)
+
+# Finds UTF-16 surrogates that were created from ``\uN`` control words.
+_SURROGATE_RE = re.compile('[\uD800-\uDFFF]')
+
+
+def _skipGroup(data: Union[bytes, memoryview], pos: int) -> int:
+    """
+    Returns the position just after the end of the group that :param pos: is
+    in.
+
+    :raises ValueError: The data ended before the group did.
+    """
+    match = _SKIP_RE.match
+    end = len(data)
+    depth = 1
+    while pos < end:
+        m = match(data, pos)
+        pos = m.end()
+        char = data[m.start()]
+        if char == 123:
+            depth += 1
+        elif char == 125:
+            depth -= 1
+            if depth == 0:
+                return pos
+        elif (size := m.group(1)) is not None:
+            pos += max(int(size), 0)
+    raise ValueError('Unexpected end of data.')
+
+
+def scanText(data: Union[bytes, memoryview], pos: int = 0, html: bool = False, strict: bool = False, maxLength: Optional[int] = None) -> str:
+    """
+    Reads the text from the RTF data in a single pass, starting at
+    :param pos:.
+
+    Reading stops at the end of the first group that was not started after
+    :param pos:, or at the end of the data.
+
+    :param data: The RTF data. May be any bytes-like object, which is read
+        without being copied.
+    :param pos: The offset to start reading from.
+    :param html: If ``True``, reads the HTML encapsulated in the RTF, as
+        described in [MS-OXRTFEX], instead of the text an RTF reader would
+        display.
+    :param strict: If ``True``, malformed data raises an exception. Otherwise
+        anything that cannot be read is skipped or replaced with U+FFFD, and
+        if the data ends early, the text found so far is returned.
+    :param maxLength: If given, stops reading the data once this many
+        characters have been found and returns only that many.
+
+    :raises ValueError: The RTF data was malformed. Only raised if
+        :param strict: is ``True``.
+    :raises UnknownCodepageError: The RTF data used a code page that was not
+        recognized. Only raised if :param strict: is ``True``.
+    :raises UnsupportedEncodingError: The RTF data used a code page that is
+        not supported. Only raised if :param strict: is ``True``.
+    """
+    match = RTF_TOKEN.match
+    end = len(data)
+    controlChars = _CONTROL_CHARS if html else _TEXT_CONTROL_CHARS
+    skippedDestinations = _SKIPPED_DESTINATIONS if html else _TEXT_SKIPPED_DESTINATIONS
+    errors = 'strict' if strict else 'replace'
+    # The code page to use for each font, from the font table.
+    fonts: Dict[int, int] = {}
+    defaultFont = None
+    currentFont = None
+    ansiCodec = lookupCodePage(1252)
+    # The output is built up as strings. Bytes from text and hex values are
+    # kept until something else is added, as multibyte characters can be split
+    # across several hex values.
+    out: List[str] = []
+    length = 0
+    pending = bytearray()
+
+    def flush() -> None:
+        nonlocal length
+        if pending:
+            out.append(text := pending.decode(codec, errors))
+            length += len(text)
+            pending.clear()
+
+    def getCodec(codePage: int) -> str:
+        if strict:
+            return lookupCodePage(codePage)
+        try:
+            return lookupCodePage(codePage)
+        except (UnknownCodepageError, UnsupportedEncodingError):
+            return ansiCodec
+
+    # The state that is restored at the end of each group.
+    suppressed = False
+    uc = 1
+    codec = ansiCodec
+    fontTable = False
+    stack = []
+
+    # The number of characters left to skip after a ``\uN`` control word.
+    skip = 0
+    while pos < end:
+        if maxLength is not None and length + len(pending) >= maxLength:
+            break
+        if (m := match(data, pos)) is None:
+            if strict:
+                raise ValueError(f'Unreadable control at offset {pos}.')
+            pos += 1
+            continue
+        kind = m.lastgroup
+        pos = m.end()
+
+        if kind == 'text':
+            if fontTable:
+                continue
+            text = m.group()
+            if skip:
+                if skip >= len(text):
+                    skip -= len(text)
+                    continue
+                text = text[skip:]
+                skip = 0
+            if not suppressed:
+                pending += text
+        elif kind == 'control':
+            name = m.group('name')
+            param = m.group('param')
+            if (m.group('star') and not (html and name == b'htmltag')) or name in skippedDestinations:
+                if not stack:
+                    if strict:
+                        raise ValueError('Destinations must be the first thing in a group.')
+                    continue
+                try:
+                    pos = _skipGroup(data, pos)
+                except ValueError:
+                    if strict:
+                        raise
+                    break
+                if pending and stack[-1][2] != codec:
+                    flush()
+                suppressed, uc, codec, fontTable = stack.pop()
+                skip = 0
+            elif html and name == b'htmlrtf':
+                suppressed = param != b'0'
+            elif name in controlChars:
+                if skip:
+                    skip -= 1
+                elif not suppressed and not fontTable:
+                    flush()
+                    out.append(controlChars[name])
+                    length += 1
+            elif name == b'u':
+                if param is None:
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                if not suppressed and not fontTable:
+                    flush()
+                    out.append(chr(int(param) & 0xFFFF))
+                    length += 1
+                skip = uc
+            elif name == b'f':
+                if param is None:
+                    continue
+                if fontTable:
+                    currentFont = int(param)
+                else:
+                    flush()
+                    font = int(param)
+                    codec = getCodec(fonts[font]) if font in fonts else ansiCodec
+            elif name == b'uc':
+                uc = max(int(param or 0), 0)
+            elif fontTable:
+                if param is not None and currentFont is not None:
+                    # If both are present, ``\cpg`` is ignored.
+                    if name == b'fcharset':
+                        if (page := _CHARSET_CODE_PAGES.get(int(param))) is not None:
+                            fonts[currentFont] = page
+                    elif name == b'cpg':
+                        fonts.setdefault(currentFont, int(param))
+            elif name == b'fonttbl':
+                fontTable = True
+                currentFont = None
+            elif name == b'bin':
+                pos += max(int(param or 0), 0)
+            elif skip:
+                skip -= 1
+            elif name == b'ansicpg':
+                codec = ansiCodec = getCodec(int(param or 1252))
+            elif name == b'deff':
+                defaultFont = int(param or 0)
+        elif kind == 'groupStart':
+            stack.append((suppressed, uc, codec, fontTable))
+            skip = 0
+        elif kind == 'groupEnd':
+            if not stack:
+                break
+            if pending and stack[-1][2] != codec:
+                flush()
+            if fontTable:
+                suppressed, uc, codec, fontTable = stack.pop()
+                # The font table is in the header, so nothing has changed the
+                # font from the default one yet.
+                if not fontTable and defaultFont in fonts:
+                    codec = getCodec(fonts[defaultFont])
+            else:
+                suppressed, uc, codec, fontTable = stack.pop()
+            skip = 0
+        elif kind == 'hex':
+            if skip:
+                skip -= 1
+            elif not suppressed and not fontTable:
+                if (value := _HEX_VALUES.get(m.group('hexValue'))) is not None:
+                    pending.append(value)
+                elif strict:
+                    raise ValueError(f'Hex data was not hexidecimal (got {m.group("hexValue")}).')
+                else:
+                    flush()
+                    out.append('\uFFFD')
+                    length += 1
+        elif kind == 'symbol':
+            if skip:
+                skip -= 1
+            elif not suppressed and not fontTable and (char := _SYMBOL_CHARS.get(m.group())):
+                flush()
+                out.append(char)
+                length += 1
+    else:
+        if strict:
+            raise ValueError('Unexpected end of data.')
+
+    flush()
+    text = ''.join(out)
+    # ``\uN`` can only specify UTF-16 code units, so characters outside of the
+    # BMP are surrogate pairs that need to be joined.
+    if _SURROGATE_RE.search(text):
+        text = text.encode('utf-16-le', 'surrogatepass').decode('utf-16-le', 'replace')
+
+    return text if maxLength is None else text[:maxLength]
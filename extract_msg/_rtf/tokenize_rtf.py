@@ -1,253 +1,147 @@
 __all__ = [
+    'iterTokenizeRTF',
     'tokenizeRTF',
 ]
 
 
-import io
-
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
 
 from .token import Token, TokenType
+from ..constants import RTF_DESTINATIONS
+from ..constants.re import RTF_TOKEN
 
 
-_KNOWN_DESTINATIONS = (
-    b'aftncn',
-    b'aftnsep',
-    b'aftnsepc',
-    b'annotation',
-    b'author',
-    b'buptim',
-    b'category',
-    b'colortbl',
-    b'comment',
-    b'company',
-    b'creatim',
-    b'doccomm',
-    b'dptxbxtext',
-    b'factoidname',
-    b'fonttbl',
-    b'footer',
-    b'footerf',
-    b'footerl',
-    b'footerr',
-    b'ftncn',
-    b'ftnsep',
-    b'ftnsepc',
-    b'header',
-    b'headerf',
-    b'headerl',
-    b'headerr',
-    b'hlinkbase',
-    b'keywords',
-    b'manager',
-    b'operator',
-    b'pict',
-    b'printim',
-    b'private',
-    b'revtim',
-    b'stylesheet',
-    b'subject',
-    b'title',
-)
-
-
-def _finishTag(startText: bytes, reader: io.BytesIO) -> Tuple[bytes, Optional[bytes], Optional[int], bytes]:
-    """
-    Finishes reading a tag, returning the needed parameters to make it a
-    token.
+# Tokens are immutable, so the ones that are always the same are only created
+# once. Text is a token for each byte.
+_GROUP_START = Token(b'{', TokenType.GROUP_START)
+_GROUP_END = Token(b'}', TokenType.GROUP_END)
+_GROUP_START_TUPLE = (_GROUP_START,)
+_GROUP_END_TUPLE = (_GROUP_END,)
+_RTF1 = Token(b'\\rtf1', TokenType.CONTROL, b'rtf', 1)
+_TEXT_TOKENS = tuple(Token(bytes((x,)), TokenType.TEXT) for x in range(256))
 
-    The return is a 4 tuple of the raw token bytes, the name field, the
-    parameter field (as an int), and the next character after the tag.
-    """
-    # Very simple rules here. Anything other than a letter and we change
-    # state. If the next character is a hypen, check if the character after
-    # is a digit, otherwise return. If it is a digit or that previously
-    # mentioned next character was a digit, read digits until anything else
-    # is detected, then return.
-    name = startText[-1:]
-    param = b''
-
-    while (nextChar := reader.read(1)) != b'' and nextChar.isalpha():
-        # Read until not alpha.
-        startText += nextChar
-        name += nextChar
-
-    # Check what the next character is to decide what to do with it.
-    if nextChar == b'-':
-        # We do this as a separate check.
-        nextNext = reader.read(1)
-        if nextNext == b'':
-            raise ValueError('Unexpected end of data.')
-        elif nextNext.isdigit():
-            startText += nextChar
-            nextChar = nextNext
-
-    if nextChar.isdigit():
-        startText += nextChar
-        param += nextChar
-        while (nextChar := reader.read(1)) != b'' and nextChar.isdigit():
-            startText += nextChar
-            param += nextChar
-
-        param = int(param)
-    else:
-        param = None
-
-    # Finally, check if the next char is a space, and if it is, read one
-    # more char to replace it.
-    if nextChar == b' ':
-        nextChar = reader.read(1)
-
-    return startText, name, param, nextChar
-
-
-def _readControl(startChar: bytes, reader: io.BytesIO) -> Tuple[Tuple[Token, ...], bytes]:
-    """
-    Attempts to read the next data as a control, returning as many tokens
-    as necessary.
-    """
-    # First, read the next character, as it decides how to handle
-    # everything.
-    nextChar = reader.read(1)
-    if nextChar == b'':
-        raise ValueError('Unexpected end of data.')
-    elif nextChar.isalpha():
-        # If is an alphabetical character, so start the handling of a tag.
-        text, name, param, nextChar = _finishTag(startChar + nextChar, reader)
-        # Important, check if the name is "bin". If it is, handle that
-        # specially before returning.
-        if name == b'bin':
-            if nextChar == b'':
-                raise ValueError('Unexpected end of data.')
-            binText = nextChar + reader.read(param - 1)
-            if len(binText) != param:
-                raise ValueError('Unexpected end of data.')
-            return (Token(text, TokenType.CONTROL, name, param), Token(binText, TokenType.BINARY)), nextChar
-        elif name in _KNOWN_DESTINATIONS:
-            return (Token(text, TokenType.DESTINATION, name, param),), nextChar
-
-        return (Token(text, TokenType.CONTROL, name, param),), nextChar
-    else:
-        # Most control symbols would return immediately, but there are two
-        # exceptions.
-        startChar += nextChar
-        if nextChar == b'*':
-            # This is going to be a custom destination. First, validation.
-            if len(nextChar := reader.read(1)) != 1:
-                raise ValueError('Unexpected end of data.')
-            elif nextChar != b'\\':
-                raise ValueError(f'Bad custom destination (expected a backslash, got {nextChar}).')
-
-            startChar += nextChar
-
-            # Check the the next char is alpha.
-            if not (nextChar := reader.read(1)).isalpha():
-                raise ValueError(f'Expected alpha character for destination, got {nextChar}.')
-
-            startChar += nextChar
-
-            # Call the function to read until a clear end of tag.
-            text, name, param, nextChar = _finishTag(startChar, reader)
-            return (Token(text, TokenType.IGNORABLE_DESTINATION, name, param),), nextChar
-        elif nextChar == b'\'':
-            # This is a hex character, so immediately read 2 more bytes.
-            hexChars = reader.read(2)
-            if len(hexChars) != 2:
-                raise ValueError('Unexpected end of data.')
-            try:
-                param = int(hexChars, 16)
-            except ValueError as e:
-                context = e.__cause__ or e.__context__
-                raise ValueError(f'Hex data was not hexidecimal (got {hexChars}).') from context
-            return (Token(startChar + hexChars, TokenType.SYMBOL, None, param),), reader.read(1)
-        else:
-            # If it is a control symbol, immediately return.
-            return (Token(startChar, TokenType.SYMBOL),), reader.read(1)
 
-
-def _readText(startChar: bytes, reader: io.BytesIO) -> Tuple[Tuple[Token, ...], bytes]:
+def _controlError(data: Union[bytes, memoryview], pos: int) -> ValueError:
     """
-    Attempts to read the next data as text.
+    Creates the exception for a control at :param pos: that could not be read.
     """
-    chars = [startChar]
-    # Text is actually the easiest to read, as we just read until end of
-    # stream or until a special character. However, a few characters are
-    # simply dropped during reading.
-    while (nextChar := reader.read(1)) != b'' and nextChar not in (b'{', b'}', b'\\'):
-        # Certain characters are simply dropped.
-        if nextChar not in (b'\r', b'\n'):
-            chars.append(nextChar)
-
-    # Now, we actually are reading the text as *individual tokens*, so we
-    # need to
-
-    return tuple(Token(x, TokenType.TEXT) for x in chars), nextChar
-
-
-def tokenizeRTF(data: bytes, validateStart: bool = True) -> List[Token]:
+    nextChar = bytes(data[pos + 1:pos + 2])
+    if nextChar == b'*':
+        if len(data) < pos + 3:
+            return ValueError('Unexpected end of data.')
+        if data[pos + 2:pos + 3] != b'\\':
+            return ValueError(f'Bad custom destination (expected a backslash, got {bytes(data[pos + 2:pos + 3])}).')
+        return ValueError(f'Expected alpha character for destination, got {bytes(data[pos + 3:pos + 4])}.')
+    # Anything else can only fail by running out of data.
+    return ValueError('Unexpected end of data.')
+
+
+def iterTokenizeRTF(data: Union[bytes, memoryview], validateStart: bool = True) -> Iterator[Tuple[Sequence[Token], int]]:
     """
-    Reads in the bytes and sets the tokens list to the contents after
-    tokenizing.
+    Tokenizes the data lazily, allowing tokenizing to stop early.
 
-    If tokenizing fails, the current tokens list will not be changed.
+    Yields tuples of the tokens that were read (usually one, but a run of text
+    or binary data produces more) and the offset in :param data: just after
+    them.
 
+    :param data: The RTF data. May be any bytes-like object, which is read
+        without being copied.
     :param validateStart: If ``False``, does not check the first few tags.
         Useful when tokenizing a snippet rather than a document.
 
     :raises TypeError: The data is not recognized as RTF.
     :raises ValueError: An issue with basic parsing occured.
     """
-    reader = io.BytesIO(data)
+    pos = 0
+    end = len(data)
     if validateStart:
         # This tokenizer *only* breaks things up. It does *not* care about
         # groups and stuff, as that is for a parser to deal with. All we do is
-        # track the current backslash state and token state. We also simply
         # check that the first token is "\rtf1" preceeded by a group start, and
         # that is it.
-        start = reader.read(6)
-        if start != b'{\\rtf1':
+        if bytes(data[:6]) != b'{\\rtf1':
             raise TypeError('Data does not start with "{\\rtf1".')
 
-        tokens = [
-            Token(b'{', TokenType.GROUP_START),
-            Token(b'\\rtf1', TokenType.CONTROL, b'rtf', 1),
-        ]
-        nextChar = reader.read(1)
-
+        pos = 6
         # If the next character is a space, ignore it.
-        if nextChar == b' ':
-            nextChar = reader.read(1)
-    else:
-        tokens = []
-        nextChar = reader.read(1)
-
-    # At every iteration, so long as there is more data, nextChar should be
-    # set. As such, use it to determine what kind of data to try to read,
-    # using the delimeter of that type of data to know what to do next.
-    while nextChar != b'':
-        # We should have exactly one character, the start of the next
-        # section. Use it to determine what to do.
-        if nextChar in (b'\r', b'\n'):
-            # Just read the next character and start the loop over.
-            nextChar = reader.read(1)
-            continue
-
-        if nextChar == b'\\':
-            newTokens, nextChar = _readControl(nextChar, reader)
-        elif nextChar == b'{':
-            # This will always be a group start, which has nothing left to
-            # read.
-            nextChar = reader.read(1)
-            newTokens = (Token(b'{', TokenType.GROUP_START),)
-        elif nextChar == b'}':
-            # This will always be a group end, which has nothing left to
-            # read.
-            nextChar = reader.read(1)
-            newTokens = (Token(b'}', TokenType.GROUP_END),)
+        if data[6:7] == b' ':
+            pos = 7
+        yield (_GROUP_START, _RTF1), pos
+
+    match = RTF_TOKEN.match
+    # Most documents use the same few control words over and over, so the
+    # tokens for them are only created once. The keys are the matched bytes.
+    cache: Dict[bytes, Tuple[Token]] = {}
+    while pos < end:
+        if (m := match(data, pos)) is None:
+            raise _controlError(data, pos)
+        kind = m.lastgroup
+        pos = m.end()
+
+        if kind == 'text':
+            yield tuple(map(_TEXT_TOKENS.__getitem__, m.group())), pos
+        elif kind == 'groupStart':
+            yield _GROUP_START_TUPLE, pos
+        elif kind == 'groupEnd':
+            yield _GROUP_END_TUPLE, pos
+        elif kind == 'newline':
+            # Line breaks are not part of the document.
+            pass
+        elif (cached := cache.get(matched := m.group())) is not None:
+            yield cached, pos
+        elif kind == 'control':
+            name = m.group('name')
+            param = m.group('param')
+            if param is not None:
+                param = int(param)
+            # The raw data does not include the delimiting space.
+            raw = bytes(data[m.start():m.end('param' if param is not None else 'name')])
+            if m.group('star'):
+                yield cache.setdefault(matched, (Token(raw, TokenType.IGNORABLE_DESTINATION, name, param),)), pos
+            elif name == b'bin':
+                # The parameter is the number of bytes of binary data directly
+                # after the control word.
+                size = param or 0
+                if size < 0:
+                    raise ValueError(f'Binary data cannot have a negative size (got {size}).')
+                binary = bytes(data[pos:pos + size])
+                if len(binary) != size:
+                    raise ValueError('Unexpected end of data.')
+                pos += size
+                yield (Token(raw, TokenType.CONTROL, name, param), Token(binary, TokenType.BINARY)), pos
+            elif name in RTF_DESTINATIONS:
+                yield cache.setdefault(matched, (Token(raw, TokenType.DESTINATION, name, param),)), pos
+            else:
+                yield cache.setdefault(matched, (Token(raw, TokenType.CONTROL, name, param),)), pos
+        elif kind == 'hex':
+            hexChars = m.group('hexValue')
+            try:
+                param = int(hexChars, 16)
+            except ValueError as e:
+                raise ValueError(f'Hex data was not hexidecimal (got {hexChars}).') from e
+            yield cache.setdefault(matched, (Token(matched, TokenType.SYMBOL, None, param),)), pos
         else:
-            # Otherwise, it's just text.
-            newTokens, nextChar = _readText(nextChar, reader)
+            yield cache.setdefault(matched, (Token(matched, TokenType.SYMBOL),)), pos
+
+
+def tokenizeRTF(data: Union[bytes, memoryview], validateStart: bool = True) -> List[Token]:
+    """
+    Reads in the bytes and sets the tokens list to the contents after
+    tokenizing.
 
-        tokens.extend(newTokens)
+    If tokenizing fails, the current tokens list will not be changed.
+
+    :param data: The RTF data. May be any bytes-like object, which is read
+        without being copied.
+    :param validateStart: If ``False``, does not check the first few tags.
+        Useful when tokenizing a snippet rather than a document.
+
+    :raises TypeError: The data is not recognized as RTF.
+    :raises ValueError: An issue with basic parsing occured.
+    """
+    tokens = []
+    extend = tokens.extend
+    for newTokens, _ in iterTokenizeRTF(data, validateStart):
+        extend(newTokens)
 
     return tokens
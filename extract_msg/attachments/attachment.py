@@ -13,7 +13,7 @@ import random
 import string
 import zipfile
 
-from typing import TYPE_CHECKING
+from typing import Iterator, Optional, Type, TYPE_CHECKING
 
 from .. import constants
 from .attachment_base import AttachmentBase
@@ -37,7 +37,9 @@ class Attachment(AttachmentBase):
 
     def __init__(self, msg: MSGFile, dir_: str, propStore: PropertiesStore):
         super().__init__(msg, dir_, propStore)
-        self.__data = self.getStream('__substg1.0_37010102')
+        # The data is only read when it is actually needed.
+        self.__data = None
+        self.__dataLoaded = False
 
     def getFilename(self, **kwargs) -> str:
         """
@@ -72,6 +74,29 @@ class Attachment(AttachmentBase):
 
         return filename
 
+    def iterData(self, chunkSize: int = 1048576) -> Iterator[bytes]:
+        """
+        Iterates over the attachment data in chunks.
+
+        If the data has already been loaded, it is given as a single chunk.
+        Otherwise it is read from the MSG file a chunk at a time.
+        """
+        if self.__dataLoaded:
+            if self.__data is not None:
+                yield self.__data
+        elif (chunks := self.iterStream('__substg1.0_37010102', chunkSize)):
+            yield from chunks
+
+    def releaseData(self) -> None:
+        """
+        Releases the loaded attachment data, if any, to free up memory.
+
+        The data will be read from the MSG file again the next time it is
+        needed.
+        """
+        self.__data = None
+        self.__dataLoaded = False
+
     def regenerateRandomName(self) -> str:
         """
         Used to regenerate the random filename used if the attachment cannot
@@ -111,6 +136,8 @@ class Attachment(AttachmentBase):
             it's save function.
         :param skipEmbedded: If ``True``, skips saving this attachment if it is
             an embedded MSG file.
+        :param releaseData: If ``True``, releases the attachment data after
+            saving it so it does not stay in memory. (Default: ``False``)
         """
         # Get the filename to use.
         filename = self.getFilename(**kwargs)
@@ -155,8 +182,23 @@ class Attachment(AttachmentBase):
 
             fullFilename = self._handleFnc(_zip, filename, customPath, kwargs)
 
-            with _open(str(fullFilename), mode) as f:
-                f.write(self.__data)
+            if self.__dataLoaded:
+                with _open(str(fullFilename), mode) as f:
+                    f.write(self.__data)
+            else:
+                # Copy the stream in chunks instead of loading the whole thing.
+                openKwargs = {}
+                if _zip:
+                    # The zip file needs to know ahead of time if it needs to
+                    # use ZIP64, as it can't know the size of what we write.
+                    size = self.getStreamSize('__substg1.0_37010102')
+                    openKwargs['force_zip64'] = size * 1.05 > zipfile.ZIP64_LIMIT
+                with _open(str(fullFilename), mode, **openKwargs) as f:
+                    for chunk in self.iterStream('__substg1.0_37010102'):
+                        f.write(chunk)
+
+            if kwargs.get('releaseData', False):
+                self.releaseData()
 
             return (SaveType.FILE, str(fullFilename))
 
@@ -169,9 +211,32 @@ class Attachment(AttachmentBase):
     def data(self) -> bytes:
         """
         The bytes making up the attachment data.
+
+        The data is not read from the MSG file until this is first accessed.
         """
+        if not self.__dataLoaded:
+            self.__data = self.getStream('__substg1.0_37010102')
+            self.__dataLoaded = True
         return self.__data
 
+    @property
+    def dataLoaded(self) -> bool:
+        """
+        Whether the attachment data has been read from the MSG file.
+        """
+        return self.__dataLoaded
+
+    @property
+    def dataType(self) -> Optional[Type[object]]:
+        """
+        The class that the data type will use, if it can be retrieved.
+
+        Unlike :attr:`data`, this does not require the data to be read.
+        """
+        if self.__dataLoaded:
+            return None if self.__data is None else self.__data.__class__
+        return bytes if self.exists('__substg1.0_37010102') else None
+
     @property
     def randomFilename(self) -> str:
         """
@@ -16,7 +16,8 @@ import weakref
 
 from functools import cached_property
 from typing import (
-        Any, List, Optional, Tuple, Type, TYPE_CHECKING, TypeVar, Union
+        Any, Iterator, List, Optional, Tuple, Type, TYPE_CHECKING, TypeVar,
+        Union
     )
 
 from ..constants import MSG_PATH, OVERRIDE_CLASS, SAVE_TYPE
@@ -428,6 +429,32 @@ class AttachmentBase(abc.ABC):
 
         return value
 
+    def getStreamSize(self, filename: MSG_PATH) -> Optional[int]:
+        """
+        Gets the size of the requested stream without reading it.
+
+        Returns ``None`` if the stream could not be found.
+
+        :raises ReferenceError: The associated ``MSGFile`` instance has been
+            garbage collected.
+        """
+        if (msg := self.__msg()) is None:
+            raise ReferenceError('The MSGFile for this Attachment instance has been garbage collected.')
+        return msg.getStreamSize([self.__dir, msgPathToString(filename)])
+
+    def iterStream(self, filename: MSG_PATH, chunkSize: int = 1048576) -> Optional[Iterator[bytes]]:
+        """
+        Gets an iterator that reads the requested stream in chunks.
+
+        Returns ``None`` if the stream could not be found.
+
+        :raises ReferenceError: The associated ``MSGFile`` instance has been
+            garbage collected.
+        """
+        if (msg := self.__msg()) is None:
+            raise ReferenceError('The MSGFile for this Attachment instance has been garbage collected.')
+        return msg.iterStream([self.__dir, msgPathToString(filename)], chunkSize = chunkSize)
+
     def listDir(self, streams: bool = True, storages: bool = False) -> List[List[str]]:
         """
         Lists the streams and/or storages that exist in the attachment
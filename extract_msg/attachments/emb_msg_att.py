@@ -6,6 +6,7 @@ __all__ = [
 ]
 
 
+import logging
 import os
 import pathlib
 import zipfile
@@ -14,7 +15,11 @@ from typing import TYPE_CHECKING
 
 from .. import constants
 from .attachment_base import AttachmentBase
-from ..enums import AttachmentType, SaveType
+from ..enums import AttachmentType, ErrorBehavior, SaveType
+from ..exceptions import (
+        EmbeddedLimitError, EmbeddedMsgError, FeatureNotImplemented,
+        StandardViolationError, UnrecognizedMSGTypeError
+    )
 from ..open_msg import openMsg
 from ..utils import createZipOpen, prepareFilename
 
@@ -23,6 +28,8 @@ if TYPE_CHECKING:
     from ..msg_classes import MSGFile
     from ..properties import PropertiesStore
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 _saveDoc = AttachmentBase.save.__doc__
 
@@ -35,7 +42,24 @@ class EmbeddedMsgAttachment(AttachmentBase):
     def __init__(self, msg: MSGFile, dir_: str, propStore: PropertiesStore):
         super().__init__(msg, dir_, propStore)
         self.__prefix = msg.prefixList + [dir_, '__substg1.0_3701000D']
-        self.__data = openMsg(self.msg.path, prefix = self.__prefix, parentMsg = self.msg, treePath = self.treePath, **self.msg.kwargs)
+        # The embedded MSG file is only opened when it is needed.
+        self.__data = None
+        # The exception from opening the embedded MSG file, if it failed and
+        # the error behavior allowed that.
+        self.__error = None
+
+    def __errorAllowed(self, error: Exception) -> bool:
+        """
+        Checks if the error behavior of the MSG file allows the exception from
+        opening the embedded MSG file to be ignored, using the same rules as
+        :func:`initStandardAttachment`.
+        """
+        errorBehavior = self.msg.errorBehavior
+        if isinstance(error, (FeatureNotImplemented, NotImplementedError, UnrecognizedMSGTypeError)):
+            return ErrorBehavior.ATTACH_NOT_IMPLEMENTED in errorBehavior
+        if isinstance(error, StandardViolationError):
+            return ErrorBehavior.STANDARDS_VIOLATION in errorBehavior
+        return ErrorBehavior.ATTACH_BROKEN in errorBehavior
 
     def getFilename(self, **kwargs) -> str:
         """
@@ -64,6 +88,18 @@ class EmbeddedMsgAttachment(AttachmentBase):
         if kwargs.get('skipEmbedded'):
             return (SaveType.NONE, None)
 
+        # Make sure we are allowed to open the embedded MSG file.
+        try:
+            self.data
+        except EmbeddedLimitError as e:
+            logger.warning(f'Skipping embedded MSG file {self.dir}: {e}')
+            return (SaveType.NONE, None)
+        except EmbeddedMsgError:
+            # Handle it the same way as a broken attachment.
+            if kwargs.get('skipNotImplemented', False):
+                return (SaveType.NONE, None)
+            raise NotImplementedError('Broken attachments cannot be saved.')
+
         # We only need to handle things if we are saving as bytes.
         if kwargs.get('extractEmbedded', False):
             # Get the filename to use.
@@ -126,9 +162,49 @@ class EmbeddedMsgAttachment(AttachmentBase):
     def data(self) -> MSGFile:
         """
         Returns the attachment data.
+
+        The embedded MSG file is opened the first time this is accessed.
+
+        :raises EmbeddedLimitError: Opening the embedded MSG file would exceed
+            the ``maxEmbeddedDepth`` or ``maxEmbeddedMsgs`` options.
+        :raises EmbeddedMsgError: Opening the embedded MSG file failed, and the
+            error behavior of the MSG file allows that error to be ignored.
+            The error is logged the first time, and :meth:`save` handles the
+            attachment like a :class:`BrokenAttachment`.
         """
+        if self.__data is None:
+            if self.__error is not None:
+                raise EmbeddedMsgError(f'Embedded MSG file {self.dir} could not be opened.') from self.__error
+            msg = self.msg
+            kwargs = msg.kwargs
+            # The top level MSG file tracks how many have been opened.
+            root = self.treePath[0]() or msg
+
+            maxDepth = kwargs.get('maxEmbeddedDepth')
+            if maxDepth is not None and len(self.__prefix) // 2 > maxDepth:
+                raise EmbeddedLimitError(f'Opening the embedded MSG file would exceed the maximum depth of {maxDepth}.')
+            maxMsgs = kwargs.get('maxEmbeddedMsgs')
+            if maxMsgs is not None and root.embeddedMsgCount >= maxMsgs:
+                raise EmbeddedLimitError(f'Opening the embedded MSG file would exceed the maximum of {maxMsgs} embedded MSG files.')
+
+            try:
+                self.__data = openMsg(msg.path, prefix = self.__prefix, parentMsg = msg, treePath = self.treePath, **kwargs)
+            except Exception as e:
+                if not self.__errorAllowed(e):
+                    raise
+                logger.exception(f'Error opening embedded MSG file at {self.dir}')
+                self.__error = e
+                raise EmbeddedMsgError(f'Embedded MSG file {self.dir} could not be opened.') from e
+            root._addEmbeddedMsg()
         return self.__data
 
+    @property
+    def dataLoaded(self) -> bool:
+        """
+        Whether the embedded MSG file has been opened.
+        """
+        return self.__data is not None
+
     @property
     def type(self) -> AttachmentType:
         return AttachmentType.MSG
\ No newline at end of file
@@ -37,6 +37,7 @@ __all__ = [
     'PYTPFLOATINGTIME_START',
     'REFUSED_CLASS_TYPES',
     'REPOSITORY_URL',
+    'RTF_DESTINATIONS',
     'SAVE_TYPE',
     'VARIABLE_LENGTH_PROPS',
     'VARIABLE_LENGTH_PROPS_STRING',
@@ -253,6 +254,48 @@ MAINDOC: Final[str] = f"""extract_msg:
 
 {REPOSITORY_URL}"""
 
+# RTF destinations that are known to the tokenizer. Ignorable destinations are
+# always recognized by the ``\*``, so they don't need to be listed here.
+RTF_DESTINATIONS: Final[Tuple[bytes, ...]] = (
+    b'aftncn',
+    b'aftnsep',
+    b'aftnsepc',
+    b'annotation',
+    b'author',
+    b'buptim',
+    b'category',
+    b'colortbl',
+    b'comment',
+    b'company',
+    b'creatim',
+    b'doccomm',
+    b'dptxbxtext',
+    b'factoidname',
+    b'fonttbl',
+    b'footer',
+    b'footerf',
+    b'footerl',
+    b'footerr',
+    b'ftncn',
+    b'ftnsep',
+    b'ftnsepc',
+    b'header',
+    b'headerf',
+    b'headerl',
+    b'headerr',
+    b'hlinkbase',
+    b'keywords',
+    b'manager',
+    b'operator',
+    b'pict',
+    b'printim',
+    b'private',
+    b'revtim',
+    b'stylesheet',
+    b'subject',
+    b'title',
+)
+
 # Default class ID for the root entry for OleWriter. This should be
 # referencing Outlook if I understand it correctly.
 DEFAULT_CLSID: Final[bytes] = b'\x0b\r\x02\x00\x00\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x00F'
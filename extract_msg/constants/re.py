@@ -5,13 +5,19 @@ Regular expression constants.
 
 __all__ = [
     'HTML_BODY_START',
+    'HTML_META_CHARSET',
     'HTML_SAN_SPACE',
+    'HTML_STRIP_BREAK',
+    'HTML_STRIP_HIDDEN',
+    'HTML_STRIP_LINES',
+    'HTML_STRIP_TAG',
     'INVALID_FILENAME_CHARS',
     'INVALID_OLE_PATH',
     'RTF_BODY_STRIP_INIT',
     'RTF_BODY_STRIP_PRE_CLOSE',
     'RTF_BODY_STRIP_PRE_OPEN',
     'RTF_ENC_BODY_START',
+    'RTF_TOKEN',
 ]
 
 
@@ -36,9 +42,36 @@ INVALID_FILENAME_CHARS: Final[_RE_STR_TYPE] = re.compile(r'[\\/:*?"<>|]')
 HTML_SAN_SPACE: Final[_RE_STR_TYPE] = re.compile('  +')
 # Regular expression to find the start of the html body.
 HTML_BODY_START: Final[_RE_BYTES_TYPE] = re.compile(b'<body[^>]*>')
+# Used by stripHtml. Finds the charset declared by a meta tag.
+HTML_META_CHARSET: Final[_RE_BYTES_TYPE] = re.compile(rb'<meta[^<>]*charset\s*=\s*["\']?([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+# Used by stripHtml. Finds comments and elements whose content is never shown.
+# Ones that are never closed run to the end of the text, so that the search
+# from each opening doesn't look through the rest of the text again.
+HTML_STRIP_HIDDEN: Final[_RE_STR_TYPE] = re.compile(r'<!--.*?(?:-->|\Z)|<(head|script|style|title)\b[^>]*(?:>|\Z).*?(?:</\1\s*>|\Z)', re.IGNORECASE | re.DOTALL)
+# Used by stripHtml. Finds tags that start a new line. Tags stop at the next
+# "<", so that a "<" that is never closed doesn't make every search after it
+# look through the rest of the text.
+HTML_STRIP_BREAK: Final[_RE_STR_TYPE] = re.compile(r'<(?:br|/?(?:p|div|tr|li|h[1-6]|table|blockquote|pre))\b[^<>]*>', re.IGNORECASE)
+# Used by stripHtml. Finds any remaining tags.
+HTML_STRIP_TAG: Final[_RE_STR_TYPE] = re.compile(r'<[^<>]*>')
+# Used by stripHtml. Finds whitespace around the line breaks it added.
+HTML_STRIP_LINES: Final[_RE_STR_TYPE] = re.compile(r' *\n *')
 # Regular expression to find the start of the html body in encapsulated RTF.
 # This is used for one of the pattern types that makes life easy.
 RTF_ENC_BODY_START: Final[_RE_BYTES_TYPE] = re.compile(br'\{\\\*\\htmltag[0-9]* ?<body[^>]*>\}')
+# Used by the RTF tokenizer and text readers. Matches the token (or run of
+# text) at the current position. The name of the outermost group that matched
+# is the kind of token. Control words consume a single space after them, as it
+# is only a delimiter.
+RTF_TOKEN: Final[_RE_BYTES_TYPE] = re.compile(rb"""
+    (?P<text>[^\\{}\r\n]+)
+    |(?P<control>\\(?P<star>\*\\)?(?P<name>[a-zA-Z]+)(?P<param>-?[0-9]+)?\x20?)
+    |(?P<groupStart>\{)
+    |(?P<groupEnd>\})
+    |(?P<newline>[\r\n]+)
+    |(?P<hex>\\'(?P<hexValue>[\x00-\xFF]{2}))
+    |(?P<symbol>\\[^*'])
+""", re.VERBOSE)
 # Used in the vaildation of OLE paths. Any of these characters in a name make it
 # invalid.
 INVALID_OLE_PATH: Final[_RE_STR_TYPE] = re.compile(r'[:/\\!]')
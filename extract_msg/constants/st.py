@@ -30,6 +30,7 @@ __all__ = [
     'ST_NP_ENT',
     'ST_PEID',
     'ST_PROP_BASE',
+    'ST_PROP_ENTRY',
     'ST_PROP_VAR',
     'ST_PROPSTORE_HEADER',
     'ST_RGB',
@@ -67,6 +68,8 @@ ST_CF_DIR_ENTRY: Final[struct.Struct] = struct.Struct('<64sHBBIII16sIQQIQ')
 ST_NP_ENT: Final[struct.Struct] = struct.Struct('<IHH')
 # Structs used by prop.py
 ST_PROP_VAR: Final[struct.Struct] = struct.Struct('<2I')
+# Struct for unpacking an entire property entry as the tag, flags, and value.
+ST_PROP_ENTRY: Final[struct.Struct] = struct.Struct('<2IQ')
 # PermanentEntryID parsing struct
 ST_PEID: Final[struct.Struct] = struct.Struct('<B3x16s4xI')
 # Struct for unpacking the first part of the BusinessCardDisplayDefinition
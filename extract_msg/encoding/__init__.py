@@ -10,6 +10,7 @@ __all__ = [
 # This adds additional encodings to python.
 import ebcdic as _
 import codecs
+import importlib
 
 from ..exceptions import UnknownCodepageError, UnsupportedEncodingError
 
@@ -256,22 +257,25 @@ def lookupCodePage(id_: int) -> str:
         raise UnknownCodepageError(f'Unknown code page {id_}.')
 
 def _lookupEncoding(name):
-    return _codecsInfo.get(name)
+    # The decoding tables are only imported when a codec is first looked up,
+    # as some of them are large and most messages will never need them.
+    # Python caches the result, so each codec is only created once.
+    if (info := _CUSTOM_CODECS.get(name)) is not None:
+        codecName, create, tableModule = info
+        return create(codecName, importlib.import_module(f'._dt.{tableModule}', __name__).decodingTable)
 
 from .utils import createSBEncoding as _sb, createVBEncoding as _vb
-from ._dt import (
-        _mac_ce, _mac_cyrillic, _mac_greek, _mac_iceland, _mac_turkish,
-        _win874_dec, _win950_dec
-    )
 
-_codecsInfo = {
-    'x_mac_ce': _sb('x-mac-ce', _mac_ce.decodingTable),
-    'x_mac_cyrillic': _sb('x-mac-cyrillic', _mac_cyrillic.decodingTable),
-    'x_mac_greek': _sb('x-mac-greek', _mac_greek.decodingTable),
-    'x_mac_icelandic': _sb('x-mac-icelandic', _mac_iceland.decodingTable),
-    'x_mac_turkish': _sb('x-mac-turkish', _mac_turkish.decodingTable),
-    'windows_950': _vb('windows-950', _win950_dec.decodingTable),
-    'windows_874': _sb('windows-874', _win874_dec.decodingTable),
+# The name, function to create the codec, and decoding table module for each
+# custom codec, keyed by the normalized name.
+_CUSTOM_CODECS = {
+    'x_mac_ce': ('x-mac-ce', _sb, '_mac_ce'),
+    'x_mac_cyrillic': ('x-mac-cyrillic', _sb, '_mac_cyrillic'),
+    'x_mac_greek': ('x-mac-greek', _sb, '_mac_greek'),
+    'x_mac_icelandic': ('x-mac-icelandic', _sb, '_mac_iceland'),
+    'x_mac_turkish': ('x-mac-turkish', _sb, '_mac_turkish'),
+    'windows_950': ('windows-950', _vb, '_win950_dec'),
+    'windows_874': ('windows-874', _sb, '_win874_dec'),
 }
 
-codecs.register(_lookupEncoding)
\ No newline at end of file
+codecs.register(_lookupEncoding)
@@ -3,14 +3,81 @@ Internal utilities for extract_msg.encoding.
 """
 
 __all__ = [
+    'compileVBDecodingTable',
     'variableByteDecode',
     'variableByteEncode',
+    'VBDecodingTable',
 ]
 
 
 import codecs
+import re
 
-from typing import Dict, Tuple
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+# The character used in decoding tables for values that are not defined, which
+# is also what ``codecs.charmap_decode`` uses.
+_UNDEFINED = '\uFFFE'
+
+
+class VBDecodingTable(NamedTuple):
+    """
+    The tables used to decode a variable byte encoding, created by
+    :func:`compileVBDecodingTable`.
+    """
+    # The character for each single byte value.
+    singleBytes: str
+    # The character for each double byte value, indexed by the lead byte
+    # followed by the trail byte.
+    doubleBytes: str
+    # The values of the lead bytes.
+    leadBytes: frozenset
+    # Matches a run of bytes that decode to themselves.
+    identityRun: re.Pattern
+    # Matches a run of lead bytes that are each followed by a trail byte.
+    pairRun: re.Pattern
+
+
+def _byteClass(values) -> bytes:
+    """
+    Creates a regular expression character class matching the byte values.
+    """
+    return b'[' + b''.join(re.escape(bytes((x,))) for x in sorted(values)) + b']'
+
+
+def _createCharmap(decodingTable: Dict[int, Optional[str]], size: int) -> str:
+    """
+    Converts the decoding table into a string with the character for each
+    value, using U+FFFE for values that are not defined.
+    """
+    charmap = [_UNDEFINED] * size
+    for key, value in decodingTable.items():
+        if value is not None and key < size:
+            charmap[key] = value
+    return ''.join(charmap)
+
+
+def compileVBDecodingTable(decodingTable: Dict[int, Optional[str]]) -> VBDecodingTable:
+    """
+    Compiles the decoding table of a variable byte encoding into the form used
+    by :func:`variableByteDecode`.
+
+    :param decodingTable: The mapping of values to characters. Lead bytes MUST
+        be defined in the table, but SHOULD be set to None.
+    """
+    leadBytes = frozenset(key for key, value in decodingTable.items() if key < 256 and value is None)
+    trailBytes = frozenset(key & 0xFF for key in decodingTable if key > 0xFF)
+    singleBytes = _createCharmap(decodingTable, 256)
+    identity = [x for x in range(256) if singleBytes[x] == chr(x)]
+
+    return VBDecodingTable(
+        singleBytes,
+        _createCharmap(decodingTable, 0x10000),
+        leadBytes,
+        re.compile(_byteClass(identity) + b'+'),
+        re.compile(b'(?:' + _byteClass(leadBytes) + _byteClass(trailBytes) + b')+'),
+    )
 
 
 def createVBEncoding(codecName: str, decodingTable: Dict[int, str]) -> codecs.CodecInfo:
@@ -31,6 +98,7 @@ def createVBEncoding(codecName: str, decodingTable: Dict[int, str]) -> codecs.Co
         value: bytes((key,)) if key < 256 else bytes((key >> 8, key & 0xFF))
         for key, value in reversed(decodingTable.items()) if value is not None
     }
+    compiledTable = compileVBDecodingTable(decodingTable)
 
     # Create the classes.
     class Codec(codecs.Codec):
@@ -38,15 +106,15 @@ def createVBEncoding(codecName: str, decodingTable: Dict[int, str]) -> codecs.Co
             return variableByteEncode(codecName, text, errors, encodingTable)
 
         def decode(self, data, errors='strict'):
-            return variableByteDecode(codecName, data, errors, decodingTable)
+            return variableByteDecode(codecName, data, errors, compiledTable)
 
     class IncrementalEncoder(codecs.IncrementalEncoder):
         def encode(self, text, final=False):
             return variableByteEncode(codecName, text, self.errors, encodingTable)[0]
 
-    class IncrementalDecoder(codecs.IncrementalDecoder):
-        def decode(self, data, final=False):
-            return variableByteDecode(codecName, data, self.errors, decodingTable)[0]
+    class IncrementalDecoder(codecs.BufferedIncrementalDecoder):
+        def _buffer_decode(self, data, errors, final):
+            return variableByteDecode(codecName, data, errors, compiledTable, final)
 
     class StreamWriter(Codec, codecs.StreamWriter):
         pass
@@ -84,6 +152,9 @@ def createSBEncoding(codecName: str, decodingTable: Dict[int, str]) -> codecs.Co
         value: bytes((key,))
         for key, value in reversed(decodingTable.items()) if value is not None
     }
+    # Decoding is done by the built-in charmap codec, the same as the single
+    # byte codecs that come with Python.
+    decodingMap = _createCharmap(decodingTable, 256)
 
     # Create the classes.
     class Codec(codecs.Codec):
@@ -91,7 +162,7 @@ def createSBEncoding(codecName: str, decodingTable: Dict[int, str]) -> codecs.Co
             return singleByteEncode(codecName, text, errors, encodingTable)
 
         def decode(self, data, errors='strict'):
-            return singleByteDecode(codecName, data, errors, decodingTable)
+            return codecs.charmap_decode(data, errors, decodingMap)
 
     class IncrementalEncoder(codecs.IncrementalEncoder):
         def encode(self, text, final=False):
@@ -99,7 +170,7 @@ def createSBEncoding(codecName: str, decodingTable: Dict[int, str]) -> codecs.Co
 
     class IncrementalDecoder(codecs.IncrementalDecoder):
         def decode(self, data, final=False):
-            return singleByteDecode(codecName, data, self.errors, decodingTable)[0]
+            return codecs.charmap_decode(data, self.errors, decodingMap)[0]
 
     class StreamWriter(Codec, codecs.StreamWriter):
         pass
@@ -119,47 +190,6 @@ def createSBEncoding(codecName: str, decodingTable: Dict[int, str]) -> codecs.Co
     )
 
 
-def singleByteDecode(codecName: str, data, errors: str, decodeTable: Dict[int, str]) -> Tuple[str, int]:
-    """
-    Function for decoding single-byte codecs.
-
-    :param codecName: The name of the codec, used for error messages.
-    :param data: A bytes-like object to decode.
-    :param errors: The error behavior to use.
-    :param decodeTable: The mapping of values to use. Continuation bytes MUST be
-        defined in the table, but SHOULD be set to None. This allows for the
-        function to detect what bytes are valid for continuation.
-    """
-    if len(data) == 0:
-        return ('', 0)
-
-    errorHandler = codecs.lookup_error(errors)
-    output = ''
-
-    iterator = enumerate(data)
-    start = 0
-
-    for start, byte in iterator:
-        if byte in decodeTable:
-            output += decodeTable[byte]
-        else:
-            err = UnicodeDecodeError(codecName,
-                                     data,
-                                     start,
-                                     start + 1,
-                                     'character maps to <undefined>',
-                                     )
-            rep = errorHandler(err)
-            output += rep[0]
-            for _ in range(rep[1] - start - 1):
-                try:
-                    next(iterator)
-                except StopIteration:
-                    break
-
-    return (output, len(output))
-
-
 def singleByteEncode(codecName: str, data, errors: str, encodeTable: Dict[str, bytes]) -> Tuple[bytes, int]:
     """
     Function for encoding variable-byte codecs that use one or two bytes per
@@ -198,95 +228,68 @@ def singleByteEncode(codecName: str, data, errors: str, encodeTable: Dict[str, b
 
 
 
-def variableByteDecode(codecName: str, data, errors: str, decodeTable: Dict[int, str]) -> Tuple[str, int]:
+def variableByteDecode(codecName: str, data, errors: str, decodeTable: VBDecodingTable, final: bool = True) -> Tuple[str, int]:
     """
-    Function for decoding variable-byte codecs that use one or two bytes per character.
+    Function for decoding variable-byte codecs that use one or two bytes per
+    character, returning the text and the number of bytes consumed.
 
-    Checks if a character is less than ``0x80``, mapping it directly if so.
-    Otherwise, it reads the next byte and combines the two before looking up the
-    new value.
+    Runs of bytes that decode to themselves and runs of valid two byte
+    sequences are each decoded at once. Anything else is decoded a byte at a
+    time.
 
     :param codecName: The name of the codec, used for error messages.
     :param data: A bytes-like object to decode.
     :param errors: The error behavior to use.
-    :param decodeTable: The mapping of values to use. Continuation bytes MUST be
-        defined in the table, but SHOULD be set to None. This allows for the
-        function to detect what bytes are valid for continuation.
+    :param decodeTable: The tables to use, from :func:`compileVBDecodingTable`.
+    :param final: If ``False``, a lead byte at the end of the data is not
+        consumed, as the rest of the character may be in the next data.
     """
-    if len(data) == 0:
-        return ('', 0)
-
-    errorHandler = codecs.lookup_error(errors)
-    output = ''
-
-    iterator = enumerate(data)
-    start = 0
-
-    for start, byte in iterator:
-        # Variable byte should be an integer here.
-        if byte < 0x80:
-            if byte in decodeTable:
-                output += decodeTable[byte]
+    data = bytes(data)
+    end = len(data)
+    singleBytes, doubleBytes, leadBytes, identityRun, pairRun = decodeTable
+    output = []
+    pos = 0
+
+    def handleError(start: int, stop: int, reason: str) -> int:
+        err = UnicodeDecodeError(codecName, data, start, stop, reason)
+        rep, newPos = codecs.lookup_error(errors)(err)
+        output.append(rep)
+        return newPos + end if newPos < 0 else newPos
+
+    while pos < end:
+        if (match := identityRun.match(data, pos)):
+            output.append(match.group().decode('latin-1'))
+            pos = match.end()
+        elif (match := pairRun.match(data, pos)):
+            # Widen each pair of bytes into a big endian UTF-32 value, giving
+            # one character per pair to look up with the table. Unlike UTF-16,
+            # this never joins two pairs together as a surrogate pair.
+            run = match.group()
+            wide = bytearray(len(run) * 2)
+            wide[2::4] = run[0::2]
+            wide[3::4] = run[1::2]
+            text = wide.decode('utf-32-be', 'surrogatepass').translate(doubleBytes)
+            if (index := text.find(_UNDEFINED)) == -1:
+                output.append(text)
+                pos = match.end()
+            else:
+                output.append(text[:index])
+                pos = handleError(pos + index * 2, pos + index * 2 + 2, 'character maps to <undefined>')
+        elif data[pos] in leadBytes:
+            if pos + 1 < end:
+                # The next byte is not a valid trail byte.
+                pos = handleError(pos, pos + 1, 'illegal multibyte sequence')
+            elif final:
+                pos = handleError(pos, end, 'unexpected end of data')
             else:
-                err = UnicodeDecodeError(codecName,
-                                         data,
-                                         start,
-                                         start + 1,
-                                         'character maps to <undefined>',
-                                        )
-                rep = errorHandler(err)
-                output += rep[0]
-                # Skip the specified number of characters.
-                for _ in range(rep[1] - start - 1):
-                    try:
-                        next(iterator)
-                    except StopIteration:
-                        break
-        elif byte not in decodeTable:
-            err = UnicodeDecodeError(codecName,
-                                     data,
-                                     start,
-                                     start + 1,
-                                     'invalid start byte',
-                                    )
-            rep = errorHandler(err)
-            output += rep[0]
-            # Skip the specified number of characters.
-            for _ in range(rep[1] - start - 1):
-                try:
-                    next(iterator)
-                except StopIteration:
-                    break
-
-        else:
-            try:
-                byte = (byte << 8) | next(iterator)[1]
-                if byte in decodeTable:
-                    output += decodeTable[byte]
-                else:
-                    err = UnicodeDecodeError(codecName,
-                                             data,
-                                             start,
-                                             start + 2,
-                                             'character maps to <undefined>',
-                                             )
-                    rep = errorHandler(err)
-                    output += rep[0]
-                    # Skip the specified number of characters.
-                    for _ in range(rep[1] - start - 1):
-                        next(iterator)
-            except StopIteration:
-                err = UnicodeDecodeError(codecName,
-                                         data,
-                                         start,
-                                         start + 1,
-                                         'unexpected end of data',
-                                         )
-                rep = errorHandler(err)
-                output += rep[0]
                 break
-                # No more data, so that's all that needs to happen.
-    return (output, start)
+        elif (char := singleBytes[data[pos]]) != _UNDEFINED:
+            output.append(char)
+            pos += 1
+        else:
+            pos = handleError(pos, pos + 1, 'invalid start byte')
+
+    return (''.join(output), pos)
 
 
 def variableByteEncode(codecName: str, data, errors: str, encodeTable: Dict[str, bytes]) -> Tuple[bytes, int]:
@@ -13,6 +13,8 @@ __all__ = [
     'DataNotFoundError',
     'DeencapMalformedData',
     'DeencapNotEncapsulated',
+    'EmbeddedLimitError',
+    'EmbeddedMsgError',
     'ExecutableNotFound',
     'IncompatibleOptionsError',
     'InvalidFileFormatError',
@@ -72,6 +74,19 @@ class DependencyError(ExMsgBaseException):
     expected.
     """
 
+class EmbeddedLimitError(ExMsgBaseException):
+    """
+    Opening an embedded MSG file would exceed the limits set for how deeply
+    nested or how many embedded MSG files are allowed to be opened.
+    """
+
+class EmbeddedMsgError(ExMsgBaseException):
+    """
+    An embedded MSG file could not be opened, but the error behavior of the
+    MSG file it is in allowed the error to be ignored. The original exception
+    is the cause of this one.
+    """
+
 class ExecutableNotFound(DependencyError):
     """
     Could not find the specified executable.
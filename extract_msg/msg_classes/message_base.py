@@ -1,58 +1,70 @@
+from __future__ import annotations
+
+
 __all__ = [
     'MessageBase',
 ]
 
 
-import base64
 import datetime
 import email.message
 import email.utils
 import enum
 import functools
+import hashlib
 import html
+import io
 import json
 import logging
 import os
 import pathlib
 import re
-import subprocess
+import secrets
+import urllib.parse
 import zipfile
 
-import bs4
-import compressed_rtf
-import RTFDE
-import RTFDE.exceptions
-
 from email import policy
 from email.charset import Charset, QP
 from email.message import EmailMessage
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.parser import HeaderParser
-from typing import Any, Callable, cast, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+        Any, Callable, cast, Dict, List, Optional, Tuple, Type, TYPE_CHECKING,
+        Union
+    )
 
-from .. import constants
-from .._rtf.create_doc import createDocument
-from .._rtf.inject_rtf import injectStartRTF
+from .. import __version__, constants
+from .._rtf.deencapsulate import deencapsulateHtml
+from .._rtf.extract_text import extractText
+from .._rtf.inject_rtf import spliceStartRTF
+from ..attachments import Attachment, AttachmentBase
 from ..enums import (
         BodyTypes, DeencapType, ErrorBehavior, RecipientType, SaveType
     )
 from ..exceptions import (
         ConversionError, DataNotFoundError, DeencapMalformedData,
-        DeencapNotEncapsulated, IncompatibleOptionsError, MimetypeFailureError,
-        WKError
+        DeencapNotEncapsulated, IncompatibleOptionsError, MimetypeFailureError
     )
 from .msg import MSGFile
 from ..structures.report_tag import ReportTag
+from ..pdf_backend import PdfBackend, PdfBatch, WkHtmlToPdfBackend
 from ..recipient import Recipient
+from ..rtf_cache import RtfCache
 from ..utils import (
-        addNumToDir, addNumToZipDir, createZipOpen, decodeRfc2047, findWk,
-        htmlSanitize, inputToBytes, inputToString, isEncapsulatedRtf,
-        prepareFilename, rtfSanitizeHtml, rtfSanitizePlain, stripRtf,
-        validateHtml
+        addNumToDir, addNumToZipDir, createZipOpen, decodeRfc2047,
+        htmlSanitize, inputToString, isEncapsulatedRtf,
+        iterBase64, prepareFilename, rtfSanitizeHtml, rtfSanitizePlain,
+        stripHtml, stripRtf, validateHtml
     )
 
 
+# These are imported when first used, as most messages never need them and
+# they take a long time to import.
+if TYPE_CHECKING:
+    import bs4
+    import RTFDE
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
@@ -80,6 +92,16 @@ class MessageBase(MSGFile):
             from :mod:`extract_msg.exceptions`. All other exceptions must be
             handled internally or they will not be caught. The original
             deencapsulation method will not run if this is set.
+        :param htmlParser: Optional, the parser for BeautifulSoup to use when
+            preparing the HTML body, such as ``'lxml'`` if it is installed.
+            Faster parsers make a large difference for big HTML bodies, but
+            may repair broken HTML differently. (Default: ``'html.parser'``)
+        :param rtfCache: Optional, an instance of :class:`RtfCache` to store
+            the decompressed RTF body and the bodies deencapsulated from it.
+            The values are keyed by a digest of the compressed RTF stream, so
+            messages with the same RTF body share them. Bodies from the
+            deencapsulation override function are not cached. Embedded MSG
+            files use the same cache.
         """
         super().__init__(path, **kwargs)
         # The rest needs to be in a try-except block to ensure the file closes
@@ -88,6 +110,8 @@ class MessageBase(MSGFile):
             self.__headerInit = False
             self.__recipientSeparator: str = kwargs.get('recipientSeparator', ';')
             self.__deencap = kwargs.get('deencapsulationFunc')
+            self.__htmlParser: str = kwargs.get('htmlParser', 'html.parser')
+            self.__rtfCache: Optional[RtfCache] = kwargs.get('rtfCache')
             self.header
 
             # This variable keeps track of what the new line character should be.
@@ -105,6 +129,265 @@ class MessageBase(MSGFile):
                 pass
             raise
 
+    def __cachedRtfData(self, kind: str, func: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        """
+        Returns the data generated by :param func: from the RTF body, using the
+        RTF cache if there is one.
+
+        An empty value is stored for ``None``, so empty data is returned as
+        ``None``.
+
+        :param kind: The kind of data, which is part of the cache key.
+        """
+        if self.__rtfCache is None or not self.compressedRtf:
+            return func()
+
+        key = f'{self.__rtfDigest}-{kind}-{__version__}'
+        if (data := self.__rtfCache.get(key)) is not None:
+            return data or None
+
+        data = func()
+        self.__rtfCache.set(key, data or b'')
+        return data
+
+    def __deencapsulateHtml(self, rtfBody: bytes) -> Optional[bytes]:
+        """
+        Deencapsulates the HTML body using the built-in methods.
+        """
+        # Most encapsulated HTML can be handled without RTFDE, which is much
+        # faster. Anything that can't be is left for RTFDE to deal with.
+        try:
+            if (htmlBody := deencapsulateHtml(rtfBody)) is not None:
+                return htmlBody
+        except Exception:
+            logger.debug('Fast HTML deencapsulation failed, falling back to RTFDE.', exc_info = True)
+        if self.deencapsulatedRtf and self.deencapsulatedRtf.content_type == 'html':
+            return self.deencapsulatedRtf.html
+        return None
+
+    def __deencapsulatePlain(self, rtfBody: bytes) -> Optional[bytes]:
+        """
+        Deencapsulates the plain text body using the built-in methods.
+        """
+        if self.deencapsulatedRtf and self.deencapsulatedRtf.content_type == 'text':
+            return self.deencapsulatedRtf.text
+        return None
+
+    def __fixHtmlTree(self, soup: bs4.BeautifulSoup) -> bs4.Tag:
+        """
+        Adds the ``<html>`` and ``<body>`` tags to the parsed HTML if either is
+        missing, returning the body tag.
+        """
+        import bs4
+
+        htmlTag = soup.find('html')
+        bodyTag = soup.find('body')
+        if htmlTag and bodyTag:
+            return bodyTag
+
+        logger.warning('HTML body failed to validate. Code will attempt to correct it.')
+        if not bodyTag:
+            # Everything other than the head and footer goes in the body, which
+            # is placed before the footer if there is one.
+            parent = htmlTag or soup
+            bodyTag = soup.new_tag('body')
+            for node in tuple(parent.children):
+                if isinstance(node, bs4.Doctype) or (node.name and node.name.lower() in ('head', 'footer')):
+                    continue
+                bodyTag.append(node)
+            if (footer := parent.find('footer', recursive = False)):
+                footer.insert_before(bodyTag)
+            else:
+                parent.append(bodyTag)
+
+        if not htmlTag:
+            htmlTag = soup.new_tag('html')
+            for node in tuple(soup.children):
+                if not isinstance(node, bs4.Doctype):
+                    htmlTag.append(node)
+            soup.append(htmlTag)
+
+        return bodyTag
+
+    def __getAttachmentLinks(self, path: pathlib.Path, attachments: List[AttachmentBase], saveReturns: List[constants.SAVE_TYPE]) -> Dict[str, str]:
+        """
+        Gets the relative URLs of the saved files for the attachments that have
+        a content ID, keyed by the content ID.
+
+        :param path: The folder the body is being saved to.
+        :param attachments: The attachments that were saved.
+        :param saveReturns: The return value of saving each attachment.
+        """
+        links = {}
+        for att, (saveType, location) in zip(attachments, saveReturns):
+            # Only attachments saved to a single file can be linked.
+            if saveType != SaveType.FILE or self.attachmentsByCid.get(getattr(att, 'cid', None)) is not att:
+                continue
+            # Paths in zip files are always relative to the zip, so this works
+            # the same for both.
+            relative = pathlib.PurePath(location).relative_to(path)
+            links[att.cid] = urllib.parse.quote(relative.as_posix())
+
+        return links
+
+    def __inlineImages(self, soup: bs4.BeautifulSoup, links: Optional[Dict[str, str]] = None) -> List[Tuple[str, AttachmentBase]]:
+        """
+        Replaces the source of each image that refers to an attachment by its
+        content ID with a placeholder for the data of that attachment, or with
+        the URL for that content ID in :param links: if it has one.
+
+        Returns a list of the mimetype and attachment for each placeholder,
+        which is the index in the list after :attr:`__imageMarker`. The data
+        itself is only written when the HTML is serialized by
+        :meth:`__writeHtml`, so it never has to be stored in the tree.
+
+        :raises MimetypeFailureError: The mimetype of an attachment could not be
+            determined.
+        """
+        images = []
+        # Get a list of image tags to see if we can inject into. If the source
+        # of an image starts with "cid:" that means it is one of the attachments
+        # and is using the content id of that attachment.
+        tags = (tag for tag in soup.find_all('img') if tag.get('src') and tag.get('src').startswith('cid:'))
+
+        for tag in tags:
+            cid = tag['src'][4:]
+            if links and cid in links:
+                tag['src'] = links[cid]
+                continue
+            att = self.attachmentsByCid.get(cid)
+            # If we found anything, inject it.
+            if att and att.dataType is bytes:
+                # Try to get the mimetype. If we can't, see if the item has an
+                # extension and guess the mimtype for a few known ones.
+                mime = att.mimetype
+                if not mime:
+                    ext = (att.name or '').split('.')[-1].lower()
+                    if ext == 'png':
+                        mime = 'image/png'
+                    elif ext == 'jpg' or ext == 'jpeg':
+                        mime = 'image/jpeg'
+                    elif ext == 'gif':
+                        mime = 'image/gif'
+                    elif ext == 'tiff' or ext == 'tif':
+                        mime = 'image/tif'
+                    elif ext == 'bmp':
+                        mime = 'image/bmp'
+                    elif ext == 'svg':
+                        mime = 'image/svg+xml'
+                # Final check.
+                if mime:
+                    tag['src'] = f'{self.__imageMarker}{len(images)}'
+                    images.append((mime, att))
+                else:
+                    # We don't know what to actually put for this item, and we
+                    # really should never end up here, so throw an error.
+                    raise MimetypeFailureError('Could not get the mimetype to use for htmlBodyPrepared.')
+
+        return images
+
+    def __parseHtml(self, body: bytes) -> bs4.BeautifulSoup:
+        """
+        Parses the HTML with the parser chosen for this message.
+        """
+        import bs4
+
+        soup = bs4.BeautifulSoup(body, features = self.__htmlParser, from_encoding = self._htmlEncoding)
+        self._getHtmlEncoding(soup)
+        return soup
+
+    def __writePreparedHtml(self, f, charset: Optional[str], links: Optional[Dict[str, str]] = None) -> None:
+        """
+        Writes the prepared HTML body with the header injected into it.
+
+        This does the work of :attr:`htmlBodyPrepared`, :meth:`injectHtmlHeader`,
+        and adding the Content-Type meta tag with the HTML only being parsed
+        and serialized once, which is most of the time taken for large bodies.
+        """
+        import bs4
+
+        soup = self.__parseHtml(self.htmlBody)
+        images = self.__inlineImages(soup, links)
+        bodyTag = self.__fixHtmlTree(soup)
+
+        if not charset:
+            # Without a charset to declare, nothing in the head changes, and the
+            # header is added to the serialized HTML as it is. Putting it in the
+            # tree would turn its entities into characters that can't be read
+            # without knowing the encoding.
+            self.__writeHtml(f, soup, images, self.htmlInjectableHeader.encode('utf-8'))
+            return
+
+        # The header is generated by us, so the built-in parser is always fine
+        # for it. Other parsers would wrap it in tags of their own.
+        header = bs4.BeautifulSoup(self.htmlInjectableHeader, features = 'html.parser')
+        for node in reversed(tuple(header.contents)):
+            bodyTag.insert(0, node)
+
+        if not soup.find('meta', {'http-equiv': 'Content-Type'}):
+            # Setup the attributes for the tag.
+            tagAttrs = {
+                'http-equiv': 'Content-Type',
+                'content': f'text/html; charset={charset}',
+            }
+            # Create the tag.
+            tag = bs4.Tag(parser = soup, name = 'meta', attrs = tagAttrs, can_be_empty_element = True)
+            # Add the tag to the head section, adding the head if it doesn't
+            # exist.
+            if (head := soup.find('head')):
+                head.insert(0, tag)
+            else:
+                head = bs4.Tag(parser = soup, name = 'head')
+                head.insert(0, tag)
+                soup.find('html').insert(0, head)
+
+        self.__writeHtml(f, soup, images)
+
+    def __writeHtml(self, f, soup: bs4.BeautifulSoup, images: List[Tuple[str, AttachmentBase]], header: Optional[bytes] = None) -> None:
+        """
+        Writes the serialized HTML to the file, replacing the placeholders from
+        :meth:`__inlineImages` with data URIs.
+
+        The data of each image is base64 encoded a chunk at a time as it is
+        written instead of being built as a string first.
+
+        :param header: If given, is inserted just after the start of the body
+            tag in the serialized HTML, the same way as :meth:`injectHtmlHeader`.
+        """
+        data = soup.encode('utf-8')
+        if header and (bodyMarker := constants.re.HTML_BODY_START.search(data)):
+            data = data[:bodyMarker.end()] + header + data[bodyMarker.end():]
+        if not images:
+            f.write(data)
+            return
+
+        position = 0
+        for match in re.finditer(re.escape(self.__imageMarker.encode()) + rb'(\d+)', data):
+            mime, att = images[int(match.group(1))]
+            f.write(data[position:match.start()])
+            f.write(b'data:' + mime.encode() + b';base64,')
+            chunks = att.iterData() if isinstance(att, Attachment) else (att.data,)
+            for chunk in iterBase64(chunks):
+                f.write(chunk)
+            position = match.end()
+
+        f.write(data[position:])
+
+    @functools.cached_property
+    def __imageMarker(self) -> str:
+        """
+        The text used as the source of images while the data URI for them is
+        waiting to be written.
+        """
+        return f'extract-msg-image-{secrets.token_hex(8)}-'
+
+    @functools.cached_property
+    def __rtfDigest(self) -> str:
+        """
+        The digest of the compressed RTF stream, used for the RTF cache keys.
+        """
+        return hashlib.sha256(self.compressedRtf).hexdigest()
+
     def _genRecipient(self, recipientStr: str, recipientType: RecipientType) -> Optional[str]:
         """
         Method to generate the specified recipient field.
@@ -243,8 +526,13 @@ class MessageBase(MSGFile):
                     except DeencapNotEncapsulated:
                         logger.exception('Custom deencapsulation function reported data is not encapsulated.')
                 else:
-                    if self.deencapsulatedRtf and self.deencapsulatedRtf.content_type == 'text':
-                        return self.deencapsulatedRtf.text
+                    # The cache only applies to the RTF body of this message.
+                    if rtfBody == self.rtfBody:
+                        body = self.__cachedRtfData('plain', lambda: self.__deencapsulatePlain(rtfBody))
+                    else:
+                        body = self.__deencapsulatePlain(rtfBody)
+                    if body is not None:
+                        return body
             else:
                 if self.__deencap:
                     try:
@@ -254,8 +542,12 @@ class MessageBase(MSGFile):
                     except DeencapNotEncapsulated:
                         logger.exception('Custom deencapsulation function reported data is not encapsulated.')
                 else:
-                    if self.deencapsulatedRtf and self.deencapsulatedRtf.content_type == 'html':
-                        return self.deencapsulatedRtf.html
+                    if rtfBody == self.rtfBody:
+                        body = self.__cachedRtfData('html', lambda: self.__deencapsulateHtml(rtfBody))
+                    else:
+                        body = self.__deencapsulateHtml(rtfBody)
+                    if body is not None:
+                        return body
 
             if bodyType == DeencapType.PLAIN:
                 logger.info('Could not deencapsulate plain text from RTF body.')
@@ -276,6 +568,32 @@ class MessageBase(MSGFile):
         print('Body:')
         print(self.body)
 
+    def getIndexText(self, maxLength: Optional[int] = None) -> Optional[str]:
+        """
+        Returns an approximation of the text of the body, getting it from
+        whichever body is the cheapest to use.
+
+        This is meant for things like search indexing, where speed matters more
+        than getting the text exactly right. The plain text body is used if it
+        exists, followed by the HTML body with the tags stripped out, followed
+        by the text read directly from the RTF body. Unlike :attr:`body`, this
+        never uses RTFDE or BeautifulSoup.
+
+        Returns ``None`` if none of the bodies exist.
+
+        :param maxLength: If given, at most this many characters are returned,
+            and the RTF body is only read until that many have been found.
+        """
+        if (text := self.getStringStream('__substg1.0_1000')) is None:
+            if (htmlBody := self.getStream('__substg1.0_10130102')) is not None:
+                text = stripHtml(htmlBody, self._htmlEncoding or 'utf-8')
+            elif self.rtfBody:
+                return extractText(self.rtfBody, maxLength)
+
+        if text is not None and maxLength is not None:
+            text = text[:maxLength]
+        return text
+
     def getInjectableHeader(self, prefix: str, joinStr: str, suffix: str, formatter: Callable[[str, str], str]) -> str:
         """
         Using the specified prefix, suffix, formatter, and join string,
@@ -351,76 +669,32 @@ class MessageBase(MSGFile):
             'body': self.body,
         })
 
-    def getSaveBody(self, **_) -> bytes:
+    def getSaveBody(self, **kwargs) -> bytes:
         """
         Returns the plain text body that will be used in saving based on the
         arguments.
 
-        :param _: Used to allow kwargs expansion in the save function.
+        :param kwargs: Used to allow kwargs expansion in the save function.
             Arguments absorbed by this are simply ignored.
         """
-        # Get the type of line endings.
-        crlf = inputToString(self.crlf, 'utf-8')
-
-        prefix = ''
-        suffix = crlf + '-----------------' + crlf + crlf
-        joinStr = crlf
-        formatter = (lambda name, value: f'{name}: {value}')
-
-        header = self.getInjectableHeader(prefix, joinStr, suffix, formatter).encode('utf-8')
-        return header + inputToBytes(self.body, 'utf-8')
+        with io.BytesIO() as f:
+            self.writeSaveBody(f, **kwargs)
+            return f.getvalue()
 
-    def getSaveHtmlBody(self, preparedHtml: bool = False, charset: str = 'utf-8', **_) -> bytes:
+    def getSaveHtmlBody(self, **kwargs) -> bytes:
         """
         Returns the HTML body that will be used in saving based on the
         arguments.
 
-        :param preparedHtml: Whether or not the HTML should be prepared for
-            standalone use (add tags, inject images, etc.).
-        :param charset: If the html is being prepared, the charset to use for
-            the Content-Type meta tag to insert. This exists to ensure that
-            something parsing the html can properly determine the encoding (as
-            not having this tag can cause errors in some programs). Set this to
-            ``None`` or an empty string to not insert the tag. (Default:
-            'utf-8')
-        :param _: Used to allow kwargs expansion in the save function.
-            Arguments absorbed by this are simply ignored.
+        :param kwargs: Used to allow kwargs expansion in the save function.
+            Arguments absorbed by this are simply ignored, except for keyword
+            arguments used by :meth:`writeSaveHtmlBody`.
         """
-        if self.htmlBody:
-            # Inject the header into the data.
-            data = self.injectHtmlHeader(prepared = preparedHtml)
-
-            # If we are preparing the HTML, then we should
-            if preparedHtml and charset:
-                bs = bs4.BeautifulSoup(data, features = 'html.parser', from_encoding = self._htmlEncoding)
-                self._getHtmlEncoding(bs)
-                if not bs.find('meta', {'http-equiv': 'Content-Type'}):
-                    # Setup the attributes for the tag.
-                    tagAttrs = {
-                        'http-equiv': 'Content-Type',
-                        'content': f'text/html; charset={charset}',
-                    }
-                    # Create the tag.
-                    tag = bs4.Tag(parser = bs, name = 'meta', attrs = tagAttrs, can_be_empty_element = True)
-                    # Add the tag to the head section.
-                    if bs.find('head'):
-                        bs.find('head').insert(0, tag)
-                    else:
-                        # If we are here, the head doesn't exist, so let's add
-                        # it.
-                        if bs.find('html'):
-                            # This should always be true, but I want to be safe.
-                            head = bs4.Tag(parser = bs, name = 'head')
-                            head.insert(0, tag)
-                            bs.find('html').insert(0, head)
-
-                    data = bs.encode('utf-8')
-
-            return data
-        else:
-            return self.htmlBody or b''
+        with io.BytesIO() as f:
+            self.writeSaveHtmlBody(f, **kwargs)
+            return f.getvalue()
 
-    def getSavePdfBody(self, wkPath = None, wkOptions = None, **kwargs) -> bytes:
+    def getSavePdfBody(self, wkPath = None, wkOptions = None, pdfBackend: Optional[PdfBackend] = None, **kwargs) -> bytes:
         """
         Returns the PDF body that will be used in saving based on the arguments.
 
@@ -431,62 +705,32 @@ class MessageBase(MSGFile):
         :param wkOptions: Used to specify additional options to wkhtmltopdf.
             this must be a list or list-like object composed of strings and
             bytes.
+        :param pdfBackend: Optional, the :class:`PdfBackend` to convert the
+            HTML with. If specified, :param wkPath: and :param wkOptions: are
+            ignored.
         :param kwargs: Used to allow kwargs expansion in the save function.
-            Arguments absorbed by this are simply ignored, except for keyword arguments used by :meth:`getSaveHtmlBody`.
+            Arguments absorbed by this are simply ignored, except for keyword arguments used by :meth:`writeSaveHtmlBody`.
 
         :raises ExecutableNotFound: The wkhtmltopdf executable could not be
             found.
         :raises WKError: Something went wrong in creating the PDF body.
         """
-        # Immediately try to find the executable.
-        wkPath = findWk(wkPath)
-
-        # First thing is first, we need to parse our wkOptions if they exist.
-        if wkOptions:
-            try:
-                # Try to convert to a list, whatever it is, and fail if it is
-                # not possible.
-                parsedWkOptions = [*wkOptions]
-            except TypeError:
-                raise TypeError(f':param wkOptions: must be an iterable, not {type(wkOptions)}.')
-        else:
-            parsedWkOptions = []
+        # Create the backend first so that a missing executable or invalid
+        # options are found before doing anything else.
+        backend = pdfBackend or WkHtmlToPdfBackend(wkPath, wkOptions)
 
-        # Confirm that all of our options we now have are either strings or
-        # bytes.
-        if not all(isinstance(option, (str, bytes)) for option in parsedWkOptions):
-            raise TypeError(':param wkOptions: must be an iterable of strings and bytes.')
+        return backend.render(self.getSaveHtmlBody(**kwargs))
 
-        processArgs = [wkPath, *parsedWkOptions, '-', '-']
-        # Log the arguments.
-        logger.info(f'Converting to PDF with the following arguments: {processArgs}')
-
-        # Get the html body *before* calling Popen.
-        htmlBody = self.getSaveHtmlBody(**kwargs)
-
-        # We call the program to convert the html, but give tell it the data
-        # will go in and come out through stdin and stdout, respectively. This
-        # way we don't have to write temporary files to the disk. We also ask
-        # that it be quiet about it.
-        process = subprocess.run(processArgs, input = htmlBody, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
-        # Give the program the data and wait for the program to finish.
-        #output = process.communicate(htmlBody)
-
-        # If it errored, throw it as an exception.
-        if process.returncode != 0:
-            raise WKError(process.stderr.decode('utf-8'))
-
-        return process.stdout
-
-    def getSaveRtfBody(self, **_) -> bytes:
+    def getSaveRtfBody(self, **kwargs) -> bytes:
         """
         Returns the RTF body that will be used in saving based on the arguments.
 
         :param kwargs: Used to allow kwargs expansion in the save function.
             Arguments absorbed by this are simply ignored.
         """
-        # Inject the header into the data.
-        return self.injectRtfHeader()
+        with io.BytesIO() as f:
+            self.writeSaveRtfBody(f, **kwargs)
+            return f.getvalue()
 
     def injectHtmlHeader(self, prepared: bool = False) -> bytes:
         """
@@ -496,6 +740,16 @@ class MessageBase(MSGFile):
         :param prepared: Determines whether to be using the standard HTML
             (``False``) or the prepared HTML (``True``) body. (Default: ``False``)
 
+        :raises AttributeError: The correct HTML body cannot be acquired.
+        """
+        return b''.join(self.__htmlHeaderParts(prepared))
+
+    def __htmlHeaderParts(self, prepared: bool = False) -> Tuple[Union[bytes, memoryview], ...]:
+        """
+        Returns the parts of the HTML body with the HTML header injected into
+        it, for :meth:`injectHtmlHeader` to join or :meth:`writeSaveHtmlBody`
+        to write.
+
         :raises AttributeError: The correct HTML body cannot be acquired.
         """
         if not self.htmlBody:
@@ -516,6 +770,7 @@ class MessageBase(MSGFile):
         # Validate the HTML.
         if not validateHtml(body, self._htmlEncoding):
             logger.warning('HTML body failed to validate. Code will attempt to correct it.')
+            import bs4
 
             # If we are here, then we need to do what we can to fix the HTML
             # body. Unfortunately this gets complicated because of the various
@@ -586,27 +841,36 @@ class MessageBase(MSGFile):
                 # tags.
                 body = b'<html>' + body + b'</html>'
 
-        def replace(bodyMarker):
-            """
-            Internal function to replace the body tag with itself plus the
-            header.
-            """
-            # I recently had to change this and how it worked. Now we use a new
-            # property of `MSGFile` that returns a special tuple of tuples to define
-            # how to get all of the properties we are formatting. They are all
-            # processed in the same way, making everything neat. By defining them
-            # in each class, any class can specify a completely different set to be
-            # used.
-            return bodyMarker.group() + self.htmlInjectableHeader.encode('utf-8')
-
-        # Use the previously defined function to inject the HTML header.
-        return constants.re.HTML_BODY_START.sub(replace, body, 1)
+        # The header goes just after the start of the body tag. If there isn't
+        # one, the body is used as is.
+        if (bodyMarker := constants.re.HTML_BODY_START.search(body)) is None:
+            return (body,)
+
+        # I recently had to change this and how it worked. Now we use a new
+        # property of `MSGFile` that returns a special tuple of tuples to define
+        # how to get all of the properties we are formatting. They are all
+        # processed in the same way, making everything neat. By defining them
+        # in each class, any class can specify a completely different set to be
+        # used.
+        view = memoryview(body)
+        return (view[:bodyMarker.end()], self.htmlInjectableHeader.encode('utf-8'), view[bodyMarker.end():])
 
     def injectRtfHeader(self) -> bytes:
         """
         Returns the RTF body from this MSG file (will check that it has one)
         with the RTF header injected into it.
 
+        :raises AttributeError: The RTF body cannot be acquired.
+        :raises RuntimeError: All injection attempts failed.
+        """
+        return b''.join(self.__rtfHeaderParts())
+
+    def __rtfHeaderParts(self) -> Tuple[Union[bytes, memoryview], ...]:
+        """
+        Returns the parts of the RTF body with the RTF header injected into it,
+        for :meth:`injectRtfHeader` to join or :meth:`writeSaveRtfBody` to
+        write.
+
         :raises AttributeError: The RTF body cannot be acquired.
         :raises RuntimeError: All injection attempts failed.
         """
@@ -620,26 +884,21 @@ class MessageBase(MSGFile):
         else:
             injectableHeader = self.rtfPlainInjectableHeader
 
-        def replace(bodyMarker):
-            """
-            Internal function to replace the body tag with itself plus the
-            header.
-            """
-            return bodyMarker.group() + injectableHeader
-
         # This first method only applies to documents with encapsulated HTML
-        # that is formatted in a nice way.
+        # that is formatted in a nice way. The header goes just after the body
+        # tag.
         if isEncapsulatedRtf(self.rtfBody):
-            data = constants.re.RTF_ENC_BODY_START.sub(replace, self.rtfBody, 1)
-            if data != self.rtfBody:
+            if (bodyMarker := constants.re.RTF_ENC_BODY_START.search(self.rtfBody)):
                 logger.debug('Successfully injected RTF header using encapsulation method.')
-                return data
+                view = memoryview(self.rtfBody)
+                return (view[:bodyMarker.end()], injectableHeader, view[bodyMarker.end():])
             logger.debug('RTF has encapsulated HTML, but injection method failed. It is likely dirty. Will use normal RTF injection method.')
 
         # If the normal encapsulated HTML injection fails or it isn't
-        # encapsulated, use the internal _rtf module.
+        # encapsulated, use the internal _rtf module. This only has to tokenize
+        # the header of the document, so the rest is copied as is.
         logger.debug('Using _rtf module to inject RTF text header.')
-        return createDocument(injectStartRTF(self.rtfBody, injectableHeader))
+        return spliceStartRTF(self.rtfBody, injectableHeader)
 
     def save(self, **kwargs) -> constants.SAVE_TYPE:
         """
@@ -696,6 +955,8 @@ class MessageBase(MSGFile):
         :param skipAttachments: Turns off saving attachments.
         :param skipHidden: If ``True``, skips attachments marked as hidden.
             (Default: ``False``)
+        :param releaseData: If ``True``, attachments will release their data
+            after it has been saved. (Default: ``False``)
         :param skipBodyNotFound: Suppresses errors if no valid body could be
             found, simply skipping the step of saving the body.
         :param charset: If the HTML is being prepared, the charset to use for
@@ -717,6 +978,18 @@ class MessageBase(MSGFile):
         :param wkOptions: Used to specify additional options to wkhtmltopdf.
             this must be a list or list-like object composed of strings and
             bytes.
+        :param pdfBackend: Optional, the :class:`PdfBackend` to convert the
+            HTML to PDF with. Defaults to using wkhtmltopdf with the options
+            above.
+        :param pdfBatch: Optional, a :class:`PdfBatch` to add the body to
+            instead of converting it right away. The PDF file is only written
+            once :meth:`PdfBatch.flush` is called. Not compatible with
+            :param zip:.
+        :param linkAttachments: When saving prepared HTML, images that refer to
+            attachments will link to the saved attachment files instead of
+            having the data embedded in the HTML. Images referring to
+            attachments that were not saved are still embedded. Has no effect
+            on PDF output. (Default: ``False``)
         """
         # Move keyword arguments into variables.
         _json = kwargs.get('json', False)
@@ -724,6 +997,7 @@ class MessageBase(MSGFile):
         rtf = kwargs.get('rtf', False)
         raw = kwargs.get('raw', False)
         pdf = kwargs.get('pdf', False)
+        pdfBatch: Optional[PdfBatch] = kwargs.get('pdfBatch')
         allowFallback = kwargs.get('allowFallback', False)
         _zip = kwargs.get('zip')
         maxNameLength = kwargs.get('maxNameLength', 256)
@@ -741,6 +1015,7 @@ class MessageBase(MSGFile):
         # Track if we should skip the body if no valid body is found instead of
         # raising an exception.
         skipBodyNotFound = kwargs.get('skipBodyNotFound', False)
+        linkAttachments = kwargs.get('linkAttachments', False)
 
         if pdf:
             kwargs['preparedHtml'] = True
@@ -810,6 +1085,8 @@ class MessageBase(MSGFile):
                 # `raw` and `zip` are incompatible.
                 if raw:
                     raise IncompatibleOptionsError('The options `raw` and `zip` are incompatible.')
+                if pdf and pdfBatch is not None:
+                    raise IncompatibleOptionsError('The options `pdfBatch` and `zip` are incompatible.')
                 # If we are doing a zip file, first check that we have been
                 # given a path.
                 if isinstance(_zip, (str, pathlib.Path)):
@@ -908,7 +1185,8 @@ class MessageBase(MSGFile):
 
             if not skipAttachments:
                 # Save the attachments.
-                attachmentReturns = [attachment.save(**kwargs) for attachment in self.attachments if not (skipHidden and attachment.hidden)]
+                savedAttachments = [attachment for attachment in self.attachments if not (skipHidden and attachment.hidden)]
+                attachmentReturns = [attachment.save(**kwargs) for attachment in savedAttachments]
                 # Get the names from each.
                 attachmentNames = []
                 for x in attachmentReturns:
@@ -917,7 +1195,12 @@ class MessageBase(MSGFile):
                     elif isinstance(x[1], list):
                         attachmentNames.extend(x[1])
 
-            if not attachOnly and fext:
+                if not attachOnly and useHtml and linkAttachments and kwargs.get('preparedHtml'):
+                    kwargs['attachmentLinks'] = self.__getAttachmentLinks(path, savedAttachments, attachmentReturns)
+
+            if not attachOnly and fext == 'pdf' and pdfBatch is not None:
+                pdfBatch.add(self.getSaveHtmlBody(**kwargs), path / 'message.pdf')
+            elif not attachOnly and fext:
                 with _open(str(path / ('message.' + fext)), mode) as f:
                     if _json:
                         emailObj = json.loads(self.getJson())
@@ -926,13 +1209,13 @@ class MessageBase(MSGFile):
 
                         f.write(json.dumps(emailObj).encode('utf-8'))
                     elif useHtml:
-                        f.write(self.getSaveHtmlBody(**kwargs))
+                        self.writeSaveHtmlBody(f, **kwargs)
                     elif usePdf:
                         f.write(self.getSavePdfBody(**kwargs))
                     elif useRtf:
-                        f.write(self.getSaveRtfBody(**kwargs))
+                        self.writeSaveRtfBody(f, **kwargs)
                     else:
-                        f.write(self.getSaveBody(**kwargs))
+                        self.writeSaveBody(f, **kwargs)
 
             return (SaveType.FOLDER, str(path))
         finally:
@@ -940,6 +1223,87 @@ class MessageBase(MSGFile):
             if _zip and createdZip:
                 _zip.close()
 
+    def writeSaveBody(self, f, **_) -> None:
+        """
+        Writes the plain text body that will be used in saving based on the
+        arguments to the file, a piece at a time.
+
+        :param f: The file-like object to write to.
+        :param _: Used to allow kwargs expansion in the save function.
+            Arguments absorbed by this are simply ignored.
+        """
+        # Get the type of line endings.
+        crlf = inputToString(self.crlf, 'utf-8')
+
+        prefix = ''
+        suffix = crlf + '-----------------' + crlf + crlf
+        joinStr = crlf
+        formatter = (lambda name, value: f'{name}: {value}')
+
+        f.write(self.getInjectableHeader(prefix, joinStr, suffix, formatter).encode('utf-8'))
+        # Encode the body in pieces so that it never has to be in memory twice.
+        if (body := self.body):
+            for start in range(0, len(body), 1048576):
+                f.write(body[start:start + 1048576].encode('utf-8'))
+
+    def writeSaveHtmlBody(self, f, preparedHtml: bool = False, charset: str = 'utf-8', attachmentLinks: Optional[Dict[str, str]] = None, **_) -> None:
+        """
+        Writes the HTML body that will be used in saving based on the arguments
+        to the file, a piece at a time.
+
+        :param f: The file-like object to write to.
+        :param preparedHtml: Whether or not the HTML should be prepared for
+            standalone use (add tags, inject images, etc.).
+        :param charset: If the html is being prepared, the charset to use for
+            the Content-Type meta tag to insert. This exists to ensure that
+            something parsing the html can properly determine the encoding (as
+            not having this tag can cause errors in some programs). Set this to
+            ``None`` or an empty string to not insert the tag. (Default:
+            'utf-8')
+        :param attachmentLinks: Optional, a dict of content IDs to the URL to
+            use for images that refer to them. If the HTML is being prepared,
+            these images will link to the URL instead of having the data of the
+            attachment embedded. :meth:`save` creates this when
+            :param linkAttachments: is set.
+        :param _: Used to allow kwargs expansion in the save function.
+            Arguments absorbed by this are simply ignored.
+        """
+        if self.htmlBody:
+            # Preparing the HTML parses it, so everything else that needs to
+            # change is done to the same tree.
+            if preparedHtml:
+                self.__writePreparedHtml(f, charset, attachmentLinks)
+            else:
+                # Inject the header into the data.
+                for part in self.__htmlHeaderParts():
+                    f.write(part)
+
+    def writeSaveRtfBody(self, f, **_) -> None:
+        """
+        Writes the RTF body that will be used in saving based on the arguments
+        to the file, a piece at a time.
+
+        :param f: The file-like object to write to.
+        :param _: Used to allow kwargs expansion in the save function.
+            Arguments absorbed by this are simply ignored.
+        """
+        # Inject the header into the data.
+        for part in self.__rtfHeaderParts():
+            f.write(part)
+
+    @functools.cached_property
+    def attachmentsByCid(self) -> Dict[str, AttachmentBase]:
+        """
+        A dict of the attachments that have a content ID, keyed by it.
+
+        If several attachments share a content ID, the first one is used.
+        """
+        index = {}
+        for att in self.attachments:
+            if (cid := getattr(att, 'cid', None)):
+                index.setdefault(cid, att)
+        return index
+
     @functools.cached_property
     def bcc(self) -> Optional[str]:
         """
@@ -1004,14 +1368,16 @@ class MessageBase(MSGFile):
         If there is no RTF body or the body is not encasulated, returns
         ``None``.
         """
+        import RTFDE
+        import RTFDE.exceptions
+
         if self.rtfBody:
             # If there is an RTF body, we try to deencapsulate it.
             body = self.rtfBody
             # Sometimes you get MSG files whose RTF body has stuff
             # *after* the body, and RTFDE can't handle that. Here is
             # how we compensate.
-            while body and body[-1] != 125:
-                body = body[:-1]
+            body = body[:body.rfind(b'}') + 1]
 
             # Some files take a long time due to how they are structured and
             # how RTFDE works. The longer a file would normally take, the
@@ -1204,47 +1570,10 @@ class MessageBase(MSGFile):
         if not self.htmlBody:
             return self.htmlBody
 
-        # Create the BeautifulSoup instance to use.
-        soup = bs4.BeautifulSoup(self.htmlBody, 'html.parser', from_encoding = self._htmlEncoding)
-        self._getHtmlEncoding(soup)
-
-        # Get a list of image tags to see if we can inject into. If the source
-        # of an image starts with "cid:" that means it is one of the attachments
-        # and is using the content id of that attachment.
-        tags = (tag for tag in soup.findAll('img') if tag.get('src') and tag.get('src').startswith('cid:'))
-
-        for tag in tags:
-            # Iterate through the attachments until we get the right one.
-            cid = tag['src'][4:]
-            att = next((attachment for attachment in self.attachments if hasattr(attachment, 'cid') and attachment.cid == cid), None)
-            # If we found anything, inject it.
-            if att and isinstance(att.data, bytes):
-                # Try to get the mimetype. If we can't, see if the item has an
-                # extension and guess the mimtype for a few known ones.
-                mime = att.mimetype
-                if not mime:
-                    ext = (att.name or '').split('.')[-1].lower()
-                    if ext == 'png':
-                        mime = 'image/png'
-                    elif ext == 'jpg' or ext == 'jpeg':
-                        mime = 'image/jpeg'
-                    elif ext == 'gif':
-                        mime = 'image/gif'
-                    elif ext == 'tiff' or ext == 'tif':
-                        mime = 'image/tif'
-                    elif ext == 'bmp':
-                        mime = 'image/bmp'
-                    elif ext == 'svg':
-                        mime = 'image/svg+xml'
-                # Final check.
-                if mime:
-                    tag['src'] = (b'data:' + mime.encode() + b';base64,' + base64.b64encode(att.data)).decode('utf-8')
-                else:
-                    # We don't know what to actually put for this item, and we
-                    # really should never end up here, so throw an error.
-                    raise MimetypeFailureError('Could not get the mimetype to use for htmlBodyPrepared.')
-
-        return soup.encode('utf-8')
+        soup = self.__parseHtml(self.htmlBody)
+        with io.BytesIO() as f:
+            self.__writeHtml(f, soup, self.__inlineImages(soup))
+            return f.getvalue()
 
     @functools.cached_property
     def htmlInjectableHeader(self) -> str:
@@ -1355,7 +1684,11 @@ class MessageBase(MSGFile):
         """
         The decompressed Rtf body from the message.
         """
-        return compressed_rtf.decompress(self.compressedRtf) if self.compressedRtf else None
+        if not self.compressedRtf:
+            return None
+
+        import compressed_rtf
+        return self.__cachedRtfData('rtf', lambda: compressed_rtf.decompress(self.compressedRtf))
 
     @functools.cached_property
     def rtfEncapInjectableHeader(self) -> bytes:
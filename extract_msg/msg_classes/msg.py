@@ -12,6 +12,7 @@ import datetime
 import functools
 import io
 import logging
+import mmap
 import os
 import pathlib
 import weakref
@@ -20,10 +21,12 @@ import zipfile
 import olefile
 
 from typing import (
-        Any, Callable, cast, Dict, List, Optional, Tuple, TypeVar, Union
+        Any, Callable, cast, Dict, Iterator, List, Optional, Tuple, TypeVar,
+        Union
     )
 
 from .. import constants
+from .._ole_index import buildDirectoryIndex, DirectoryNode
 from ..constants import (
         DATE_FORMAT, DT_FORMAT, MSG_PATH, OVERRIDE_CLASS, ps, SAVE_TYPE
     )
@@ -32,8 +35,8 @@ from ..attachments import (
     )
 from ..encoding import lookupCodePage
 from ..enums import (
-        ErrorBehavior, InsecureFeatures, Importance, Priority, PropertiesType,
-        RetentionFlags, SaveType, Sensitivity, SideEffect
+        AttachmentType, ErrorBehavior, InsecureFeatures, Importance, Priority,
+        PropertiesType, RetentionFlags, SaveType, Sensitivity, SideEffect
     )
 from ..exceptions import (
         ConversionError, InvalidFileFormatError, PrefixError,
@@ -97,6 +100,17 @@ class MSGFile:
         :param dateFormat: Optional, the format string to use for dates.
         :param datetimeFormat: Optional, the format string to use for dates
             that include a time component.
+        :param maxEmbeddedDepth: Optional, the maximum number of levels of
+            embedded MSG files that are allowed to be opened. Embedded MSG files
+            are only opened when the data of their attachment is accessed.
+        :param maxEmbeddedMsgs: Optional, the maximum number of embedded MSG
+            files that are allowed to be opened in total from the top level MSG
+            file.
+        :param mmap: Optional, if ``True`` the MSG file will be memory mapped
+            instead of read through a normal file object, allowing
+            ``getStreamView()`` and ``iterStream()`` to return views of the
+            mapped file instead of copying the data. If :param path: is the
+            bytes of the MSG file, views of it are returned instead.
 
         :raises InvalidFileFormatError: The file is not an OLE file or could
             not be parsed as an MSG file.
@@ -133,12 +147,16 @@ class MSGFile:
         self.__dtFormat = kwargs.get('datetimeFormat', DT_FORMAT)
 
         self.__listDirRes: Dict[Tuple[bool, bool, bool], List[List[str]]] = {}
+        self.__embeddedMsgCount = 0
+        self.__mmap: Optional[mmap.mmap] = None
 
         if self.__parentMsg:
             # We should be able to directly access the private variables of
             # another instance with no issue.
             if (msg := self.__parentMsg()) is not None:
                 self.__ole = msg.__ole
+                self.__dirIndex = msg.__dirIndex
+                self.__buffer = msg.__buffer
                 self.__oleOwner = False
             else:
                 raise ReferenceError('Parent MSG was garbage collected during init of child msg.')
@@ -147,21 +165,48 @@ class MSGFile:
             # allow an OleFile to be created without a path.
             if not path:
                 raise ValueError(':param path: must be set and must not be empty.')
+            # The memory that streams can be served directly from, if any.
+            self.__buffer: Optional[memoryview] = None
+            olePath = path
+            if kwargs.get('mmap', False):
+                if isinstance(path, bytes):
+                    self.__buffer = memoryview(path)
+                else:
+                    with open(path, 'rb') as f:
+                        try:
+                            self.__mmap = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+                        except ValueError:
+                            # Raised for empty files.
+                            raise InvalidFileFormatError('not an OLE2 structured storage file')
+                    self.__buffer = memoryview(self.__mmap)
+                    olePath = self.__mmap
             try:
                 if ErrorBehavior.OLE_DEFECT_INCORRECT in self.errorBehavior:
                     defect = olefile.DEFECT_FATAL
                 else:
                     defect = olefile.DEFECT_INCORRECT
-                self.__ole = olefile.OleFileIO(path, raise_defects = defect)
+                self.__ole = olefile.OleFileIO(olePath, raise_defects = defect)
             except OSError as e:
+                self.__closeMmap()
                 logger.error(e)
                 if str(e) == 'not an OLE2 structured storage file':
                     raise InvalidFileFormatError(e)
                 else:
                     raise
+            except:
+                self.__closeMmap()
+                raise
             # This is a variable that tells whether we own the olefile. Used for
             # closing. We set it here for error handling.
             self.__oleOwner = True
+            # Build the index used for looking up entries. Embedded MSG files
+            # share this with their parent.
+            try:
+                self.__dirIndex = buildDirectoryIndex(self.__ole)
+            except:
+                self.__ole.close()
+                self.__closeMmap()
+                raise
 
         self.__open = True
 
@@ -188,6 +233,9 @@ class MSGFile:
             self.__prefix = prefix
             self.__prefixList = prefixl
             self.__prefixLen = len(prefixl)
+            # The part of the directory index for this MSG file. Embedded MSG
+            # files only ever look at their own subtree.
+            self.__dirNode = self.__dirIndex.find(prefixl)
 
             if overrideEncoding is not None:
                 logger.warning('You have chosen to override the string encoding. Do not report encoding errors caused by this.')
@@ -247,6 +295,22 @@ class MSGFile:
     def __bytes__(self) -> bytes:
         return self.exportBytes()
 
+    def __closeMmap(self) -> None:
+        """
+        Closes the memory map of the file, if there is one.
+        """
+        if self.__mmap is not None:
+            # Embedded MSG files share the view, so release it for them too.
+            self.__buffer.release()
+            self.__buffer = None
+            try:
+                self.__mmap.close()
+            except BufferError:
+                # Views of the map still exist somewhere, so it can't be closed
+                # yet. It will be unmapped once they have all been released.
+                logger.warning('Memory map of the MSG file could not be closed because views of it still exist.')
+            self.__mmap = None
+
     def __enter__(self) -> MSGFile:
         self.__ole.__enter__()
         return self
@@ -254,6 +318,21 @@ class MSGFile:
     def __exit__(self, *_) -> None:
         self.close()
 
+    def _findNode(self, filename: MSG_PATH, prefix: bool = True) -> Optional[DirectoryNode]:
+        """
+        Finds the node in the directory index for the stream or storage
+        specified, returning ``None`` if it does not exist.
+
+        :param prefix: Bool, whether to search for the entry at the root of the
+            MSG file (``False``) or look in the current child MSG file
+            (``True``). (Default: ``True``)
+        """
+        if prefix:
+            if self.__dirNode is None:
+                return None
+            return self.__dirNode.find(msgPathToString(filename).split('/'))
+        return self.__dirIndex.find(msgPathToString(filename).split('/'))
+
     def _getOleEntry(self, filename: MSG_PATH, prefix: bool = True) -> olefile.olefile.OleDirectoryEntry:
         """
         Finds the directory entry from the OLE file for the stream or storage
@@ -264,17 +343,28 @@ class MSGFile:
         :param prefix: Bool, whether to search for the entry at the root of the
             MSG file (``False``) or look in the current child MSG file
             (``True``). (Default: ``True``)
+
+        :raises OSError: The entry could not be found.
         """
-        sid = -1
         if filename == '/':
             if prefix and self.__prefix:
-                sid = self.__ole._find(self.__prefixList)
+                node = self.__dirNode
             else:
                 return self.__ole.direntries[0]
         else:
-            sid = self.__ole._find(self.fixPath(filename, prefix))
+            node = self._findNode(filename, prefix)
+
+        if node is None:
+            raise OSError('file not found')
+
+        return node.entry
 
-        return self.__ole.direntries[sid]
+    def _addEmbeddedMsg(self) -> None:
+        """
+        Used by embedded MSG attachments to track how many embedded MSG files
+        have been opened from this top level MSG file.
+        """
+        self.__embeddedMsgCount += 1
 
     def _getTypedAs(self, _id: str, overrideClass = None, preserveNone: bool = True):
         """
@@ -370,8 +460,20 @@ class MSGFile:
         """
         verifyType(_type)
         filename = self.fixPath(filename, prefix)
-        for x in (filename + _type,) if _type is not None else self.slistDir():
-            if x.startswith(filename) and '-' not in x:
+        if _type is not None:
+            candidates = [filename + _type]
+        else:
+            # Use the index to find the streams for the property instead of
+            # searching every stream.
+            storage, _, name = filename.rpartition('/')
+            node = self.__dirIndex.find(storage.split('/')) if storage else self.__dirIndex
+            if node is None or len(name) < 16 or name[:12].lower() != '__substg1.0_':
+                return False, None
+            dirPrefix = storage + '/' if storage else ''
+            lowerName = name.lower()
+            candidates = [dirPrefix + x.name for x in node.props.get(name[12:16].upper(), ()) if x.name.lower().startswith(lowerName)]
+        for x in candidates:
+            if '-' not in x:
                 if (contents := self.getStream(x, False)) is None:
                     continue
                 if len(contents) == 0:
@@ -404,24 +506,27 @@ class MSGFile:
 
     def _oleListDir(self, streams: bool = True, storages: bool = False) -> List[List[str]]:
         """
-        Calls :meth:`OleFileIO.listdir` from the OleFileIO instance associated
-        with this MSG file. Useful for if you need access to all the top level
-        streams if this is an embedded MSG file.
+        Equivalent to :meth:`OleFileIO.listdir` for the OleFileIO instance
+        associated with this MSG file. Useful for if you need access to all the
+        top level streams if this is an embedded MSG file.
 
         :returns: A list of the streams and or storages depending on the
             arguments given.
         """
-        return self.__ole.listdir(streams, storages)
+        return self.__dirIndex.listDir(streams, storages)
 
     def close(self) -> None:
         if self.__open:
             if self.attachmentsReady:
                 for attachment in self.attachments:
-                    if attachment.type == 'msg':
+                    # Only close embedded MSG files that have actually been
+                    # opened.
+                    if attachment.type is AttachmentType.MSG and attachment.dataLoaded:
                         attachment.data.close()
 
             if self.__oleOwner:
                 self.__ole.close()
+                self.__closeMmap()
 
             self.__open = False
 
@@ -439,8 +544,7 @@ class MSGFile:
             MSG file (``False``) or look in the current child MSG file
             (``True``). (Default: ``True``)
         """
-        filename = self.fixPath(filename, prefix)
-        return self.__ole.exists(filename)
+        return self._findNode(filename, prefix) is not None
 
     def sExists(self, filename: MSG_PATH, prefix: bool = True) -> bool:
         """
@@ -451,7 +555,7 @@ class MSGFile:
             (``True``). (Default: ``True``)
         """
         filename = self.fixPath(filename, prefix)
-        return self.exists(filename + '001F') or self.exists(filename + '001E')
+        return self.exists(filename + '001F', False) or self.exists(filename + '001E', False)
 
     def existsTypedProperty(self, _id: str, location = None, _type = None, prefix: bool = True, propertiesInstance: Optional[PropertiesStore] = None) -> Tuple[bool, int]:
         """
@@ -481,11 +585,11 @@ class MSGFile:
         usableId = _id + _type if _type else _id
         foundNumber = 0
         foundStreams = []
-        for item in self.listDir():
-            if len(item) > self.__prefixLen:
-                if item[self.__prefixLen].startswith('__substg1.0_' + usableId) and item[self.__prefixLen] not in foundStreams:
+        if (node := self.__dirIndex.find(prefixList)) is not None:
+            for item in node.props.get(_id, ()):
+                if item.name[12:].upper().startswith(usableId) and item.name not in foundStreams:
                     foundNumber += 1
-                    foundStreams.append(item[self.__prefixLen])
+                    foundStreams.append(item.name)
         for x in propertiesInstance:
             if x.startswith(usableId):
                 for y in foundStreams:
@@ -515,8 +619,9 @@ class MSGFile:
 
         # Create an instance of the class used for writing a new OLE file.
         writer = OleWriter()
-        # Add all file and directory entries to it. If this
-        writer.fromMsg(self, allowBadEmbed = allowBadEmbed)
+        # Add all file and directory entries to it. The streams are read from
+        # this file as they are written, so they are never all in memory.
+        writer.fromMsg(self, allowBadEmbed = allowBadEmbed, streamData = True)
         writer.write(path)
 
     def exportBytes(self, allowBadEmbed: bool = False) -> bytes:
@@ -709,13 +814,157 @@ class MSGFile:
             (``True``). (Default: ``True``)
         """
         filename = self.fixPath(filename, prefix)
-        if self.exists(filename, False):
-            with self.__ole.openstream(filename) as stream:
+        if (node := self.__dirIndex.find(filename.split('/'))) is not None:
+            if not node.isStream:
+                raise OSError('this file is not a stream')
+            if (offset := self.__contiguousOffset(node.entry)) is not None:
+                return bytes(self.__buffer[offset:offset + node.entry.size])
+            with self.__ole._open(node.entry.isectStart, node.entry.size) as stream:
                 return stream.read() or b''
         else:
             logger.info(f'Stream "{filename}" was requested but could not be found. Returning `None`.')
             return None
 
+    def getStreamSize(self, filename: MSG_PATH, prefix: bool = True) -> Optional[int]:
+        """
+        Gets the size of the requested stream without reading it.
+
+        Returns ``None`` if the stream could not be found.
+
+        :param prefix: Bool, whether to search for the entry at the root of the
+            MSG file (``False``) or look in the current child MSG file
+            (``True``). (Default: ``True``)
+        """
+        filename = self.fixPath(filename, prefix)
+        if (node := self.__dirIndex.find(filename.split('/'))) is None:
+            return None
+        if not node.isStream:
+            raise OSError('this file is not a stream')
+        return node.entry.size
+
+    def getStreamView(self, filename: MSG_PATH, prefix: bool = True) -> Optional[memoryview]:
+        """
+        Gets a ``memoryview`` of the requested stream.
+
+        If the MSG file was opened with :param mmap: and the stream is stored
+        contiguously, the view is directly over the data of the file and
+        nothing is copied. Otherwise, the stream is read normally. Views
+        directly over the file should be released before the MSG file is
+        closed.
+
+        Returns ``None`` if the stream could not be found.
+
+        :param prefix: Bool, whether to search for the entry at the root of the
+            MSG file (``False``) or look in the current child MSG file
+            (``True``). (Default: ``True``)
+        """
+        filename = self.fixPath(filename, prefix)
+        if (node := self.__dirIndex.find(filename.split('/'))) is not None:
+            if not node.isStream:
+                raise OSError('this file is not a stream')
+            if (offset := self.__contiguousOffset(node.entry)) is not None:
+                return self.__buffer[offset:offset + node.entry.size]
+            with self.__ole._open(node.entry.isectStart, node.entry.size) as stream:
+                return memoryview(stream.read() or b'')
+        else:
+            logger.info(f'Stream "{filename}" was requested but could not be found. Returning `None`.')
+            return None
+
+    def __contiguousOffset(self, entry: olefile.olefile.OleDirectoryEntry) -> Optional[int]:
+        """
+        Returns the offset of the data for the stream in the buffer of the file
+        if the file has a buffer and all the sectors of the stream are
+        contiguous, otherwise returns ``None``.
+
+        Streams in the mini stream are always read normally, as they are small
+        and the mini stream is already in memory once it has been used.
+        """
+        ole = self.__ole
+        if self.__buffer is None or entry.size < ole.minisectorcutoff:
+            return None
+
+        fat = ole.fat
+        sectorSize = ole.sectorsize
+        sect = entry.isectStart
+        for _ in range((entry.size - 1) // sectorSize):
+            if sect >= len(fat) or fat[sect] != sect + 1:
+                return None
+            sect += 1
+
+        offset = sectorSize * (entry.isectStart + 1)
+        # Let olefile handle the error if the file is too short.
+        if offset + entry.size > len(self.__buffer):
+            return None
+        return offset
+
+    def iterStream(self, filename: MSG_PATH, prefix: bool = True, chunkSize: int = 1048576) -> Optional[Iterator[bytes]]:
+        """
+        Gets an iterator that reads the requested stream in chunks, allowing
+        large streams to be copied without ever being fully loaded into memory.
+
+        Returns ``None`` if the stream could not be found.
+
+        :param prefix: Bool, whether to search for the entry at the root of the
+            MSG file (``False``) or look in the current child MSG file
+            (``True``). (Default: ``True``)
+        :param chunkSize: The maximum number of bytes to read at a time. Streams
+            that are stored in the mini stream are always read all at once, as
+            they are never larger than 4096 bytes.
+
+        If the MSG file was opened with :param mmap:, the chunks are
+        ``memoryview`` objects of the file instead of ``bytes``.
+        """
+        filename = self.fixPath(filename, prefix)
+        if (node := self.__dirIndex.find(filename.split('/'))) is None:
+            logger.info(f'Stream "{filename}" was requested but could not be found. Returning `None`.')
+            return None
+
+        if not node.isStream:
+            raise OSError('this file is not a stream')
+        entry = node.entry
+
+        if entry.size < self.__ole.minisectorcutoff:
+            return iter((self.getStream(filename, False),))
+
+        return self.__iterFatStream(entry.isectStart, entry.size, chunkSize)
+
+    def __iterFatStream(self, sect: int, size: int, chunkSize: int) -> Iterator[bytes]:
+        """
+        Generator that follows the FAT chain of a stream, yielding the data of
+        runs of contiguous sectors. Each read seeks first, so other reads from
+        the OLE file between chunks are safe.
+        """
+        ole = self.__ole
+        fat = ole.fat
+        sectorSize = ole.sectorsize
+        maxSectors = max(chunkSize // sectorSize, 1)
+        remaining = size
+        while remaining > 0:
+            if sect >= len(fat):
+                ole._raise_defect(olefile.DEFECT_INCORRECT, 'incorrect OLE FAT, sector index out of range')
+                return
+            # Find how many of the next sectors are contiguous.
+            start = sect
+            count = 1
+            while count < maxSectors and count * sectorSize < remaining and fat[sect] == sect + 1:
+                sect += 1
+                count += 1
+            toRead = min(count * sectorSize, remaining)
+            if self.__buffer is not None:
+                offset = sectorSize * (start + 1)
+                data = self.__buffer[offset:offset + toRead]
+            else:
+                ole.fp.seek(sectorSize * (start + 1))
+                data = ole.fp.read(toRead)
+            if len(data) != toRead:
+                ole._raise_defect(olefile.DEFECT_INCORRECT, 'OLE stream size is less than declared')
+                if data:
+                    yield data
+                return
+            yield data
+            remaining -= toRead
+            sect = fat[sect]
+
     def getStreamAs(self, streamID: MSG_PATH, overrideClass: OVERRIDE_CLASS[_T]) -> Optional[_T]:
         """
         Returns the specified stream, modifying it to the specified class if it
@@ -785,24 +1034,19 @@ class MSGFile:
         :param includePrefix: If ``False``, removes the part of the path that
             is the prefix.
         """
-        # Get the items from OleFileIO.
+        # Only the subtree for this MSG file needs to be walked, and the
+        # result is cached so it only ever happens once.
         try:
-            return self.__listDirRes[(streams, storages, includePrefix)]
+            entries = self.__listDirRes[(streams, storages, includePrefix)]
         except KeyError:
-            entries = self.__ole.listdir(streams, storages)
-            if not self.__prefix:
-                return entries
-            prefix = self.__prefix.split('/')
-            if prefix[-1] == '':
-                prefix.pop()
-
-            prefixLength = self.__prefixLen
-            entries = [x for x in entries if len(x) > prefixLength and x[:prefixLength] == prefix]
-            if not includePrefix:
-                entries = [x[prefixLength:] for x in entries]
+            if self.__dirNode is None:
+                entries = []
+            else:
+                entries = self.__dirNode.listDir(streams, storages, self.__prefixList if includePrefix else None)
             self.__listDirRes[(streams, storages, includePrefix)] = entries
 
-            return entries
+        # Copy the list so modifying it doesn't change the cache.
+        return list(entries)
 
     def slistDir(self, streams: bool = True, storages: bool = False, includePrefix: bool = True) -> List[str]:
         """
@@ -987,6 +1231,16 @@ class MSGFile:
         """
         return self.__dtFormat
 
+    @property
+    def embeddedMsgCount(self) -> int:
+        """
+        The number of embedded MSG files that have been opened from this MSG
+        file and all of its children.
+
+        Only tracked on the top level MSG file.
+        """
+        return self.__embeddedMsgCount
+
     @property
     def errorBehavior(self) -> ErrorBehavior:
         """
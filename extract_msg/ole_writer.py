@@ -7,12 +7,16 @@ __all__ = [
 ]
 
 
+import array
 import copy
+import functools
+import itertools
 import re
+import sys
 
 from typing import (
-        Dict, Iterator, List, Optional, SupportsBytes, Tuple, TYPE_CHECKING,
-        Union
+        Callable, Dict, Iterable, Iterator, List, Optional, SupportsBytes,
+        Tuple, TYPE_CHECKING, Union
     )
 
 from . import constants
@@ -28,6 +32,10 @@ from red_black_dict_mod import RedBlackTree
 if TYPE_CHECKING:
     from .msg_classes import MSGFile
 
+# The null bytes needed to pad data to a multiple of the mini sector size, for
+# each remainder.
+_MINI_SECTOR_PADDING = tuple(bytes(-x & 63) for x in range(64))
+
 
 class DirectoryEntry:
     """
@@ -56,11 +64,53 @@ class DirectoryEntry:
     color: Color = Color.BLACK
 
     clsid: bytes = b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
-    data: bytes = b''
+    _data: bytes = b''
+    # If set, the data of the stream is read from this when it is needed
+    # instead of being stored in the entry.
+    _dataSource: Optional[Callable[[], Iterable[bytes]]] = None
+    # The size of the data of the stream. This is set along with the data, so
+    # it can be checked without reading the data.
+    dataSize: int = 0
 
     def __bytes__(self) -> bytes:
         return self.toBytes()
 
+    def iterData(self) -> Iterator[bytes]:
+        """
+        Returns an iterator over the data of the stream in chunks, calling the
+        data source if there is one.
+
+        :raises ValueError: The data source did not give the amount of data
+            that was expected.
+        """
+        if self._dataSource is None:
+            if self._data:
+                yield self._data
+            return
+
+        read = 0
+        for chunk in self._dataSource():
+            read += len(chunk)
+            if read > self.dataSize:
+                break
+            yield chunk
+        if read != self.dataSize:
+            raise ValueError(f'Data source for entry "{self.name}" gave {"more" if read > self.dataSize else read} bytes, expected {self.dataSize}.')
+
+    def setDataSource(self, source: Callable[[], Iterable[bytes]], size: int) -> None:
+        """
+        Sets the data of the stream to be read from :param source: only when it
+        is needed, such as when the file is written, instead of being stored.
+
+        :param source: A function that takes no arguments and returns an
+            iterable of bytes-like objects, which together are the data. It
+            will be called each time the data is needed.
+        :param size: The size of the data that :param source: will give.
+        """
+        self._data = b''
+        self._dataSource = source
+        self.dataSize = size
+
     def toBytes(self) -> bytes:
         """
         Converts the entry to bytes to be writen to a file.
@@ -88,9 +138,25 @@ class DirectoryEntry:
                                               self.creationTime,
                                               self.modifiedTime,
                                               self.startingSectorLocation,
-                                              getattr(self, 'streamSize', len(self.data)),
+                                              getattr(self, 'streamSize', self.dataSize),
                                              )
 
+    @property
+    def data(self) -> bytes:
+        """
+        The data of the stream. If the data comes from a data source, it is
+        read each time this is accessed.
+        """
+        if self._dataSource is None:
+            return self._data
+        return b''.join(self.iterData())
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        self._data = value
+        self._dataSource = None
+        self.dataSize = len(value)
+
 
 
 class OleWriter:
@@ -192,6 +258,8 @@ class OleWriter:
         """
         # Extract the arguments.
         data = kwargs.get('data')
+        dataSource = kwargs.get('dataSource')
+        dataSize = kwargs.get('dataSize')
         clsid = kwargs.get('clsid')
         creationTime = kwargs.get('creationTime')
         modifiedTime = kwargs.get('modifiedTime')
@@ -214,6 +282,18 @@ class OleWriter:
             if len(data) > 0x80000000:
                 raise ValueError('Current version of extract_msg does not support streams greater than 2 GB in OLE files.')
 
+        if dataSource is not None:
+            if entry.type is not DirectoryEntryType.STREAM:
+                raise TypeError('Cannot set the data of a storage object.')
+            if data is not None:
+                raise ValueError('Cannot set both the data and the data source of a stream.')
+            if not callable(dataSource):
+                raise ValueError('Data source must be callable.')
+            if not isinstance(dataSize, int) or dataSize < 0:
+                raise ValueError('Data size must be a positive int if a data source is set.')
+            if dataSize > 0x80000000:
+                raise ValueError('Current version of extract_msg does not support streams greater than 2 GB in OLE files.')
+
         if clsid is not None:
             if not isinstance(clsid, bytes):
                 raise ValueError('CLSID must be bytes.')
@@ -239,6 +319,8 @@ class OleWriter:
         # Now that all our checks have passed, let's set our data.
         if data is not None:
             entry.data = data
+        if dataSource is not None:
+            entry.setDataSource(dataSource, dataSize)
         if clsid is not None:
             entry.clsid = clsid
         if creationTime is not None:
@@ -261,11 +343,11 @@ class OleWriter:
         for entry in self.__walkEntries():
             self.__dirEntryCount += 1
             if entry.type == DirectoryEntryType.STREAM:
-                if len(entry.data) < 4096:
-                    self.__numMinifatSectors += ceilDiv(len(entry.data), 64)
+                if entry.dataSize < 4096:
+                    self.__numMinifatSectors += ceilDiv(entry.dataSize, 64)
                 else:
                     self.__largeEntries.append(entry)
-                    self.__largeEntrySectors += ceilDiv(len(entry.data), self.__sectorSize)
+                    self.__largeEntrySectors += ceilDiv(entry.dataSize, self.__sectorSize)
 
     def __walkEntries(self) -> Iterator[DirectoryEntry]:
         """
@@ -285,6 +367,16 @@ class OleWriter:
                     else:
                         yield item
 
+    def __writeEntryData(self, f, entry: DirectoryEntry, blockSize: int) -> None:
+        """
+        Writes the data of the entry, reading it from its data source if it
+        has one, padded to a multiple of :param blockSize:.
+        """
+        for chunk in entry.iterData():
+            f.write(chunk)
+        if entry.dataSize & (blockSize - 1):
+            f.write(b'\x00' * (blockSize - (entry.dataSize & (blockSize - 1))))
+
     @property
     def __dirEntsPerSector(self) -> int:
         """
@@ -444,12 +536,12 @@ class OleWriter:
         miniFATLocation = 0
 
         for entry in entries:
-            if len(entry.data) == 0 and entry != entries[0]:
+            if entry.dataSize == 0 and entry != entries[0]:
                 # If there is no data, just set the starting location to none.
                 entry.startingSectorLocation = 0xFFFFFFFE
-            elif entry.type == DirectoryEntryType.STREAM and len(entry.data) < 4096:
+            elif entry.type == DirectoryEntryType.STREAM and entry.dataSize < 4096:
                 entry.startingSectorLocation = miniFATLocation
-                miniFATLocation += ceilDiv(len(entry.data), 64)
+                miniFATLocation += ceilDiv(entry.dataSize, 64)
 
         return entries
 
@@ -519,87 +611,69 @@ class OleWriter:
 
         # To make life easier on me, I'm having the code start with the DIFAT
         # followed by the FAT sectors, as I can write them all at once before
-        # writing the actual contents of the file.
+        # writing the actual contents of the file. Each table is built as an
+        # array first, as there is an entry for every sector in the file.
+        linksPerSector = self.__linksPerSector
+        fatLocations = range(numDifat, numDifat + numFat)
+
+        # Write the DIFAT, starting with the locations that fit in the header.
+        difat = array.array('I', fatLocations[:109])
+        difat.extend(array.array('I', (0xFFFFFFFF,)) * (109 - len(difat)))
+        _writeLinks(f, difat)
 
-        # Write the DIFAT sectors.
-        for x in range(numFat):
-            # Quickly check if we have hit 109. If we have, and we are writing
-            # a version 4 file, we need to pad a bunch of null bytes.
-            if x == 109 and self.__version == 4:
-                f.write(b'\x00' * 3584)
-            # This kind of sucks to code, ngl.
-            if x > 109 and (x - 109) % (self.__linksPerSector - 1) == 0:
-                # If we are at the end of a DIFAT sector, write the jump.
-                f.write(constants.st.ST_LE_UI32.pack((x - 109) // (self.__linksPerSector - 1)))
-            # Write the next FAT sector location.
-            f.write(constants.st.ST_LE_UI32.pack(x + numDifat))
-
-        # Finally, fill out the last DIFAT sector with null entries.
         if numFat > 109:
-            f.write(b'\xFF\xFF\xFF\xFF' * ((self.__linksPerSector - 1) - ((numFat - 109) % (self.__linksPerSector - 1))))
-            # Finally, make sure to write the end of chain marker for the DIFAT.
-            f.write(b'\xFE\xFF\xFF\xFF')
-        else:
-            f.write(b'\xFF\xFF\xFF\xFF' * (109 - numFat))
+            # If we are writing a version 4 file, we need to pad a bunch of
+            # null bytes to finish the header sector.
+            if self.__version == 4:
+                f.write(b'\x00' * 3584)
+            # Each DIFAT sector ends with the location of the next one, so
+            # write the jump before each one after the first.
+            difat = array.array('I')
+            for index, start in enumerate(range(109, numFat, linksPerSector - 1)):
+                if index:
+                    difat.append(index)
+                difat.extend(fatLocations[start:start + linksPerSector - 1])
+            # Finally, fill out the last DIFAT sector with null entries and
+            # make sure to write the end of chain marker for the DIFAT. If the
+            # last sector is already full, there is nothing to fill.
+            difat.extend(array.array('I', (0xFFFFFFFF,)) * (-(numFat - 109) % (linksPerSector - 1)))
+            difat.append(0xFFFFFFFE)
+            _writeLinks(f, difat)
 
         ### FAT.
 
         # First, if we had any DIFAT sectors, write that the previous sectors
-        # were all a part of it.
-        f.write(b'\xFC\xFF\xFF\xFF' * numDifat)
-        # Second write that the next x sectors are all FAT sectors.
-        f.write(b'\xFD\xFF\xFF\xFF' * numFat)
+        # were all a part of it. Second write that the next x sectors are all
+        # FAT sectors.
+        fat = array.array('I', (0xFFFFFFFC,)) * numDifat
+        fat.extend(array.array('I', (0xFFFFFFFD,)) * numFat)
 
         offset = numDifat + numFat
 
         # Fill in the values for the directory stream.
-        for x in range(offset + 1, offset + ceilDiv(self.__dirEntryCount, self.__dirEntsPerSector)):
-            f.write(constants.st.ST_LE_UI32.pack(x))
-
-        # Write the end of chain marker.
-        f.write(b'\xFE\xFF\xFF\xFF')
-
-        offset += ceilDiv(self.__dirEntryCount, self.__dirEntsPerSector)
+        offset = _addChain(fat, offset, ceilDiv(self.__dirEntryCount, self.__dirEntsPerSector))
 
         # Check if we have minifat *at all* first.
         if self.__numMinifatSectors > 0:
             # Mini FAT chain.
-            for x in range(offset + 1, offset + ceilDiv(self.__numMinifat, 16)):
-                f.write(constants.st.ST_LE_UI32.pack(x))
-
-            # Write the end of chain marker.
-            f.write(b'\xFE\xFF\xFF\xFF')
-
-            offset += ceilDiv(self.__numMinifat, 16)
-
+            offset = _addChain(fat, offset, ceilDiv(self.__numMinifat, 16))
             # The mini stream sectors.
-            for x in range(offset + 1, offset + self.__numMinifat):
-                f.write(constants.st.ST_LE_UI32.pack(x))
-
-            # Write the end of chain marker.
-            f.write(b'\xFE\xFF\xFF\xFF')
-
-            offset += self.__numMinifat
+            offset = _addChain(fat, offset, self.__numMinifat)
 
         # Regular stream chains. These are the most complex to handle. We handle
         # them by checking a list that was make of entries which were only added
         # to that list if the size was more than 4096. The order in the list is
         # how they will eventually be stored into the file correctly.
         for entry in self.__largeEntries:
-            size = ceilDiv(len(entry.data), self.__sectorSize)
             entry.startingSectorLocation = offset
-            for x in range(offset + 1, offset + size):
-                f.write(constants.st.ST_LE_UI32.pack(x))
-
-            # Write the end of chain marker.
-            f.write(b'\xFE\xFF\xFF\xFF')
-
-            offset += size
+            offset = _addChain(fat, offset, ceilDiv(entry.dataSize, self.__sectorSize))
 
         # Finally, fill fat with markers to specify no block exists.
-        freeSectors = totalSectors & (self.__linksPerSector - 1)
+        freeSectors = totalSectors & (linksPerSector - 1)
         if freeSectors:
-            f.write(b'\xFF\xFF\xFF\xFF' * (self.__linksPerSector - freeSectors))
+            fat.extend(array.array('I', (0xFFFFFFFF,)) * (linksPerSector - freeSectors))
+
+        _writeLinks(f, fat)
 
         # Finally, return the current sector index for use in other places.
         return numDifat + numFat
@@ -628,39 +702,45 @@ class OleWriter:
         large for the mini FAT.
         """
         for x in self.__largeEntries:
-            f.write(x.data)
-            if len(x.data) & (self.__sectorSize - 1):
-                f.write(b'\x00' * (self.__sectorSize - (len(x.data) & (self.__sectorSize - 1))))
+            self.__writeEntryData(f, x, self.__sectorSize)
 
     def _writeMini(self, f, entries: List[DirectoryEntry]) -> None:
         """
         Writes the mini FAT followed by the full mini stream.
         """
         # For each of the entires that are streams and less than 4096.
-        currentSector = 0
-        for x in entries:
-            if x.type == DirectoryEntryType.STREAM and len(x.data) < 4096:
-                size = ceilDiv(len(x.data), 64)
-                for x in range(currentSector + 1, currentSector + size):
-                    f.write(constants.st.ST_LE_UI32.pack(x))
-                if size > 0:
-                    f.write(b'\xFE\xFF\xFF\xFF')
-                currentSector += size
+        miniEntries = [
+            x for x in entries
+            if x.type == DirectoryEntryType.STREAM and 0 < x.dataSize < 4096
+        ]
+        sizes = [x.dataSize for x in miniEntries]
+
+        # Each stream is a chain of consecutive mini sectors, so every sector
+        # links to the next one except for the last sector of each stream.
+        currentSector = sum(map(ceilDiv, sizes, itertools.repeat(64)))
+        miniFat = array.array('I', range(1, currentSector + 1))
+        for end in itertools.accumulate(map(ceilDiv, sizes, itertools.repeat(64))):
+            miniFat[end - 1] = 0xFFFFFFFE
 
         # Finally, write the remaining slots.
         if currentSector & (self.__linksPerSector - 1):
-            f.write(b'\xFF\xFF\xFF\xFF' * (self.__linksPerSector - (currentSector & (self.__linksPerSector - 1))))
-
-        # Write the mini stream.
-        for x in entries:
-            if len(x.data) > 0 and len(x.data) < 4096:
-                f.write(x.data)
-                if len(x.data) & 63:
-                    f.write(b'\x00' * (64 - (len(x.data) & 63)))
+            miniFat.extend(array.array('I', (0xFFFFFFFF,)) * (self.__linksPerSector - (currentSector & (self.__linksPerSector - 1))))
+        _writeLinks(f, miniFat)
+
+        # Write the mini stream. The streams are small, so they are collected
+        # into larger blocks to write.
+        buffer = bytearray()
+        for x, size in zip(miniEntries, sizes):
+            buffer += x.data
+            buffer += _MINI_SECTOR_PADDING[size & 63]
+            if len(buffer) >= 1048576:
+                f.write(buffer)
+                buffer = bytearray()
 
         # Pad the final mini stream block.
         if self.__numMinifatSectors & (self.__miniSectorsPerSector - 1):
-            f.write((b'\x00' * 64) * (self.__miniSectorsPerSector - (self.__numMinifatSectors & (self.__miniSectorsPerSector - 1))))
+            buffer.extend(bytes(64 * (self.__miniSectorsPerSector - (self.__numMinifatSectors & (self.__miniSectorsPerSector - 1)))))
+        f.write(buffer)
 
     def addEntry(self, path: MSG_PATH, data: Optional[Union[bytes, SupportsBytes]] = None, storage: bool = False, **kwargs) -> None:
         """
@@ -672,6 +752,12 @@ class OleWriter:
             that is an already added stream.
         :param data: The bytes for a stream or an object with a ``__bytes__``
             method.
+        :param dataSource: A function that takes no arguments and returns an
+            iterable of bytes-like objects to use as the data of a stream. It
+            is only called when the data is needed, such as when the file is
+            written. Cannot be used with :param data:.
+        :param dataSize: The size of the data that :param dataSource: will
+            give. Required if :param dataSource: is set.
         :param storage: If ``True``, the entry to add is a storage. Otherwise,
             the entry is a stream.
         :param clsid: The CLSID for the stream/storage. Must a a bytes instance
@@ -706,10 +792,17 @@ class OleWriter:
         else:
             _dir[path[-1]] = entry
 
-    def addOleEntry(self, path: MSG_PATH, entry: OleDirectoryEntry, data: Optional[Union[bytes, SupportsBytes]] = None) -> None:
+    def addOleEntry(self, path: MSG_PATH, entry: OleDirectoryEntry, data: Optional[Union[bytes, SupportsBytes]] = None, dataSource: Optional[Callable[[], Iterable[bytes]]] = None, dataSize: Optional[int] = None) -> None:
         """
         Uses the entry provided to add the data to the writer.
 
+        :param dataSource: If set instead of :param data:, a function that
+            takes no arguments and returns an iterable of bytes-like objects
+            that will be called when the data of the stream is needed. It must
+            give exactly the number of bytes specified by :param dataSize:.
+        :param dataSize: The size of the data that :param dataSource: will
+            give. If not set, the size of the entry is used.
+
         :raises OSError: Tried to add an entry to a path that has not yet
             been added, tried to add as a child of a stream, or tried to add an
             entry where one already exists under the same name.
@@ -746,10 +839,17 @@ class OleWriter:
             newEntry.stateBits = entry.dwUserFlags
 
             # Next, handle the data.
-            data = data or b''
-            newEntry.data = bytes(data)
-            if len(newEntry.data) > 0x80000000:
-                raise ValueError('Current version of extract_msg does not support streams greater than 2 GB in OLE files.')
+            if dataSource is not None:
+                if dataSize is None:
+                    dataSize = entry.size
+                if dataSize > 0x80000000:
+                    raise ValueError('Current version of extract_msg does not support streams greater than 2 GB in OLE files.')
+                newEntry.setDataSource(dataSource, dataSize)
+            else:
+                data = data or b''
+                newEntry.data = bytes(data)
+                if len(newEntry.data) > 0x80000000:
+                    raise ValueError('Current version of extract_msg does not support streams greater than 2 GB in OLE files.')
 
             # Finally add the entry to out dict of entries.
             _dir[path[-1]] = newEntry
@@ -781,6 +881,12 @@ class OleWriter:
 
         :param data: The data of a stream. Will error if used for something
             other than a stream. Must be bytes or convertable to bytes.
+        :param dataSource: A function that takes no arguments and returns an
+            iterable of bytes-like objects to use as the data of a stream. It
+            is only called when the data is needed, such as when the file is
+            written. Cannot be used with :param data:.
+        :param dataSize: The size of the data that :param dataSource: will
+            give. Required if :param dataSource: is set.
         :param clsid: The CLSID for the stream/storage. Must a a bytes instance
             that is 16 bytes long.
         :param creationTime: An 8 byte filetime int. Sets the creation time of
@@ -804,12 +910,16 @@ class OleWriter:
         # Send it to be modified using the arguments given.
         self.__modifyEntry(entry, **kwargs)
 
-    def fromMsg(self, msg: MSGFile, allowBadEmbed: bool = False) -> None:
+    def fromMsg(self, msg: MSGFile, allowBadEmbed: bool = False, streamData: bool = False) -> None:
         """
         Copies the streams and stream information necessary from the MSG file.
 
         :param allowBadEmbed: If True, attempts to skip steps that will fail if 
             the embedded MSG file violates standards. It will also attempt to repair the data to try to ensure it can open in Outlook.
+        :param streamData: If ``True``, the data of the streams is read from
+            the MSG file as it is written instead of being copied now, so large
+            streams are never held in memory. The MSG file must not be closed
+            until the writer is done being written.
 
         :raises StandardViolationError: Something about the embedded data has a
             fundemental issue that violates the standard.
@@ -824,7 +934,13 @@ class OleWriter:
 
         for x in entries:
             entry = msg._getOleEntry(x)
-            data = msg.getStream(x) if entry.entry_type == DirectoryEntryType.STREAM else None
+            if entry.entry_type != DirectoryEntryType.STREAM:
+                self.addOleEntry(x, entry, None)
+                continue
+            if streamData and x[0] != '__properties_version1.0':
+                self.addOleEntry(x, entry, dataSource = functools.partial(msg.iterStream, x), dataSize = msg.getStreamSize(x))
+                continue
+            data = msg.getStream(x)
             # THe properties stream on embedded messages actualy needs to be
             # transformed a little (*why* it is like that is a mystery to me).
             # Basically we just need to add a "reserved" section to it in a
@@ -864,9 +980,12 @@ class OleWriter:
             # Create our generator.
             gen = (x for x in msg._oleListDir() if len(x) > 1 and x[0] == '__nameid_version1.0')
             for x in gen:
-                self.addOleEntry(x, msg._getOleEntry(x, prefix = False), msg.getStream(x, prefix = False))
+                if streamData:
+                    self.addOleEntry(x, msg._getOleEntry(x, prefix = False), dataSource = functools.partial(msg.iterStream, x, False), dataSize = msg.getStreamSize(x, False))
+                else:
+                    self.addOleEntry(x, msg._getOleEntry(x, prefix = False), msg.getStream(x, prefix = False))
 
-    def fromOleFile(self, ole: OleFileIO, rootPath: MSG_PATH = []) -> None:
+    def fromOleFile(self, ole: OleFileIO, rootPath: MSG_PATH = [], streamData: bool = False) -> None:
         """
         Copies all the streams from the proided OLE file into this writer.
 
@@ -879,6 +998,10 @@ class OleWriter:
         :param rootPath: A path (accepted by ``olefile.OleFileIO``) to the
             directory to use as the root of the file. If not provided, the file
             root will be used.
+        :param streamData: If ``True``, the data of the streams is read from
+            the OLE file as it is written instead of being copied now, so only
+            one stream is held in memory at a time. The OLE file must not be
+            closed until the writer is done being written.
 
         :raises OSError: If :param rootPath: does not exist in the file.
         """
@@ -915,13 +1038,14 @@ class OleWriter:
         for x in sorted(paths.keys()):
             fullPath, entry = paths[x]
 
-            if entry.entry_type == DirectoryEntryType.STREAM:
+            if entry.entry_type != DirectoryEntryType.STREAM:
+                self.addOleEntry(x, entry, None)
+            elif streamData:
+                self.addOleEntry(x, entry, dataSource = functools.partial(_iterOleStream, ole, fullPath))
+            else:
                 with ole.openstream(fullPath) as f:
                     data = f.read()
-            else:
-                data = None
-
-            self.addOleEntry(x, entry, data)
+                self.addOleEntry(x, entry, data)
 
     def getEntry(self, path: MSG_PATH) -> DirectoryEntry:
         """
@@ -1079,6 +1203,34 @@ class OleWriter:
 
 
 
+def _addChain(links: array.array, start: int, count: int) -> int:
+    """
+    Adds the links for a chain of :param count: sectors starting at
+    :param start: to the FAT or mini FAT, returning the sector after it.
+    """
+    links.extend(range(start + 1, start + count))
+    links.append(0xFFFFFFFE)
+    return start + count
+
+
+def _iterOleStream(ole: OleFileIO, path: List[str], chunkSize: int = 1048576) -> Iterator[bytes]:
+    """
+    Reads the stream from the OLE file in chunks.
+    """
+    with ole.openstream(path) as f:
+        while (chunk := f.read(chunkSize)):
+            yield chunk
+
+
+def _writeLinks(f, links: array.array) -> None:
+    """
+    Writes the array of sector links to the file as little endian values.
+    """
+    if sys.byteorder != 'little':
+        links.byteswap()
+    f.write(links.tobytes())
+
+
 def _unClsid(clsid: str) -> bytes:
     """
     Converts the clsid from ``olefile.olefile._clsid`` back to bytes.
@@ -0,0 +1,298 @@
+"""
+Backends for converting HTML to PDF.
+
+Converting a message to PDF normally starts wkhtmltopdf once for that message,
+so starting the process takes most of the time when converting many small
+messages. :class:`PdfBatch` instead collects the HTML bodies of many messages
+and gives them to the backend all at once so that they can be rendered
+together.
+"""
+
+__all__ = [
+    'PdfBackend',
+    'PdfBatch',
+    'WkHtmlToPdfBackend',
+]
+
+
+import abc
+import concurrent.futures
+import logging
+import math
+import os
+import pathlib
+import subprocess
+import tempfile
+
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from .exceptions import WKError
+from .utils import findWk
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def _quoteArg(arg: str) -> str:
+    """
+    Quotes an argument for a line given to ``--read-args-from-stdin``, which
+    splits on whitespace outside of double quotes and uses backslashes to
+    escape characters.
+    """
+    return '"' + arg.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _isPdf(data: bytes) -> bool:
+    """
+    Checks that the data looks like a complete PDF file.
+    """
+    return data.startswith(b'%PDF') and data.rstrip().endswith(b'%%EOF')
+
+
+class PdfBackend(abc.ABC):
+    """
+    Base class for converting HTML to PDF.
+    """
+
+    @abc.abstractmethod
+    def render(self, html: bytes) -> bytes:
+        """
+        Converts the HTML to PDF.
+        """
+
+    def renderBatch(self, htmls: Sequence[bytes]) -> List[Union[bytes, Exception]]:
+        """
+        Converts each of the HTML bodies to PDF, returning the results in the
+        same order.
+
+        If converting a body fails, the exception is put in the list in place
+        of the PDF instead of being raised, so that one bad body does not
+        affect the others. The default implementation simply calls
+        :meth:`render` for each body.
+        """
+        results: List[Union[bytes, Exception]] = []
+        for html in htmls:
+            try:
+                results.append(self.render(html))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+class WkHtmlToPdfBackend(PdfBackend):
+    """
+    Converts HTML to PDF using wkhtmltopdf. This is the default backend.
+
+    :meth:`render` starts a new process for each body, giving it the HTML
+    through stdin. :meth:`renderBatch` writes the bodies to temporary files
+    and has a single process convert many of them using
+    ``--read-args-from-stdin``.
+    """
+
+    def __init__(self, wkPath = None, wkOptions: Optional[Iterable[Union[str, bytes]]] = None, batchSize: int = 50, maxProcesses: int = 1):
+        """
+        :param wkPath: Used to manually specify the path of the wkhtmltopdf
+            executable. If not specified, the function will try to find it.
+        :param wkOptions: Used to specify additional options to wkhtmltopdf.
+            this must be a list or list-like object composed of strings and
+            bytes.
+        :param batchSize: The maximum number of bodies to give to a single
+            process in :meth:`renderBatch`.
+        :param maxProcesses: The maximum number of processes to run at once in
+            :meth:`renderBatch`.
+
+        :raises ExecutableNotFound: The wkhtmltopdf executable could not be
+            found.
+        """
+        super().__init__()
+        # Immediately try to find the executable.
+        self.__wkPath = findWk(wkPath)
+
+        # First thing is first, we need to parse our wkOptions if they exist.
+        if wkOptions:
+            try:
+                # Try to convert to a list, whatever it is, and fail if it is
+                # not possible.
+                parsedWkOptions = [*wkOptions]
+            except TypeError:
+                raise TypeError(f':param wkOptions: must be an iterable, not {type(wkOptions)}.')
+        else:
+            parsedWkOptions = []
+
+        # Confirm that all of our options we now have are either strings or
+        # bytes.
+        if not all(isinstance(option, (str, bytes)) for option in parsedWkOptions):
+            raise TypeError(':param wkOptions: must be an iterable of strings and bytes.')
+
+        if batchSize < 1:
+            raise ValueError(':param batchSize: must be at least 1.')
+        if maxProcesses < 1:
+            raise ValueError(':param maxProcesses: must be at least 1.')
+
+        self.__wkOptions = parsedWkOptions
+        self.__batchSize = batchSize
+        self.__maxProcesses = maxProcesses
+
+    def __renderChunk(self, htmls: Sequence[bytes]) -> List[Union[bytes, Exception]]:
+        """
+        Converts the bodies using a single process.
+        """
+        with tempfile.TemporaryDirectory(prefix = 'extract_msg_') as tempDir:
+            lines = []
+            outPaths = []
+            for index, html in enumerate(htmls):
+                inPath = os.path.join(tempDir, f'{index}.html')
+                outPath = os.path.join(tempDir, f'{index}.pdf')
+                with open(inPath, 'wb') as f:
+                    f.write(html)
+                lines.append(f'{_quoteArg(inPath)} {_quoteArg(outPath)}\n')
+                outPaths.append(outPath)
+
+            processArgs = [self.__wkPath, *self.__wkOptions, '--read-args-from-stdin']
+            logger.info(f'Converting {len(htmls)} bodies to PDF with the following arguments: {processArgs}')
+            process = subprocess.run(processArgs, input = ''.join(lines).encode('utf-8'), stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+            if process.returncode != 0:
+                logger.info(f'wkhtmltopdf reported errors while converting a batch: {process.stderr.decode("utf-8", "replace")}')
+
+            results: List[Union[bytes, Exception]] = []
+            for html, outPath in zip(htmls, outPaths):
+                try:
+                    with open(outPath, 'rb') as f:
+                        data = f.read()
+                except FileNotFoundError:
+                    data = b''
+
+                if _isPdf(data):
+                    results.append(data)
+                else:
+                    # Convert the body on its own, both to get the error for
+                    # it and in case something else in the batch caused the
+                    # process to stop early.
+                    try:
+                        results.append(self.render(html))
+                    except Exception as e:
+                        results.append(e)
+
+        return results
+
+    def render(self, html: bytes) -> bytes:
+        """
+        Converts the HTML to PDF.
+
+        :raises WKError: Something went wrong in creating the PDF body.
+        """
+        processArgs = [self.__wkPath, *self.__wkOptions, '-', '-']
+        # Log the arguments.
+        logger.info(f'Converting to PDF with the following arguments: {processArgs}')
+
+        # We call the program to convert the html, but give tell it the data
+        # will go in and come out through stdin and stdout, respectively. This
+        # way we don't have to write temporary files to the disk.
+        process = subprocess.run(processArgs, input = html, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+
+        # If it errored, throw it as an exception.
+        if process.returncode != 0:
+            raise WKError(process.stderr.decode('utf-8'))
+
+        return process.stdout
+
+    def renderBatch(self, htmls: Sequence[bytes]) -> List[Union[bytes, Exception]]:
+        if not htmls:
+            return []
+
+        # Spread the bodies across as many processes as are allowed.
+        size = min(self.__batchSize, math.ceil(len(htmls) / self.__maxProcesses))
+        chunks = [htmls[x:x + size] for x in range(0, len(htmls), size)]
+        if len(chunks) == 1:
+            return self.__renderChunk(chunks[0])
+
+        with concurrent.futures.ThreadPoolExecutor(min(len(chunks), self.__maxProcesses)) as executor:
+            return [result for results in executor.map(self.__renderChunk, chunks) for result in results]
+
+    @property
+    def batchSize(self) -> int:
+        """
+        The maximum number of bodies to give to a single process.
+        """
+        return self.__batchSize
+
+    @property
+    def maxProcesses(self) -> int:
+        """
+        The maximum number of processes to run at once.
+        """
+        return self.__maxProcesses
+
+    @property
+    def wkOptions(self) -> List[Union[str, bytes]]:
+        """
+        The additional options given to wkhtmltopdf.
+        """
+        return self.__wkOptions
+
+    @property
+    def wkPath(self) -> str:
+        """
+        The path to the wkhtmltopdf executable.
+        """
+        return self.__wkPath
+
+
+class PdfBatch:
+    """
+    Collects HTML bodies to convert to PDF together.
+
+    When given to :meth:`MessageBase.save` with the ``pdfBatch`` option, the
+    body of the message is added to the batch instead of being converted right
+    away, and the PDF file is only written when :meth:`flush` is called.
+    """
+
+    def __init__(self, backend: Optional[PdfBackend] = None):
+        """
+        :param backend: The backend to render with. If not specified, a
+            :class:`WkHtmlToPdfBackend` with the default options is used.
+        """
+        self.__backend = backend or WkHtmlToPdfBackend()
+        self.__pending: List[Tuple[bytes, pathlib.Path]] = []
+
+    def __len__(self) -> int:
+        return len(self.__pending)
+
+    def add(self, html: bytes, path: Union[str, os.PathLike]) -> None:
+        """
+        Adds the HTML to the batch, to be written to :param path: as a PDF.
+        """
+        self.__pending.append((html, pathlib.Path(path)))
+
+    def flush(self) -> List[Tuple[pathlib.Path, Exception]]:
+        """
+        Renders everything in the batch and writes the PDF files.
+
+        Returns a list of the paths that could not be written along with the
+        exception for each. Nothing is written for those paths.
+        """
+        pending, self.__pending = self.__pending, []
+        if not pending:
+            return []
+
+        failed = []
+        results = self.__backend.renderBatch([html for html, _ in pending])
+        for (_, path), result in zip(pending, results):
+            if isinstance(result, Exception):
+                failed.append((path, result))
+                continue
+            try:
+                with open(path, 'wb') as f:
+                    f.write(result)
+            except Exception as e:
+                failed.append((path, e))
+
+        return failed
+
+    @property
+    def backend(self) -> PdfBackend:
+        """
+        The backend used to render the batch.
+        """
+        return self.__backend
@@ -144,7 +144,11 @@ class FixedLengthProp(PropBase):
 
     def __init__(self, data: bytes):
         super().__init__(data)
-        self.__value = self._parseType(self.type, data[8:], data)
+        # The value is only parsed the first time it is accessed, as most
+        # properties are never read.
+        self.__raw = data
+        self.__parsed = False
+        self.__value = None
 
     def _parseType(self, _type: int, stream: bytes, raw: bytes) -> Any:
         """
@@ -256,6 +260,22 @@ class FixedLengthProp(PropBase):
 
         return constants.st.ST_PROP_BASE.pack(self.type, self.propertyID, self.flags) + value
 
+    @property
+    def filetime(self) -> int:
+        """
+        The raw FILETIME value of a PtypTime property as an int, without
+        converting it to a ``datetime``.
+
+        This is the number of 100 nanosecond intervals since January 1, 1601.
+
+        :raises TypeError: The property is not of type 0x0040.
+        """
+        if self.type != 0x0040:
+            raise TypeError(f'Property of type 0x{self.type:04X} does not have a filetime.')
+        if self.__raw is not None:
+            return constants.st.ST_LE_UI64.unpack(self.__raw[8:])[0]
+        return constants.st.ST_LE_UI64.unpack(self.toBytes()[8:])[0]
+
     @property
     def signedValue(self) -> Any:
         """
@@ -292,6 +312,9 @@ class FixedLengthProp(PropBase):
         """
         Property value.
         """
+        if not self.__parsed:
+            self.__value = self._parseType(self.type, self.__raw[8:], self.__raw)
+            self.__parsed = True
         return self.__value
 
     @value.setter
@@ -354,6 +377,9 @@ class FixedLengthProp(PropBase):
                 raise TypeError(f':property value: MUST be bool when type is 0x{self.type:04X}.')
 
         self.__value = value
+        self.__parsed = True
+        # The original data no longer matches the value.
+        self.__raw = None
 
 
 
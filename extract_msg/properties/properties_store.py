@@ -6,6 +6,7 @@ __all__ = [
 ]
 
 
+import array
 import copy
 import datetime
 import logging
@@ -19,7 +20,6 @@ from .. import constants
 from ..enums import PropertiesType
 from ..exceptions import NotWritableError
 from .prop import createProp, FixedLengthProp, PropBase
-from ..utils import divide
 
 
 logger = logging.getLogger(__name__)
@@ -52,7 +52,13 @@ class PropertiesStore:
         self.__type = type_
 
         # Setup early variables.
-        self.__props: Dict[str, PropBase] = {}
+        # Properties are only turned into PropBase instances when they are
+        # accessed. Until then, the value here is the index of the property in
+        # the tag, flag, and value arrays.
+        self.__props: Dict[str, Union[PropBase, int]] = {}
+        self.__tags = array.array('I')
+        self.__flags = array.array('I')
+        self.__values = array.array('Q')
         # This maps short IDs to all properties that use that ID. More than one
         # property with the same ID but a different type may exist.
         self.__idMapping: Dict[str, List[str]] = {}
@@ -90,19 +96,30 @@ class PropertiesStore:
             self.__nrid, self.__naid, self.__rc, self.__ac = constants.st.ST_PROPSTORE_HEADER.unpack(data[:24])
         else:
             skip = 8
-        streams = divide(self.__rawData[skip:], 16)
-        for st in streams:
-            if len(st) == 16:
-                prop = createProp(st)
-                self.__props[prop.name] = prop
-
-                # Add the ID to our mapping list.
-                id_ = prop.name[:4]
-                if id_ not in self.__idMapping:
-                    self.__idMapping[id_] = []
-                self.__idMapping[id_].append(prop.name)
+        # Unpack every entry in one pass instead of creating the property
+        # objects now.
+        end = skip + max(len(data) - skip, 0) // 16 * 16
+        if end < len(data):
+            logger.warning(f'Found data at the end of the properties stream that was not 16 bytes: {data[end:]}. Ignoring.')
+        if end > skip:
+            tags, flags, values = zip(*constants.st.ST_PROP_ENTRY.iter_unpack(memoryview(data)[skip:end]))
+            self.__tags.extend(tags)
+            self.__flags.extend(flags)
+            self.__values.extend(values)
+
+        props = self.__props
+        idMapping = self.__idMapping
+        for index, tag in enumerate(self.__tags):
+            name = f'{tag:08X}'
+            # If a name is somehow duplicated, the last one is used but the
+            # position of the first is kept, the same as a dict would.
+            props[name] = index
+
+            # Add the ID to our mapping list.
+            if (ids := idMapping.get(name[:4])) is None:
+                idMapping[name[:4]] = [name]
             else:
-                logger.warning(f'Found stream from divide that was not 16 bytes: {st}. Ignoring.')
+                ids.append(name)
         self.__isError = False
 
     def __bytes__(self) -> bytes:
@@ -135,7 +152,7 @@ class PropertiesStore:
 
     def __getitem__(self, key: Union[str, int]) -> PropBase:
         if (found := self._mapId(key)):
-            return self.__props.__getitem__(found)
+            return self.__getProp(found)
         raise KeyError(key)
 
     def __iter__(self) -> Iterator[str]:
@@ -148,8 +165,30 @@ class PropertiesStore:
         return len(self.__props)
 
     def __repr__(self) -> str:
+        self.__loadAll()
         return self.__props.__repr__()
 
+    def __getProp(self, name: str) -> PropBase:
+        """
+        Gets the property with the specified name, creating the instance for it
+        if it hasn't been accessed yet.
+
+        :raises KeyError: The property does not exist.
+        """
+        prop = self.__props[name]
+        if isinstance(prop, int):
+            prop = createProp(constants.st.ST_PROP_ENTRY.pack(self.__tags[prop], self.__flags[prop], self.__values[prop]))
+            self.__props[name] = prop
+        return prop
+
+    def __loadAll(self) -> None:
+        """
+        Creates the instances for all properties that haven't been accessed.
+        """
+        for name, prop in self.__props.items():
+            if isinstance(prop, int):
+                self.__getProp(name)
+
     def _mapId(self, id_: Union[int, str]) -> str:
         """
         Converts an input into an appropriate property ID.
@@ -213,8 +252,8 @@ class PropertiesStore:
         :returns: The property, or the value of :param default: if the property
             could not be found.
         """
-        if (name := self._mapId(name)):
-            return self.__props.get(name, default)
+        if (name := self._mapId(name)) and name in self.__props:
+            return self.__getProp(name)
         else:
             return default
 
@@ -263,6 +302,7 @@ class PropertiesStore:
             raise ValueError('Property name must be an int less than 0x100000000, a 4 character hex string, or an 8 character hex string.')
 
     def items(self) -> Iterable[Tuple[str, PropBase]]:
+        self.__loadAll()
         return self.__props.items()
 
     def keys(self) -> Iterable[str]:
@@ -315,13 +355,14 @@ class PropertiesStore:
                     ret += b'\x00' * 8
 
             # Convert all the properties to bytes.
-            ret += b''.join(bytes(prop) for prop in self.__props.values())
+            ret += b''.join(bytes(prop) for prop in self.values())
 
             return ret
         else:
             return self.__rawData
 
     def values(self) -> Iterable[PropBase]:
+        self.__loadAll()
         return self.__props.values()
 
     items.__doc__ = dict.items.__doc__
@@ -440,6 +481,7 @@ class PropertiesStore:
         """
         Returns a copy of the internal properties dict.
         """
+        self.__loadAll()
         return copy.deepcopy(self.__props)
 
     @property
@@ -0,0 +1,185 @@
+"""
+Caches for the data generated from the RTF body of a message.
+
+Decompressing and deencapsulating RTF can take a while, and the same RTF body
+often shows up many times (the same MSG file opened more than once, or the same
+reply chain quoted in many messages). Giving an instance of one of these to
+:class:`MessageBase` with the ``rtfCache`` option allows that work to be
+shared.
+"""
+
+__all__ = [
+    'DiskRtfCache',
+    'MemoryRtfCache',
+    'RtfCache',
+]
+
+
+import abc
+import collections
+import os
+import pathlib
+import tempfile
+import threading
+
+from typing import Optional, OrderedDict, Union
+
+
+class RtfCache(abc.ABC):
+    """
+    Base class for caches of data generated from RTF bodies.
+
+    Keys are strings made up of letters, numbers, ``.``, and ``-``, and values
+    are bytes. An empty value is valid and should be returned as such. The
+    same instance may be used by many MSG files at once, including from
+    different threads.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the value for the key, or ``None`` if it is not in the cache.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Adds the value to the cache. The cache is free to discard it.
+        """
+
+
+class MemoryRtfCache(RtfCache):
+    """
+    An in memory cache that discards the least recently used values once the
+    total size of the values is more than the limit.
+    """
+
+    def __init__(self, maxBytes: int = 64 * 1024 * 1024, backing: Optional[RtfCache] = None):
+        """
+        :param maxBytes: The maximum total size of the values to keep. Values
+            larger than this are never kept.
+        :param backing: Optional, another cache (such as a
+            :class:`DiskRtfCache`) to check when a key is not in this one. New
+            values are added to both.
+        """
+        super().__init__()
+        self.__maxBytes = maxBytes
+        self.__backing = backing
+        self.__data: OrderedDict[str, bytes] = collections.OrderedDict()
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def __add(self, key: str, value: bytes) -> None:
+        """
+        Adds the value to memory, discarding old values as needed. The lock
+        must be held.
+        """
+        if len(value) > self.__maxBytes:
+            return
+        if (old := self.__data.pop(key, None)) is not None:
+            self.__size -= len(old)
+        self.__data[key] = value
+        self.__size += len(value)
+        while self.__size > self.__maxBytes:
+            self.__size -= len(self.__data.popitem(False)[1])
+
+    def clear(self) -> None:
+        """
+        Removes everything from memory. The backing cache is not affected.
+        """
+        with self.__lock:
+            self.__data.clear()
+            self.__size = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.__lock:
+            if (value := self.__data.get(key)) is not None:
+                self.__data.move_to_end(key)
+                return value
+
+        if self.__backing is not None and (value := self.__backing.get(key)) is not None:
+            with self.__lock:
+                self.__add(key, value)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        value = bytes(value)
+        with self.__lock:
+            self.__add(key, value)
+        if self.__backing is not None:
+            self.__backing.set(key, value)
+
+    @property
+    def backing(self) -> Optional[RtfCache]:
+        """
+        The cache used when a key is not in memory.
+        """
+        return self.__backing
+
+    @property
+    def maxBytes(self) -> int:
+        """
+        The maximum total size of the values kept in memory.
+        """
+        return self.__maxBytes
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the values currently in memory.
+        """
+        return self.__size
+
+
+class DiskRtfCache(RtfCache):
+    """
+    A cache that stores each value as a file in a directory, allowing it to be
+    shared between processes and runs.
+
+    Nothing is ever removed from the directory by this class.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        :param path: The directory to store the values in. It is created if it
+            does not exist.
+        """
+        super().__init__()
+        self.__path = pathlib.Path(path)
+        self.__path.mkdir(parents = True, exist_ok = True)
+
+    def __getPath(self, key: str) -> pathlib.Path:
+        # Keys are controlled by us, but make sure they can't go anywhere
+        # outside of the directory regardless.
+        if not key or key[0] == '.' or '/' in key or '\\' in key:
+            raise ValueError(f'Invalid cache key {key!r}.')
+        return self.__path / key
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.__getPath(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        path = self.__getPath(key)
+        # Write to a temporary file first so that other processes never see
+        # a partially written value.
+        fd, tempPath = tempfile.mkstemp(dir = self.__path, prefix = '.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(value)
+            os.replace(tempPath, path)
+        except BaseException:
+            try:
+                os.unlink(tempPath)
+            except OSError:
+                pass
+            raise
+
+    @property
+    def path(self) -> pathlib.Path:
+        """
+        The directory the values are stored in.
+        """
+        return self.__path
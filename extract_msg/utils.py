@@ -29,6 +29,7 @@ __all__ = [
     'inputToMsgPath',
     'inputToString',
     'isEncapsulatedRtf',
+    'iterBase64',
     'makeWeakRef',
     'msgPathToString',
     'parseType',
@@ -37,6 +38,7 @@ __all__ = [
     'rtfSanitizeHtml',
     'rtfSanitizePlain',
     'setupLogging',
+    'stripHtml',
     'stripRtf',
     'tryGetMimetype',
     'unsignedToSignedInt',
@@ -49,6 +51,8 @@ __all__ = [
 
 
 import argparse
+import base64
+import codecs
 import collections
 import copy
 import datetime
@@ -69,22 +73,20 @@ import sys
 import weakref
 import zipfile
 
-import bs4
 import olefile
-import tzlocal
 
-from html import escape as htmlEscape
+from html import escape as htmlEscape, unescape as htmlUnescape
 from typing import (
-        Any, AnyStr, Callable, Dict, Iterable, List, Optional, Sequence,
-        SupportsBytes, TypeVar, TYPE_CHECKING, Union
+        Any, AnyStr, Callable, Dict, Iterable, Iterator, List, Optional,
+        Sequence, SupportsBytes, TypeVar, TYPE_CHECKING, Union
     )
 
 from . import constants
 from .enums import AttachmentType
 from .exceptions import (
-        ConversionError, DependencyError, ExecutableNotFound,
-        IncompatibleOptionsError, InvalidPropertyIdError, TZError,
-        UnknownTypeError
+        ConversionError, DependencyError, EmbeddedLimitError,
+        EmbeddedMsgError, ExecutableNotFound, IncompatibleOptionsError,
+        InvalidPropertyIdError, TZError, UnknownTypeError
     )
 
 
@@ -190,9 +192,8 @@ def cloneOleFile(sourcePath, outputPath) -> None:
 
     with olefile.OleFileIO(sourcePath) as f:
         writer = OleWriter()
-        writer.fromOleFile(f)
-
-    writer.write(outputPath)
+        writer.fromOleFile(f, streamData = True)
+        writer.write(outputPath)
 
 
 def createZipOpen(func) -> Callable:
@@ -354,6 +355,8 @@ def fromTimeStamp(stamp: float) -> datetime.datetime:
     """
     Returns a ``datetime`` from the UTC timestamp given the current timezone.
     """
+    import tzlocal
+
     try:
         tz = tzlocal.get_localzone()
     except Exception:
@@ -420,6 +423,9 @@ def getCommandArgs(args: Sequence[str]) -> argparse.Namespace:
     # --prepared-html
     parser.add_argument('--prepared-html', dest='preparedHtml', action='store_true',
                         help='When used in conjunction with --html, sets whether the HTML output should be prepared for embedded attachments.')
+    # --link-attachments
+    parser.add_argument('--link-attachments', dest='linkAttachments', action='store_true',
+                        help='When used in conjunction with --prepared-html, images in the HTML will link to the saved attachment files instead of having their data embedded.')
     # --charset
     parser.add_argument('--charset', dest='charset', default='utf-8',
                         help='Character set to use for the prepared HTML in the added tag. (Default: utf-8)')
@@ -474,6 +480,18 @@ def getCommandArgs(args: Sequence[str]) -> argparse.Namespace:
     # --progress
     parser.add_argument('--progress', dest='progress', action='store_true',
                         help='Shows what file the program is currently working on during it\'s progress.')
+    # -j, --jobs N
+    parser.add_argument('-j', '--jobs', dest='jobs', type=int, default=1,
+                        help='Number of worker processes to use for saving MSG files in parallel. When used with --zip, all writes to the zip file are still done by the main process. (Default: 1)')
+    # --pdf-batch N
+    parser.add_argument('--pdf-batch', dest='pdfBatch', type=int, default=0,
+                        help='When saving as PDF, converts the bodies in batches of up to N messages for each wkhtmltopdf process instead of starting a process for every message. With this option, --jobs sets the number of wkhtmltopdf processes to run at once. Incompatible with --zip.')
+    # --html-parser NAME
+    parser.add_argument('--html-parser', dest='htmlParser', default='html.parser',
+                        help='The parser for BeautifulSoup to use when preparing HTML bodies, such as lxml if it is installed. Faster parsers make a large difference for big HTML bodies. (Default: html.parser)')
+    # --rtf-cache DIR
+    parser.add_argument('--rtf-cache', dest='rtfCache',
+                        help='Directory to cache decompressed and deencapsulated RTF bodies in, so that they can be reused by later runs and by other MSG files with the same RTF body.')
     # -s, --stdout
     inputType.add_argument('-s', '--stdin', dest='stdin', action='store_true',
                         help='Read file from stdin (only works with one file at a time).')
@@ -556,6 +574,15 @@ def getCommandArgs(args: Sequence[str]) -> argparse.Namespace:
     if options.noFolders and not options.attachmentsOnly:
         raise ValueError('--no-folders requires the --attachments-only option.')
 
+    if options.jobs < 1:
+        raise ValueError('--jobs must be at least 1.')
+
+    if options.pdfBatch < 0:
+        raise ValueError('--pdf-batch must not be negative.')
+
+    if options.pdfBatch and options.zip:
+        raise IncompatibleOptionsError('--pdf-batch is not compatible with --zip.')
+
     return options
 
 
@@ -684,6 +711,28 @@ def isEncapsulatedRtf(inp: bytes) -> bool:
     return b'\\fromhtml' in inp
 
 
+def iterBase64(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Encodes data that is given in chunks as base64, yielding the encoded data
+    in chunks.
+
+    The result is the same as encoding all of the data at once, but only one
+    chunk of the data needs to be in memory at a time.
+    """
+    remainder = b''
+    for chunk in chunks:
+        if remainder:
+            chunk = remainder + chunk
+        # Only whole groups of 3 bytes can be encoded without padding.
+        end = len(chunk) - len(chunk) % 3
+        remainder = bytes(chunk[end:])
+        if end:
+            yield base64.b64encode(chunk[:end])
+
+    if remainder:
+        yield base64.b64encode(remainder)
+
+
 def makeWeakRef(obj: Optional[_T]) -> Optional[weakref.ReferenceType[_T]]:
     """
     Attempts to return a weak reference to the object, returning None if not
@@ -1014,6 +1063,38 @@ def setupLogging(defaultPath = None, defaultLevel = logging.WARN, logfile = None
     return True
 
 
+def stripHtml(html: bytes, encoding: str = 'utf-8') -> str:
+    """
+    Converts HTML to an approximation of its text without parsing it.
+
+    Tags are removed, with the ones that usually start a new line replaced
+    by one, and the contents of comments, scripts, styles, and the head are
+    removed entirely. A comment or one of those elements that is never closed
+    removes the rest of the HTML, as it would in a browser. This is much faster
+    than using BeautifulSoup and takes linear time even for malformed HTML,
+    but the result is only suitable for things like search indexing.
+
+    :param html: The HTML to strip.
+    :param encoding: The encoding to use if the HTML does not declare one with
+        a meta tag. Invalid data is replaced instead of raising an exception.
+    """
+    if (match := constants.re.HTML_META_CHARSET.search(html)):
+        try:
+            encoding = codecs.lookup(match.group(1).decode('ascii')).name
+        except LookupError:
+            pass
+
+    text = html.decode(encoding, 'replace')
+    text = constants.re.HTML_STRIP_HIDDEN.sub('', text)
+    # Whitespace in the HTML is only a separator, so it is all changed to
+    # spaces before adding the line breaks.
+    text = ' '.join(text.split())
+    text = constants.re.HTML_STRIP_BREAK.sub('\n', text)
+    text = htmlUnescape(constants.re.HTML_STRIP_TAG.sub('', text)).replace('\xA0', ' ')
+
+    return constants.re.HTML_STRIP_LINES.sub('\n', text).strip()
+
+
 def stripRtf(rtfBody: bytes) -> bytes:
     """
     Cleans up RTF before sending it to RTFDE.
@@ -1126,7 +1207,8 @@ def unwrapMsg(msg: MSGFile) -> Dict[str, List]:
     including embedded MSG files, "embedded" for attachments representing
     embedded MSG files, "msg" for all MSG files (including the original in the
     first index), and "raw_attachments" for raw attachments from signed
-    messages.
+    messages. Embedded MSG files that cannot be opened are put in
+    "attachments" instead.
     """
     from .msg_classes import MessageSignedBase
 
@@ -1159,14 +1241,19 @@ def unwrapMsg(msg: MSGFile) -> Dict[str, List]:
             if att.type not in (AttachmentType.MSG, AttachmentType.SIGNED_EMBEDDED):
                 attachments.append(att)
             else:
+                try:
+                    data = att.data
+                except (EmbeddedLimitError, EmbeddedMsgError):
+                    attachments.append(att)
+                    continue
                 # Here we do two things. The first is we store it to the output
                 # so we can return it. The second is we add it to the processing
                 # list. The reason this is two steps is because we need to be
                 # able to remove items from the processing list, but can't
                 # do that from the output.
                 embedded.append(att)
-                msgFiles.append(att.data)
-                toProcess.append(att.data)
+                msgFiles.append(data)
+                toProcess.append(data)
         if isinstance(currentItem, MessageSignedBase):
             raw += currentItem.rawAttachments
 
@@ -1314,6 +1401,8 @@ def validateHtml(html: bytes, encoding: Optional[str]) -> bool:
     To be valid, the HTML must, at minimum, contain an ``<html>`` tag, a
     ``<body>`` tag, and closing tags for each.
     """
+    import bs4
+
     bs = bs4.BeautifulSoup(html, 'html.parser', from_encoding = encoding)
     if not bs.find('html') or not bs.find('body'):
         return False
@@ -1,16 +1,29 @@
 __all__ = [
     'AttachmentTests',
     'CommandLineTests',
+    'EncodingTests',
+    'HtmlTests',
+    'ImportTests',
+    'OleWriterBenchmarks',
     'OleWriterEditingTests',
     'OleWriterExportTests',
+    'PdfTests',
     'PropTests',
+    'RtfTests',
     'UtilTests',
     'ValidationTests',
 ]
 
 from .attachment_tests import AttachmentTests
 from .cmd_line_tests import CommandLineTests
-from .ole_writer_tests import OleWriterEditingTests, OleWriterExportTests
+from .encoding_tests import EncodingTests
+from .html_tests import HtmlTests
+from .import_tests import ImportTests
+from .ole_writer_tests import (
+        OleWriterBenchmarks, OleWriterEditingTests, OleWriterExportTests
+    )
+from .pdf_tests import PdfTests
 from .prop_tests import PropTests
+from .rtf_tests import RtfTests
 from .util_tests import UtilTests
 from .validation_tests import ValidationTests
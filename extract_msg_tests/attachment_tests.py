@@ -3,15 +3,28 @@ __all__ = [
 ]
 
 
+import io
+import mmap
+import os
+import struct
+import tempfile
 import unittest
+import zipfile
+
+import olefile
 
 from typing import Callable, Type, TypeVar
 
 from .constants import TEST_FILE_DIR
-from extract_msg import enums, MSGFile, openMsg, PropertiesStore
+from .synthetic import createNestedMsg
+from extract_msg import enums, MSGFile, OleWriter, openMsg, PropertiesStore
 from extract_msg.attachments import (
         Attachment, AttachmentBase, BrokenAttachment, UnsupportedAttachment
     )
+from extract_msg.exceptions import (
+        EmbeddedLimitError, EmbeddedMsgError, StandardViolationError
+    )
+from extract_msg.utils import unwrapMsg
 
 
 _T = TypeVar('_T', bound = AttachmentBase)
@@ -33,6 +46,161 @@ class AttachmentTests(unittest.TestCase):
                 with self.assertRaises(NotImplementedError):
                     att.getFilename()
 
+    def testEmbedded(self):
+        data = createNestedMsg(3)
+        with openMsg(data) as msg, olefile.OleFileIO(data) as ole:
+            allEntries = ole.listdir(True, True)
+            current = msg
+            for depth in range(3):
+                embedded = [att for att in current.attachments if att.type is enums.AttachmentType.MSG]
+                self.assertEqual(len(embedded), 1)
+                # Embedded MSG files should only be opened when needed.
+                self.assertFalse(embedded[0].dataLoaded)
+                current = embedded[0].data
+                self.assertTrue(embedded[0].dataLoaded)
+                prefix = current.prefixList
+                with self.subTest(depth = depth):
+                    self.assertEqual(len(prefix), 2 * (depth + 1))
+                    # The directory listing of the embedded MSG file should
+                    # match what olefile lists for the same location.
+                    expected = [x for x in allEntries if len(x) > len(prefix) and x[:len(prefix)] == prefix]
+                    self.assertEqual(current.listDir(True, True), expected)
+                    self.assertEqual(current.listDir(True, True, False), [x[len(prefix):] for x in expected])
+                    self.assertEqual(current.subject, msg.subject)
+                    self.assertEqual(current.body, msg.body)
+
+    def testEmbeddedLimits(self):
+        data = createNestedMsg(3)
+        with openMsg(data, maxEmbeddedDepth = 2) as msg:
+            second = msg.attachments[2].data.attachments[2].data
+            with self.assertRaises(EmbeddedLimitError):
+                second.attachments[2].data
+            self.assertEqual(msg.embeddedMsgCount, 2)
+            # Saving should skip the embedded MSG file instead of failing.
+            self.assertEqual(second.attachments[2].save(), (enums.SaveType.NONE, None))
+
+        with openMsg(data, maxEmbeddedMsgs = 1) as msg:
+            first = msg.attachments[2].data
+            with self.assertRaises(EmbeddedLimitError):
+                first.attachments[2].data
+
+    def testEmbeddedBroken(self):
+        # Create embedded MSG files with a corrupt properties stream and with
+        # a missing one.
+        path = ['__attach_version1.0_#00000010', '__substg1.0_3701000D', '__properties_version1.0']
+        writer = OleWriter()
+        with openMsg(createNestedMsg(1), delayAttachments = True) as msg:
+            writer.fromMsg(msg)
+        writer.editEntry(path, data = b'\x01\x02\x03')
+        writer.write(corrupt := io.BytesIO())
+        writer.deleteEntry(path)
+        writer.write(missing := io.BytesIO())
+
+        # Without the error behavior, the original exception is raised.
+        with openMsg(corrupt.getvalue()) as msg:
+            with self.assertRaises(struct.error):
+                msg.attachments[2].data
+
+        with openMsg(corrupt.getvalue(), errorBehavior = enums.ErrorBehavior.ATTACH_BROKEN) as msg:
+            att = msg.attachments[2]
+            with self.assertLogs('extract_msg.attachments.emb_msg_att', 'ERROR'):
+                with self.assertRaises(EmbeddedMsgError) as context:
+                    att.data
+            self.assertIsInstance(context.exception.__cause__, struct.error)
+            self.assertFalse(att.dataLoaded)
+            # Saving should handle it like a broken attachment.
+            with self.assertRaises(NotImplementedError):
+                att.save()
+            self.assertEqual(att.save(skipNotImplemented = True), (enums.SaveType.NONE, None))
+            with tempfile.TemporaryDirectory() as tempDir:
+                msg.save(customPath = tempDir, skipNotImplemented = True)
+            self.assertIn(att, unwrapMsg(msg)['attachments'])
+
+        # Standards violations are only ignored with their own error behavior,
+        # which lets the embedded MSG file open.
+        with openMsg(missing.getvalue(), errorBehavior = enums.ErrorBehavior.ATTACH_BROKEN) as msg:
+            with self.assertRaises(StandardViolationError):
+                msg.attachments[2].data
+        with openMsg(missing.getvalue(), errorBehavior = enums.ErrorBehavior.STANDARDS_VIOLATION) as msg:
+            self.assertEqual(msg.attachments[2].data.subject, msg.subject)
+
+    def testExistsTypedProperty(self):
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            self.assertEqual(msg.existsTypedProperty('1000'), (True, 1))
+            for att in msg.attachments:
+                self.assertEqual(att.existsTypedProperty('3701'), (True, 1))
+                self.assertEqual(att.existsTypedProperty('3701', '0102'), (True, 1))
+                self.assertEqual(att.existsTypedProperty('3701', '000D'), (False, 0))
+                # This exists on the message, but not the attachment.
+                self.assertEqual(att.existsTypedProperty('1000'), (False, 0))
+
+        # Each stream of a multiple property is counted, as is the storage of
+        # an embedded MSG file.
+        writer = OleWriter()
+        with openMsg(createNestedMsg(1), delayAttachments = True) as msg:
+            writer.fromMsg(msg)
+        writer.addEntry('__substg1.0_8FFF101F', bytes(8))
+        writer.addEntry('__substg1.0_8FFF101F-00000000', b'a\x00')
+        writer.addEntry('__substg1.0_8FFF101F-00000001', b'b\x00')
+        writer.write(data := io.BytesIO())
+        with openMsg(data.getvalue()) as msg:
+            self.assertEqual(msg.existsTypedProperty('8FFF'), (True, 3))
+            self.assertEqual(msg.existsTypedProperty('8FFF', _type = '101F'), (True, 3))
+            self.assertEqual(msg.existsTypedProperty('8FFF', _type = '001F'), (False, 0))
+            self.assertEqual(msg.attachments[2].existsTypedProperty('3701', _type = '000D'), (True, 1))
+
+    def testIterStream(self):
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            for att in msg.attachments:
+                expected = att.getStream('__substg1.0_37010102')
+                # Use a chunk size that doesn't line up with the sector size.
+                chunks = list(att.iterStream('__substg1.0_37010102', chunkSize = 5000))
+                self.assertGreater(len(chunks), 1)
+                self.assertEqual(b''.join(chunks), expected)
+                self.assertEqual(att.getStreamSize('__substg1.0_37010102'), len(expected))
+                self.assertIsNone(att.getStreamSize('__substg1.0_FFFF0102'))
+            with self.assertRaises(OSError):
+                msg.getStreamSize(msg.attachments[0].dir)
+            self.assertIsNone(msg.iterStream('__substg1.0_FFFF0102'))
+
+            # Make sure saving to a zip file streams the same data.
+            out = io.BytesIO()
+            with zipfile.ZipFile(out, 'w') as _zip:
+                for att in msg.attachments:
+                    att.save(zip = _zip)
+                for att in msg.attachments:
+                    self.assertEqual(_zip.read(att.getFilename()), att.data)
+
+    def testMmap(self):
+        path = TEST_FILE_DIR / 'unicode.msg'
+        with openMsg(path) as normal:
+            with openMsg(path, mmap = True) as mapped:
+                for entry in normal.listDir():
+                    self.assertEqual(mapped.getStream(entry), normal.getStream(entry))
+                    self.assertEqual(mapped.getStreamView(entry), normal.getStream(entry))
+
+                for att in mapped.attachments:
+                    for chunk in att.iterStream('__substg1.0_37010102'):
+                        self.assertIsInstance(chunk, memoryview)
+                        chunk.release()
+                    self.assertEqual(att.data, normal.attachments[mapped.attachments.index(att)].data)
+
+        # Views that are still alive should not stop the file from closing.
+        msg = openMsg(path, mmap = True)
+        expected = msg.attachments[0].data
+        view = msg.getStreamView(['__attach_version1.0_#00000000', '__substg1.0_37010102'])
+        self.assertIsInstance(view.obj, mmap.mmap)
+        with self.assertLogs('extract_msg.msg_classes.msg', 'WARNING'):
+            msg.close()
+        self.assertEqual(view, expected)
+        view.release()
+
+        # Bytes can be used with the option as well.
+        with open(path, 'rb') as f:
+            data = f.read()
+        with openMsg(data, mmap = True) as msg:
+            self.assertEqual(msg.attachments[0].data, msg.getStream(['__attach_version1.0_#00000000', '__substg1.0_37010102']))
+
     def testNormal(self):
         # Just covers a bit of the attachment class.
         with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
@@ -66,6 +234,38 @@ class AttachmentTests(unittest.TestCase):
                 self.assertIs(att.dataType, bytes)
                 self.assertIsInstance(att.data, bytes)
 
+    def testReleaseData(self):
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            with tempfile.TemporaryDirectory() as tempDir:
+                for att in msg.attachments:
+                    # Reading the metadata should not read the data.
+                    att.name
+                    self.assertIs(att.dataType, bytes)
+                    self.assertFalse(att.dataLoaded)
+                    expected = att.getStream('__substg1.0_37010102')
+                    self.assertEqual(att.data, expected)
+                    self.assertTrue(att.dataLoaded)
+                    att.save(customPath = tempDir, releaseData = True)
+                    self.assertFalse(att.dataLoaded)
+                    with open(os.path.join(tempDir, att.getFilename()), 'rb') as f:
+                        self.assertEqual(f.read(), expected)
+                    # The data should be reloaded after being released.
+                    self.assertEqual(att.data, expected)
+                    self.assertTrue(att.dataLoaded)
+                    att.releaseData()
+                    self.assertFalse(att.dataLoaded)
+
+    def testSaveWithoutLoading(self):
+        # Saving data that was never loaded streams it from the MSG file and
+        # leaves it unloaded.
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            with tempfile.TemporaryDirectory() as tempDir:
+                for att in msg.attachments:
+                    att.save(customPath = tempDir)
+                    self.assertFalse(att.dataLoaded)
+                    with open(os.path.join(tempDir, att.getFilename()), 'rb') as f:
+                        self.assertEqual(f.read(), att.getStream('__substg1.0_37010102'))
+
     def testUnsupported(self):
         attFunction = _forceAttachmentType(UnsupportedAttachment)
         with openMsg(TEST_FILE_DIR / 'unicode.msg', initAttachment = attFunction) as msg:
@@ -0,0 +1,183 @@
+"""
+Benchmarks for the hot paths of extract_msg.
+
+The MSG files are generated with ``OleWriter`` so that each one has a
+controlled shape, which allows the results from different versions to be
+compared directly. Run with ``python -m extract_msg_tests.benchmarks``, using
+``--help`` to see the options.
+
+These are not run as part of the tests.
+"""
+
+__all__ = [
+    'BENCHMARKS',
+    'SHAPES',
+    'main',
+    'runBenchmarks',
+]
+
+
+import argparse
+import gc
+import io
+import json
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from extract_msg import openMsg, MSGFile
+from extract_msg_tests.synthetic import createMsg
+
+
+def _readProperties(msg: MSGFile, _) -> None:
+    for props in [msg.props] + [x.props for x in msg.attachments] + [x.props for x in msg.recipients]:
+        for prop in props.values():
+            getattr(prop, 'value', None)
+    msg.subject
+    msg.date
+    msg.sender
+    msg.to
+
+
+def _save(**kwargs) -> Callable[[MSGFile, pathlib.Path], Any]:
+    def func(msg: MSGFile, outDir: pathlib.Path) -> Any:
+        return msg.save(customPath = outDir, skipBodyNotFound = True, **kwargs)
+    return func
+
+
+def _saveZip(msg: MSGFile, outDir: pathlib.Path) -> None:
+    with zipfile.ZipFile(outDir / 'out.zip', 'w', zipfile.ZIP_DEFLATED) as _zip:
+        msg.save(zip = _zip, skipBodyNotFound = True)
+
+
+# Each benchmark is a tuple of whether the function takes an open MSG file
+# (which is opened outside of the measurement) and the function itself. If it
+# does not, the function is given the path to the MSG file instead. The second
+# argument is always a new, empty directory to write output to.
+BENCHMARKS: Dict[str, Tuple[bool, Callable[[Any, pathlib.Path], Any]]] = {
+    'open': (False, lambda path, _: openMsg(path).close()),
+    'properties': (True, _readProperties),
+    'body': (True, lambda msg, _: msg.body),
+    'htmlBody': (True, lambda msg, _: msg.htmlBody),
+    'rtfBody': (True, lambda msg, _: msg.rtfBody),
+    'save-text': (True, _save()),
+    'save-json': (True, _save(json = True)),
+    'save-html': (True, _save(html = True)),
+    'save-prepared-html': (True, _save(html = True, preparedHtml = True)),
+    'save-rtf': (True, _save(rtf = True)),
+    'save-pdf': (True, _save(pdf = True)),
+    'save-zip': (True, _saveZip),
+    'export': (True, lambda msg, _: msg.export(io.BytesIO())),
+}
+
+# The keyword arguments given to ``createMsg`` for each shape of MSG file. The
+# sizes are multiplied by the scale.
+SHAPES: Dict[str, Dict[str, int]] = {
+    'baseline': {},
+    'many-properties': {'properties': 4000},
+    'many-recipients': {'recipients': 500},
+    'large-attachment': {'attachmentSize': 20 * 1024 * 1024},
+    'deep-embedding': {'depth': 20},
+    'large-rtf': {'paragraphs': 5000},
+}
+
+
+def _measure(func: Callable[[Any, pathlib.Path], Any], takesMsg: bool, path: pathlib.Path, workDir: pathlib.Path, trace: bool) -> Tuple[float, int]:
+    """
+    Runs the benchmark once, returning the time it took and the peak memory
+    allocated during it. The peak is only measured if :param trace: is
+    ``True``, as tracing slows everything down.
+    """
+    outDir = pathlib.Path(tempfile.mkdtemp(dir = workDir))
+    msg = openMsg(path) if takesMsg else None
+    try:
+        gc.collect()
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        func(msg if takesMsg else path, outDir)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace else 0
+    finally:
+        if trace:
+            tracemalloc.stop()
+        if msg is not None:
+            msg.close()
+        shutil.rmtree(outDir, ignore_errors = True)
+
+    return elapsed, peak
+
+
+def runBenchmarks(shapes: Optional[List[str]] = None, benchmarks: Optional[List[str]] = None, repeat: int = 3, scale: float = 1.0, log: Callable[[str], None] = lambda _: None) -> List[Dict[str, Any]]:
+    """
+    Runs the benchmarks, returning a list of dicts of the results.
+
+    :param shapes: The names of the shapes to use. Defaults to all of them.
+    :param benchmarks: The names of the benchmarks to run. Defaults to all of
+        them.
+    :param repeat: The number of times to time each benchmark. The peak memory
+        is measured in one additional run.
+    :param scale: The amount to multiply the size of each shape by.
+    :param log: Function called with the results as they are found.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as workDir:
+        workDir = pathlib.Path(workDir)
+        for shape in (shapes or SHAPES):
+            kwargs = {key: max(int(value * scale), 1) for key, value in SHAPES[shape].items()}
+            path = workDir / f'{shape}.msg'
+            path.write_bytes(createMsg(**kwargs))
+
+            for name in (benchmarks or BENCHMARKS):
+                takesMsg, func = BENCHMARKS[name]
+                result = {
+                    'shape': shape,
+                    'benchmark': name,
+                    'size': path.stat().st_size,
+                }
+                try:
+                    times = [_measure(func, takesMsg, path, workDir, False)[0] for _ in range(repeat)]
+                    result['best'] = min(times)
+                    result['mean'] = sum(times) / len(times)
+                    result['peak'] = _measure(func, takesMsg, path, workDir, True)[1]
+                except Exception as e:
+                    result['error'] = f'{type(e).__name__}: {e}'
+
+                results.append(result)
+                if 'error' in result:
+                    log(f'{shape:<20} {name:<20} {result["error"]}')
+                else:
+                    log(f'{shape:<20} {name:<20} {result["best"] * 1000:>10.1f} {result["mean"] * 1000:>10.1f} {result["peak"] / 1048576:>10.2f}')
+
+    return results
+
+
+def main(argv: List[str] = sys.argv[1:]) -> None:
+    parser = argparse.ArgumentParser(description = 'Benchmarks for extract_msg.', prog = 'python -m extract_msg_tests.benchmarks')
+    parser.add_argument('--shape', dest = 'shapes', action = 'append', choices = list(SHAPES),
+                        help = 'A shape of MSG file to use. Can be used multiple times. Defaults to all of them.')
+    parser.add_argument('--benchmark', dest = 'benchmarks', action = 'append', choices = list(BENCHMARKS),
+                        help = 'A benchmark to run. Can be used multiple times. Defaults to all of them.')
+    parser.add_argument('--repeat', type = int, default = 3,
+                        help = 'The number of times to time each benchmark.')
+    parser.add_argument('--scale', type = float, default = 1.0,
+                        help = 'The amount to multiply the size of each shape by.')
+    parser.add_argument('--json', dest = 'jsonPath',
+                        help = 'A path to write the results to as JSON, for comparing between versions.')
+    args = parser.parse_args(argv)
+
+    print(f'{"shape":<20} {"benchmark":<20} {"best (ms)":>10} {"mean (ms)":>10} {"peak (MiB)":>10}')
+    results = runBenchmarks(args.shapes, args.benchmarks, args.repeat, args.scale, print)
+    if args.jsonPath:
+        with open(args.jsonPath, 'w') as f:
+            json.dump(results, f, indent = 4)
+
+
+if __name__ == '__main__':
+    main()
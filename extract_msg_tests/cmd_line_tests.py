@@ -3,9 +3,15 @@ __all__ = [
 ]
 
 
+import multiprocessing
 import subprocess
 import sys
+import tempfile
+import textwrap
 import unittest
+import zipfile
+
+from pathlib import Path
 
 from .constants import TEST_FILE_DIR, USER_TEST_DIR
 
@@ -28,6 +34,56 @@ class CommandLineTests(unittest.TestCase):
                 self.assertEqual(stdout1, stdout2)
                 self.assertEqual(stderr1, stderr2)
 
+    def testJobsZip(self):
+        # Include one of the files twice to make sure conflicts are resolved
+        # the same way as when saving sequentially.
+        paths = [str(x) for x in sorted(TEST_FILE_DIR.glob('*.msg'))]
+        paths.append(paths[0])
+        with tempfile.TemporaryDirectory() as tempDir:
+            sequential = Path(tempDir) / 'sequential.zip'
+            parallel = Path(tempDir) / 'parallel.zip'
+            # The second run adds to the zip files from the first one, which
+            # should also be handled the same way.
+            for _ in range(2):
+                subprocess.run([sys.executable, '-m', 'extract_msg', '--zip', str(sequential)] + paths, stdout = subprocess.PIPE, stderr = subprocess.PIPE, check = True)
+                subprocess.run([sys.executable, '-m', 'extract_msg', '--jobs', '2', '--zip', str(parallel)] + paths, stdout = subprocess.PIPE, stderr = subprocess.PIPE, check = True)
+
+            with zipfile.ZipFile(sequential) as zip1, zipfile.ZipFile(parallel) as zip2:
+                self.assertEqual(zip1.namelist(), zip2.namelist())
+                for info1, info2 in zip(zip1.infolist(), zip2.infolist()):
+                    with self.subTest(info1.filename):
+                        self.assertEqual(zip1.read(info1), zip2.read(info2))
+                        self.assertEqual(info1.external_attr, info2.external_attr)
+                        self.assertEqual(info1.compress_type, info2.compress_type)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'Requires forked workers.')
+    def testJobsWorkerDied(self):
+        # A worker that dies takes the pool with it, which should only fail the
+        # files that were in it rather than the whole run.
+        script = textwrap.dedent('''
+            import multiprocessing
+            import os
+            import sys
+
+            import extract_msg.__main__
+
+            def crashWorker(path, *args):
+                os._exit(1)
+
+            multiprocessing.set_start_method('fork')
+            extract_msg.__main__._saveMsgWorker = crashWorker
+            extract_msg.__main__.main(sys.argv)
+        ''')
+        paths = [str(x) for x in sorted(TEST_FILE_DIR.glob('*.msg'))]
+        with tempfile.TemporaryDirectory() as tempDir:
+            result = subprocess.run([sys.executable, '-c', script, '--jobs', '2', '--out', tempDir] + paths, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        for path in paths:
+            with self.subTest(path):
+                self.assertIn(f'Error with file "{path}"'.encode(), result.stdout)
+        self.assertIn(b'BrokenProcessPool', result.stdout)
+
     @unittest.skipIf(USER_TEST_DIR is None, 'User test files not defined.')
     def testUserStdin(self):
         self.testStdin(USER_TEST_DIR)
\ No newline at end of file
@@ -0,0 +1,62 @@
+__all__ = [
+    'EncodingTests',
+]
+
+
+import codecs
+import subprocess
+import sys
+import unittest
+
+from extract_msg.encoding._dt import _win874_dec, _win950_dec
+
+
+class EncodingTests(unittest.TestCase):
+    def testSingleByteDecode(self):
+        table = _win874_dec.decodingTable
+        data = bytes(x for x in range(256) if table.get(x) is not None)
+        expected = ''.join(table[x] for x in data)
+        self.assertEqual(data.decode('windows-874'), expected)
+
+    def testVariableByteDecode(self):
+        table = _win950_dec.decodingTable
+        # Every defined pair, with single bytes mixed in between some of them.
+        keys = [key for key, value in table.items() if value is not None]
+        parts = []
+        for index, key in enumerate(keys):
+            parts.append(bytes((key >> 8, key & 0xFF)) if key > 0xFF else bytes((key,)))
+            if index % 7 == 0:
+                parts.append(b'text ')
+        expected = ''.join('text ' if part == b'text ' else table[int.from_bytes(part, 'big')] for part in parts)
+        self.assertEqual(b''.join(parts).decode('windows-950'), expected)
+
+    def testVariableByteDecodeErrors(self):
+        for data, expected, message in (
+            # A lead byte at the end of the data.
+            (b'a\xA4', 'a�', 'unexpected end of data'),
+            # A lead byte without a valid trail byte.
+            (b'\xA4\n', '�\n', 'illegal multibyte sequence'),
+            # Valid pairs followed by one that is not defined.
+            (b'\xA4\x40\xA3\xC0x', '一�x', 'character maps to <undefined>'),
+        ):
+            with self.subTest(data):
+                self.assertEqual(data.decode('windows-950', 'replace'), expected)
+                with self.assertRaisesRegex(UnicodeDecodeError, message):
+                    data.decode('windows-950')
+
+    def testIncrementalDecode(self):
+        decoder = codecs.getincrementaldecoder('windows-950')()
+        # The lead byte at the end should be kept for the next call.
+        self.assertEqual(decoder.decode(b'a\xA4'), 'a')
+        self.assertEqual(decoder.decode(b'\x40b', final = True), '一b')
+
+    def testLazyTables(self):
+        # The decoding tables should only be imported when a codec is used.
+        code = (
+            'import codecs, sys, extract_msg;'
+            'print(any(".encoding._dt._" in x for x in sys.modules));'
+            'codecs.lookup("windows-950");'
+            'print("extract_msg.encoding._dt._win950_dec" in sys.modules)'
+        )
+        output = subprocess.run([sys.executable, '-c', code], capture_output = True, check = True, text = True).stdout
+        self.assertEqual(output.split(), ['False', 'True'])
@@ -0,0 +1,130 @@
+__all__ = [
+    'HtmlTests',
+]
+
+
+import base64
+import io
+import pathlib
+import tempfile
+import unittest
+import zipfile
+
+import bs4
+
+from extract_msg import openMsg
+from .constants import TEST_FILE_DIR
+
+
+class HtmlTests(unittest.TestCase):
+    def testPreparedHeader(self):
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            data = msg.getSaveHtmlBody(preparedHtml = True, charset = 'utf-8')
+
+        soup = bs4.BeautifulSoup(data, features = 'html.parser')
+        # The header goes at the start of the body, only once.
+        self.assertEqual(len(soup.find_all('div', id = 'injectedHeader')), 1)
+        self.assertEqual(soup.body.contents[0].get('id'), 'injectedHeader')
+        metas = soup.find_all('meta', {'http-equiv': 'Content-Type'})
+        self.assertEqual(len(metas), 1)
+        self.assertEqual(metas[0]['content'], 'text/html; charset=utf-8')
+        self.assertIs(metas[0].parent, soup.head)
+
+    def testPreparedNoCharset(self):
+        # Without a charset, the output is the same as it was before the
+        # prepared HTML was written from the parsed tree.
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            data = msg.getSaveHtmlBody(preparedHtml = True, charset = None)
+            self.assertEqual(data, msg.injectHtmlHeader(prepared = True))
+
+        # Nothing declares the encoding, so the header has to stay as entities.
+        self.assertIn(b'&nbsp;', data)
+        self.assertNotIn(b'\xc2\xa0', data)
+        self.assertNotIn(b'http-equiv', data)
+
+    def testPreparedMissingTags(self):
+        bodies = (
+            b'<p>Test</p>',
+            b'<html><p>Test</p></html>',
+            b'<body><p>Test</p></body>',
+            b'<head><title>Title</title></head><p>Test</p><footer>End</footer>',
+        )
+        for body in bodies:
+            with self.subTest(body), openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+                # Replace the cached HTML body to test how it gets corrected.
+                msg.__dict__['htmlBody'] = body
+                soup = bs4.BeautifulSoup(msg.getSaveHtmlBody(preparedHtml = True), features = 'html.parser')
+
+                self.assertEqual(len(soup.find_all('html')), 1)
+                self.assertEqual(len(soup.find_all('body')), 1)
+                self.assertEqual(soup.body.contents[0].get('id'), 'injectedHeader')
+                self.assertEqual(soup.body.find_all('p')[-1].text, 'Test')
+                if soup.footer:
+                    self.assertIs(soup.body.next_sibling, soup.footer)
+
+    def testInlineImages(self):
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            first, second = msg.attachments
+            first.__dict__['cid'] = 'first'
+            second.__dict__['cid'] = 'second'
+            msg.__dict__['htmlBody'] = b'<html><body><img src="cid:first"><img src="cid:second"><img src="cid:first"><img src="cid:missing"></body></html>'
+
+            soup = bs4.BeautifulSoup(msg.htmlBodyPrepared, features = 'html.parser')
+            expected = [
+                'data:image/tiff;base64,' + base64.b64encode(first.data).decode(),
+                'data:image/tiff;base64,' + base64.b64encode(second.data).decode(),
+            ]
+            self.assertEqual([tag['src'] for tag in soup.find_all('img')], expected + expected[:1] + ['cid:missing'])
+            self.assertEqual(msg.attachmentsByCid, {'first': first, 'second': second})
+
+    def testLinkAttachments(self):
+        with tempfile.TemporaryDirectory() as tempDir, openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            first, second = msg.attachments
+            first.__dict__['cid'] = 'first'
+            second.__dict__['cid'] = 'second'
+            msg.__dict__['htmlBody'] = b'<html><body><img src="cid:first"><img src="cid:second"></body></html>'
+            expected = ['import%20OleFileIO.tif', 'data:image/tiff;base64,' + base64.b64encode(second.data).decode()]
+
+            # Hidden attachments that are skipped are still embedded.
+            second.__dict__['hidden'] = True
+            _, path = msg.save(customPath = tempDir, html = True, preparedHtml = True, linkAttachments = True, skipHidden = True)
+            soup = bs4.BeautifulSoup((pathlib.Path(path) / 'message.html').read_bytes(), features = 'html.parser')
+            self.assertEqual([tag['src'] for tag in soup.find_all('img')], expected)
+
+            # Paths in a zip file should be relative to the message.
+            with zipfile.ZipFile(pathlib.Path(tempDir) / 'out.zip', 'a') as _zip:
+                msg.save(zip = _zip, customPath = 'folder', html = True, preparedHtml = True, linkAttachments = True)
+                name = next(x for x in _zip.namelist() if x.endswith('message.html'))
+                soup = bs4.BeautifulSoup(_zip.read(name), features = 'html.parser')
+            self.assertEqual([tag['src'] for tag in soup.find_all('img')], ['import%20OleFileIO.tif', 'raised%20value%20error.tif'])
+
+    def testIndexText(self):
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            self.assertEqual(msg.getIndexText(), msg.body)
+            self.assertEqual(msg.getIndexText(10), msg.body[:10])
+
+            # Without the plain text body, the HTML body should be used.
+            msg.getStringStream = lambda _: None
+            self.assertEqual(msg.getIndexText().split(), msg.body.split())
+
+            # Without the HTML body as well, the RTF body should be used.
+            msg.getStream = lambda _: None
+            self.assertEqual(msg.getIndexText().split(), msg.body.split())
+
+    def testWriteSaveBodies(self):
+        # Writing the bodies should give the same data as getting them.
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            for write, get, kwargs in (
+                (msg.writeSaveBody, msg.getSaveBody, {}),
+                (msg.writeSaveHtmlBody, msg.getSaveHtmlBody, {}),
+                (msg.writeSaveHtmlBody, msg.getSaveHtmlBody, {'preparedHtml': True}),
+                (msg.writeSaveRtfBody, msg.getSaveRtfBody, {}),
+            ):
+                with self.subTest(write.__name__, **kwargs):
+                    f = io.BytesIO()
+                    write(f, **kwargs)
+                    self.assertEqual(f.getvalue(), get(**kwargs))
+
+            self.assertEqual(msg.getSaveHtmlBody(), msg.injectHtmlHeader())
+            self.assertEqual(msg.getSaveRtfBody(), msg.injectRtfHeader())
+            self.assertTrue(msg.getSaveBody().endswith(msg.body.encode('utf-8')))
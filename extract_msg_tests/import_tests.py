@@ -0,0 +1,62 @@
+__all__ = [
+    'ImportTests',
+]
+
+
+import json
+import subprocess
+import sys
+import unittest
+
+from .constants import TEST_FILE_DIR
+
+
+# The most time importing the module is allowed to take, in seconds. Importing
+# it takes a fraction of this, but the limit needs to be loose enough to not
+# fail on slow machines.
+IMPORT_TIME_BUDGET = 0.2
+
+# Modules that should only be imported when a message actually needs them.
+HEAVY_MODULES = ('bs4', 'lark', 'RTFDE')
+
+
+def runPython(code: str) -> str:
+    """
+    Runs the code in a new interpreter, so nothing is already imported, and
+    returns the output.
+    """
+    return subprocess.run([sys.executable, '-c', code], cwd = TEST_FILE_DIR.parent, capture_output = True, check = True, text = True).stdout
+
+
+class ImportTests(unittest.TestCase):
+    def testImportTime(self):
+        code = (
+            'import time\n'
+            'start = time.perf_counter()\n'
+            'import extract_msg\n'
+            'print(time.perf_counter() - start)'
+        )
+        # Use the fastest of a few tries, to ignore anything else slowing the
+        # machine down.
+        elapsed = min(float(runPython(code)) for _ in range(3))
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def testLazyImports(self):
+        code = (
+            'import json, sys\n'
+            'import extract_msg\n'
+            'imported = sorted(x for x in sys.modules if x.startswith("extract_msg."))\n'
+            f'with extract_msg.openMsg({str(TEST_FILE_DIR / "unicode.msg")!r}) as msg:\n'
+            '    msg.subject, msg.body, msg.date, msg.recipients, [att.data for att in msg.attachments]\n'
+            f'heavy = [x for x in {HEAVY_MODULES!r} if x in sys.modules]\n'
+            'print(json.dumps([imported, heavy, extract_msg.utils.__name__, hasattr(extract_msg, "missing")]))'
+        )
+        imported, heavy, utilsName, hasMissing = json.loads(runPython(code))
+        # Only the encodings, which register the custom codecs, should be
+        # imported with the module.
+        self.assertTrue(all(x.startswith(('extract_msg.encoding', 'extract_msg.exceptions')) for x in imported), imported)
+        # A plain message should not need any of the heavy dependencies.
+        self.assertEqual(heavy, [])
+        # Submodules should still be available as attributes.
+        self.assertEqual(utilsName, 'extract_msg.utils')
+        self.assertFalse(hasMissing)
@@ -1,17 +1,40 @@
 __all__ = [
+    'OleWriterBenchmarks',
     'OleWriterEditingTests',
     'OleWriterExportTests',
 ]
 
 
+import io
+import os
+import time
+import tracemalloc
 import unittest
 
+import olefile
+
 import extract_msg
 
 from .constants import TEST_FILE_DIR, USER_TEST_DIR
 from extract_msg.ole_writer import OleWriter
 
 
+def createLargeWriter(streams: int, largeStreams: int = 0) -> OleWriter:
+    """
+    Creates an OleWriter with a tree of many small streams, spread across
+    storages, and some streams too large for the mini stream.
+    """
+    writer = OleWriter()
+    storages = max(streams // 100, 1)
+    for index in range(storages):
+        writer.addEntry(f'storage_{index}', storage = True)
+    for index in range(streams):
+        writer.addEntry(f'storage_{index % storages}/stream_{index}', bytes((index & 0xFF,)) * (index % 300))
+    for index in range(largeStreams):
+        writer.addEntry(f'large_{index}', bytes((index & 0xFF,)) * (4096 + index * 1000))
+    return writer
+
+
 class OleWriterEditingTests(unittest.TestCase):
     def _setupWriter(self) -> OleWriter:
         """
@@ -129,6 +152,65 @@ class OleWriterEditingTests(unittest.TestCase):
         with self.assertRaises(ValueError, msg = 'Illegal character ("!" or ":") found in MSG path.'):
             writer.deleteEntry('::invalid')
 
+    def testDataSource(self):
+        """
+        Tests using a data source instead of data for a stream.
+        """
+        chunks = (b'Hello', b' ', b'World')
+        writer = self._setupWriter()
+        writer.addEntry('stream_2', dataSource = lambda: chunks, dataSize = 11)
+        writer.addEntry('storage_1/stream_3', dataSource = lambda: (b'\x01' * 3000,) * 2, dataSize = 6000)
+        self.assertEqual(writer.getEntry('stream_2').data, b'Hello World')
+        self.assertEqual(writer.getEntry('stream_2').dataSize, 11)
+
+        # The file should be the same as if the data was given directly.
+        expected = self._setupWriter()
+        expected.addEntry('stream_2', b'Hello World')
+        expected.addEntry('storage_1/stream_3', b'\x01' * 6000)
+        output, expectedOutput = io.BytesIO(), io.BytesIO()
+        writer.write(output)
+        expected.write(expectedOutput)
+        self.assertEqual(output.getvalue(), expectedOutput.getvalue())
+
+        # Setting the data should replace the data source.
+        writer.editEntry('stream_2', data = b'New data')
+        self.assertEqual(writer.getEntry('stream_2').dataSize, 8)
+
+        with self.assertRaises(ValueError, msg = 'Cannot set both the data and the data source of a stream.'):
+            writer.editEntry('stream_2', data = b'', dataSource = lambda: (), dataSize = 0)
+        with self.assertRaises(ValueError, msg = 'Data size must be a positive int if a data source is set.'):
+            writer.editEntry('stream_2', dataSource = lambda: ())
+        with self.assertRaises(TypeError, msg = 'Cannot set the data of a storage object.'):
+            writer.editEntry('storage_1', dataSource = lambda: (), dataSize = 0)
+
+        # A data source that gives the wrong amount of data should fail.
+        writer.editEntry('stream_2', dataSource = lambda: chunks, dataSize = 12)
+        with self.assertRaises(ValueError):
+            writer.write(io.BytesIO())
+
+    def testDataSourceMemory(self):
+        """
+        Tests that large streams from a data source are not held in memory.
+        """
+        chunk = b'\x00' * 65536
+
+        class Sink:
+            size = 0
+            def write(self, data):
+                self.size += len(data)
+
+        writer = OleWriter()
+        writer.addEntry('large', dataSource = lambda: (chunk for _ in range(256)), dataSize = 65536 * 256)
+        sink = Sink()
+        tracemalloc.start()
+        try:
+            writer.write(sink)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertGreater(sink.size, 65536 * 256)
+        self.assertLess(peak, 1048576)
 
 
 class OleWriterExportTests(unittest.TestCase):
@@ -153,6 +235,52 @@ class OleWriterExportTests(unittest.TestCase):
                 self.assertCountEqual(exportResult, exportedBytes, 'Exported data is wrong size.')
                 self.assertEqual(exportedBytes, exportResult, 'Exported data is incorrect.')
 
+    def testStreamData(self):
+        """
+        Tests that reading the streams as they are written gives the same
+        result as copying them first.
+        """
+        for path in (TEST_FILE_DIR / 'export-results').glob('*.msg'):
+            with self.subTest(path.name), extract_msg.openMsg(TEST_FILE_DIR / path.name, delayAttachments = True) as msg:
+                outputs = []
+                for streamData in (False, True):
+                    writer = OleWriter()
+                    writer.fromMsg(msg, streamData = streamData)
+                    writer.write(output := io.BytesIO())
+                    outputs.append(output.getvalue())
+                self.assertEqual(outputs[0], outputs[1])
+
+    def testLargeTree(self):
+        """
+        Tests that a file with many streams can be read back correctly.
+        """
+        writer = createLargeWriter(3000, 20)
+        # Enough data to need DIFAT sectors.
+        writer.addEntry('huge', dataSource = lambda: (b'\x01' * 1048576 for _ in range(8)), dataSize = 8388608)
+        writer.write(output := io.BytesIO())
+
+        with olefile.OleFileIO(output.getvalue()) as ole:
+            self.assertEqual(len(ole.listdir()), 3021)
+            for path in ole.listdir():
+                with self.subTest(path):
+                    self.assertEqual(ole.openstream(path).read(), writer.getEntry(path).data)
+
+    def testFullDifat(self):
+        """
+        Tests writing a file where the last DIFAT sector is exactly full.
+        """
+        writer = OleWriter()
+        # This many sectors of data needs 236 FAT sectors, which is 109 in the
+        # header and 127 in exactly one DIFAT sector.
+        writer.addEntry('large', dataSource = lambda: (bytes(512),) * 29844, dataSize = 29844 * 512)
+        writer.write(output := io.BytesIO())
+        numFat, numDifat, totalSectors = writer._getFatSectors()
+        self.assertEqual((numFat, numDifat), (236, 1))
+
+        self.assertEqual(len(output.getvalue()), (totalSectors + 1) * 512)
+        with olefile.OleFileIO(output.getvalue()) as ole:
+            self.assertEqual(ole.get_size('large'), 29844 * 512)
+
     @unittest.skipIf(USER_TEST_DIR is None, 'User test files not defined.')
     @unittest.skipIf(USER_TEST_DIR is not None and not (USER_TEST_DIR / 'export-results').exists(), 'User export tests not defined.')
     def testExtraExportExamples(self):
@@ -162,3 +290,24 @@ class OleWriterExportTests(unittest.TestCase):
         Uses the files in export-results to determine which test files to use.
         """
         self.testExportExamples(USER_TEST_DIR)
+
+
+@unittest.skipUnless(os.environ.get('EXTRACT_MSG_BENCHMARK'), 'Benchmarks are only run if EXTRACT_MSG_BENCHMARK is set.')
+class OleWriterBenchmarks(unittest.TestCase):
+    def testWriteThroughput(self):
+        """
+        Compares the speed of writing trees of different sizes. The time per
+        stream should not grow with the number of streams.
+        """
+        results = {}
+        for streams in (1000, 10000, 50000):
+            writer = createLargeWriter(streams, streams // 250)
+            times = []
+            for _ in range(3):
+                start = time.perf_counter()
+                writer.write(output := io.BytesIO())
+                times.append(time.perf_counter() - start)
+            results[streams] = min(times)
+            print(f'{streams} streams: {streams / results[streams]:.0f} streams/s, {len(output.getvalue()) / results[streams] / 1048576:.1f} MB/s')
+
+        self.assertLess(results[50000] / 50000, 3 * results[1000] / 1000)
@@ -0,0 +1,106 @@
+__all__ = [
+    'PdfTests',
+]
+
+
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+from extract_msg import openMsg, PdfBatch, WkHtmlToPdfBackend
+from extract_msg.exceptions import IncompatibleOptionsError, WKError
+from .constants import TEST_FILE_DIR
+
+
+# A script that behaves enough like wkhtmltopdf for the tests. Every time it is
+# run, it adds a line to the log file next to it.
+_FAKE_WK = '''#!{executable}
+import pathlib
+import shlex
+import sys
+
+log = pathlib.Path(__file__).with_name('calls.log')
+with open(log, 'a') as f:
+    f.write(' '.join(sys.argv[1:]) + '\\n')
+
+def convert(data):
+    if b'FAIL' in data:
+        sys.stderr.write('Failed to convert.')
+        return None
+    return b'%PDF-1.4\\n' + data + b'\\n%%EOF\\n'
+
+if sys.argv[-1] == '--read-args-from-stdin':
+    code = 0
+    for line in sys.stdin:
+        inPath, outPath = shlex.split(line)
+        if (pdf := convert(pathlib.Path(inPath).read_bytes())) is None:
+            code = 1
+        else:
+            pathlib.Path(outPath).write_bytes(pdf)
+    sys.exit(code)
+else:
+    if (pdf := convert(sys.stdin.buffer.read())) is None:
+        sys.exit(1)
+    sys.stdout.buffer.write(pdf)
+'''
+
+
+@unittest.skipIf(os.name == 'nt', 'The fake wkhtmltopdf is a script.')
+class PdfTests(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.tempDir.name)
+        self.wkPath = self.dir / 'wkhtmltopdf'
+        self.wkPath.write_text(_FAKE_WK.format(executable = sys.executable))
+        self.wkPath.chmod(0o755)
+        self.log = self.dir / 'calls.log'
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def getCalls(self):
+        return self.log.read_text().splitlines() if self.log.exists() else []
+
+    def testBatch(self):
+        backend = WkHtmlToPdfBackend(str(self.wkPath), ['-q'], batchSize = 2)
+        htmls = [b'one', b'two', b'FAIL', b'four', b'five']
+        results = backend.renderBatch(htmls)
+
+        self.assertEqual(results[0], b'%PDF-1.4\none\n%%EOF\n')
+        self.assertEqual(results[1], b'%PDF-1.4\ntwo\n%%EOF\n')
+        self.assertIsInstance(results[2], WKError)
+        self.assertEqual(results[3], b'%PDF-1.4\nfour\n%%EOF\n')
+        self.assertEqual(results[4], b'%PDF-1.4\nfive\n%%EOF\n')
+        # One process for each batch, plus one to get the error for the body
+        # that failed.
+        self.assertEqual(self.getCalls(), ['-q --read-args-from-stdin'] * 2 + ['-q - -', '-q --read-args-from-stdin'])
+
+        # Several processes at once should give the same results.
+        backend = WkHtmlToPdfBackend(str(self.wkPath), batchSize = 2, maxProcesses = 3)
+        self.assertEqual([x for x in backend.renderBatch(htmls) if not isinstance(x, Exception)], [results[x] for x in (0, 1, 3, 4)])
+
+    def testRender(self):
+        backend = WkHtmlToPdfBackend(str(self.wkPath))
+        self.assertEqual(backend.render(b'<p>Test</p>'), b'%PDF-1.4\n<p>Test</p>\n%%EOF\n')
+        with self.assertRaises(WKError):
+            backend.render(b'FAIL')
+        with self.assertRaises(TypeError):
+            WkHtmlToPdfBackend(str(self.wkPath), [1])
+
+    def testSave(self):
+        batch = PdfBatch(WkHtmlToPdfBackend(str(self.wkPath)))
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            _, path = msg.save(customPath = self.dir, pdf = True, pdfBatch = batch, skipAttachments = True)
+            expected = msg.getSavePdfBody(wkPath = str(self.wkPath), preparedHtml = True)
+            with self.assertRaises(IncompatibleOptionsError):
+                msg.save(zip = self.dir / 'out.zip', pdf = True, pdfBatch = batch)
+
+        # Nothing is written until the batch is flushed.
+        path = pathlib.Path(path) / 'message.pdf'
+        self.assertFalse(path.exists())
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(batch.flush(), [])
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(path.read_bytes(), expected)
@@ -13,7 +13,8 @@ from extract_msg.constants import (
         FIXED_LENGTH_PROPS_STRING, NULL_DATE, PYTPFLOATINGTIME_START,
         VARIABLE_LENGTH_PROPS_STRING
     )
-from extract_msg.enums import ErrorCodeType, PropertyFlags
+from extract_msg.enums import ErrorCodeType, PropertiesType, PropertyFlags
+from extract_msg.properties import PropertiesStore
 from extract_msg.properties.prop import (
         createNewProp, createProp, FixedLengthProp, VariableLengthProp
     )
@@ -452,4 +453,41 @@ class PropTests(unittest.TestCase):
                 # Ensure the output value is as expected if `entry[2]` is not
                 # None.
                 if entry[2]:
-                    self.assertEqual(bytes(prop), entry[2])
\ No newline at end of file
+                    self.assertEqual(bytes(prop), entry[2])
+
+    def testFiletime(self):
+        prop = createProp(b'\x40\x00\x01\x02\x01\x00\x00\x00\x00\x80\x3E\xD5\xDE\xB1\x9D\x01')
+        # 0 as a unix timestamp.
+        self.assertEqual(prop.filetime, 116444736000000000)
+        prop.value = fromTimeStamp(86400)
+        self.assertEqual(prop.filetime, 116444736000000000 + 864000000000)
+
+        with self.assertRaises(TypeError):
+            createNewProp('02010003').filetime
+
+    def testPropertiesStore(self):
+        # Only use the first check for each name, as a store can only hold one
+        # property for each.
+        entries = []
+        for entry in _propChecks:
+            if entry[2] and all(entry[4] != x[4] for x in entries):
+                entries.append(entry)
+        data = b'\x00' * 8 + b''.join(entry[1] for entry in entries)
+        store = PropertiesStore(data, PropertiesType.ATTACHMENT)
+
+        self.assertFalse(store.isError)
+        self.assertEqual(len(store), len(entries))
+        self.assertEqual(list(store), [entry[4] for entry in entries])
+        for entry in entries:
+            with self.subTest(f'Store Test {entry[0]}.'):
+                prop = store[entry[4]]
+                self.assertIsInstance(prop, entry[3])
+                self.assertIs(store[entry[4]], prop)
+                self.assertIs(prop.flags, entry[6])
+                self.assertEqual(bytes(prop), entry[2])
+
+        # Looking up by the short ID should give the first property with it.
+        self.assertEqual(store['0201'].name, entries[0][4])
+        self.assertEqual([prop.name for prop in store.getProperties(0x0201)], [entry[4] for entry in entries if entry[4].startswith('0201')])
+        self.assertEqual(store.toBytes(), data)
+        self.assertEqual(store.makeWritable().toBytes(), b'\x00' * 8 + b''.join(entry[2] for entry in entries))
@@ -0,0 +1,182 @@
+__all__ = [
+    'RtfTests',
+]
+
+
+import tempfile
+import unittest
+
+import RTFDE
+
+from extract_msg import DiskRtfCache, MemoryRtfCache, openMsg
+from extract_msg._rtf import (
+        createDocument, deencapsulateHtml, extractText, findStartRTFInjection,
+        injectStartRTF, injectStartRTFSpliced, spliceStartRTF, Token,
+        tokenizeRTF, TokenType
+    )
+from extract_msg.enums import DeencapType
+from .constants import TEST_FILE_DIR
+
+
+_HTML_HEADER = b'{\\rtf1\\ansi\\ansicpg1252\\fromhtml1 \\deff0{\\fonttbl\r\n{\\f0\\fswiss Arial;}{\\f1\\fcharset128 MS;}}\r\n{\\colortbl\\red0;}\\uc1\\pard\\plain \\f0\\fs24 \r\n'
+
+
+class RtfTests(unittest.TestCase):
+    def testDeencapsulateHtml(self):
+        # The results should be the same as RTFDE.
+        for name in ('unicode.msg', 'strangeDate.msg'):
+            with self.subTest(name = name):
+                with openMsg(TEST_FILE_DIR / name) as msg:
+                    rtfBody = msg.rtfBody
+                deencapsulator = RTFDE.DeEncapsulator(rtfBody[:rtfBody.rfind(b'}') + 1])
+                deencapsulator.deencapsulate()
+                self.assertEqual(deencapsulateHtml(rtfBody), deencapsulator.html)
+
+        checks = (
+            (b'{\\*\\htmltag19 <html>\r\n}a\\\'e9\\u8212?b\\par c\\tab\\~\\{ {\\*\\mhtmltag1 x}z}', '<html>aé—b\nc\t&nbsp;{ z'),
+            (b'\\htmlrtf {\\*\\htmltag64 <p>}x\\htmlrtf0 y{\\*\\htmltag64 <p>}\\htmlrtf {\\htmlrtf0 in\\htmlrtf\\par}}', 'y<p>in'),
+            (b'{\\f1 \\\'82\\\'a0}\\\'82\\u-10179?\\u-8704?\\uc2\\u12354\\\'82\\\'a0 x}', 'あ‚😀あ x'),
+            # Data after the end of the document is ignored.
+            (b'{\\*\\htmltag4 \\par }{\\pict\\bin2 }}}text}trailing', '\ntext'),
+        )
+        for body, html in checks:
+            with self.subTest(body = body):
+                self.assertEqual(deencapsulateHtml(_HTML_HEADER + body), html.encode('utf-8'))
+
+        # Anything that isn't encapsulated HTML is left for RTFDE.
+        self.assertIsNone(deencapsulateHtml(b'{\\rtf1\\ansi\\fromtext \\deff0 text}'))
+        self.assertIsNone(deencapsulateHtml(b'{\\rtf1\\ansi{\\fonttbl}\\fromhtml1 text}'))
+        self.assertIsNone(deencapsulateHtml(b'not rtf'))
+        for body in (b'{\\*\\htmltag19 <html>}', b"\\'zz}", b"\\' a}"):
+            with self.subTest(body = body):
+                with self.assertRaises(ValueError):
+                    deencapsulateHtml(_HTML_HEADER + body)
+
+    def testExtractText(self):
+        # The text should match the plain text body, ignoring line endings.
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            text = extractText(msg.rtfBody)
+            self.assertEqual(text.split(), msg.body.split())
+            self.assertEqual(extractText(msg.rtfBody, 10), text[:10])
+
+        data = _HTML_HEADER + b'{\\*\\htmltag64 <p>}a\\f1 \\\'82\\\'a0\\f0 b\\u55357?\\u56832?\\par{\\field{\\fldinst HYPERLINK x}{\\fldrslt link}}\\cell'
+        self.assertEqual(extractText(data), 'a\u3042b\U0001F600\nlink\t')
+        # Malformed data returns what was found.
+        self.assertEqual(extractText(b'{\\rtf1 abc{\\*\\dest unterminated'), 'abc')
+        self.assertEqual(extractText(b'{\\rtf1 abc\\'), 'abc')
+        # Hex values that are not hexadecimal are replaced instead of raising.
+        self.assertEqual(extractText(b"{\\rtf1 a\\'zz b\\'e9\\' f}"), 'a\uFFFD b\xE9\uFFFD')
+
+    def testInjectSpliced(self):
+        with openMsg(TEST_FILE_DIR / 'unicode.msg') as msg:
+            rtfBody = msg.rtfBody
+
+        documents = (
+            rtfBody,
+            b'{\\rtf1}',
+            b'{\\rtf1\\ansi\\deff0 text}',
+            b'{\\rtf1\\ansi\\deff0\\par text}',
+            b'{\\rtf1{\\fonttbl{\\f0 Arial;}}{\\*\\generator x}\\pard text}',
+        )
+        for document in documents:
+            with self.subTest(document = document[:50]):
+                spliced = injectStartRTFSpliced(document, b'HEADER')
+                # The spliced document should be the same as injecting into
+                # the tokens once both are normalized.
+                self.assertEqual(createDocument(tokenizeRTF(spliced)), createDocument(injectStartRTF(document, b'HEADER')))
+                # The rest of the document should be untouched.
+                offset = findStartRTFInjection(document)
+                self.assertTrue(spliced.endswith(document[offset:]))
+                before, header, after = spliceStartRTF(document, b'HEADER')
+                self.assertEqual((before.nbytes, after.obj), (offset, document))
+                self.assertEqual(b''.join((before, header, after)), spliced)
+
+        self.assertEqual(injectStartRTFSpliced(b'{\\rtf1\\ansi\\deff0 text}', b'{\\b HEADER}'), b'{\\rtf1\\ansi\\deff0 {\\b HEADER}text}')
+        self.assertEqual(injectStartRTFSpliced(b'{\\rtf1\\ansi}', b'HEADER'), b'{\\rtf1\\ansi HEADER}')
+        with self.assertRaises(ValueError):
+            findStartRTFInjection(b'{\\rtf1\\ansi{\\fonttbl')
+
+    def testRtfCache(self):
+        cache = MemoryRtfCache(100)
+        cache.set('a', b'1' * 40)
+        cache.set('b', b'2' * 40)
+        cache.get('a')
+        cache.set('c', b'3' * 40)
+        # The least recently used value should have been discarded.
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), b'1' * 40)
+        self.assertEqual(cache.size, 80)
+        cache.set('d', b'4' * 101)
+        self.assertIsNone(cache.get('d'))
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            disk = DiskRtfCache(tempDir)
+            cache = MemoryRtfCache(backing = disk)
+            with openMsg(TEST_FILE_DIR / 'unicode.msg', rtfCache = cache) as msg:
+                rtfBody = msg.rtfBody
+                htmlBody = msg.deencapsulateBody(rtfBody, DeencapType.HTML)
+                self.assertIsNotNone(htmlBody)
+
+            # Every value should be stored both in memory and on disk.
+            keys = sorted(x.name for x in disk.path.iterdir())
+            self.assertEqual(len(keys), 2)
+            for key in keys:
+                self.assertEqual(cache.get(key), disk.get(key))
+
+            # A new message with the same RTF body should use the values from
+            # the cache, even if they didn't come from it.
+            for key in keys:
+                disk.set(key, b'{\\rtf1 cached}' if '-rtf-' in key else b'cached')
+            with openMsg(TEST_FILE_DIR / 'unicode.msg', rtfCache = DiskRtfCache(tempDir)) as msg:
+                self.assertEqual(msg.rtfBody, b'{\\rtf1 cached}')
+                self.assertEqual(msg.deencapsulateBody(msg.rtfBody, DeencapType.HTML), b'cached')
+
+    def testTokenize(self):
+        tokens = tokenizeRTF(b'{\\rtf1 \\ansi{\\fonttbl\\f0 Arial;}\r\n{\\*\\htmltag19 <html>}\\li-720 \\\'e9\\~\\par\n}')
+        self.assertEqual(tokens, [
+            Token(b'{', TokenType.GROUP_START),
+            Token(b'\\rtf1', TokenType.CONTROL, b'rtf', 1),
+            Token(b'\\ansi', TokenType.CONTROL, b'ansi'),
+            Token(b'{', TokenType.GROUP_START),
+            Token(b'\\fonttbl', TokenType.DESTINATION, b'fonttbl'),
+            Token(b'\\f0', TokenType.CONTROL, b'f', 0),
+            *(Token(bytes((x,)), TokenType.TEXT) for x in b'Arial;'),
+            Token(b'}', TokenType.GROUP_END),
+            Token(b'{', TokenType.GROUP_START),
+            Token(b'\\*\\htmltag19', TokenType.IGNORABLE_DESTINATION, b'htmltag', 19),
+            *(Token(bytes((x,)), TokenType.TEXT) for x in b'<html>'),
+            Token(b'}', TokenType.GROUP_END),
+            Token(b'\\li-720', TokenType.CONTROL, b'li', -720),
+            Token(b'\\\'e9', TokenType.SYMBOL, None, 0xE9),
+            Token(b'\\~', TokenType.SYMBOL),
+            Token(b'\\par', TokenType.CONTROL, b'par'),
+            Token(b'}', TokenType.GROUP_END),
+        ])
+
+        # Memory views should work the same as bytes.
+        self.assertEqual(tokenizeRTF(memoryview(b'{\\rtf1 \\b text}')), tokenizeRTF(b'{\\rtf1 \\b text}'))
+
+    def testTokenizeBinary(self):
+        tokens = tokenizeRTF(b'{\\rtf1{\\bin3 a}\\b}\\bin0 c}')
+        self.assertEqual(tokens[3:7], [
+            Token(b'\\bin3', TokenType.CONTROL, b'bin', 3),
+            Token(b'a}\\', TokenType.BINARY),
+            Token(b'b', TokenType.TEXT),
+            Token(b'}', TokenType.GROUP_END),
+        ])
+        self.assertEqual(tokens[7:10], [
+            Token(b'\\bin0', TokenType.CONTROL, b'bin', 0),
+            Token(b'', TokenType.BINARY),
+            Token(b'c', TokenType.TEXT),
+        ])
+
+        with self.assertRaises(ValueError):
+            tokenizeRTF(b'{\\rtf1\\bin10 abc}')
+
+    def testTokenizeErrors(self):
+        with self.assertRaises(TypeError):
+            tokenizeRTF(b'{\\rtf2}')
+        for data in (b'{\\rtf1\\', b'{\\rtf1\\*}', b'{\\rtf1\\*\\1}', b'{\\rtf1\\\'zz}', b'{\\rtf1\\\'a'):
+            with self.subTest(data = data):
+                with self.assertRaises(ValueError):
+                    tokenizeRTF(data)
@@ -0,0 +1,163 @@
+"""
+Functions for generating synthetic MSG files for tests.
+"""
+
+__all__ = [
+    'createMsg',
+    'createNestedMsg',
+]
+
+
+import io
+import struct
+
+import compressed_rtf
+
+from pathlib import Path
+from typing import List, Optional
+
+from .constants import TEST_FILE_DIR
+from extract_msg import openMsg, OleWriter
+
+
+def _addEmbedded(writer: OleWriter, prefix: List[str], source: Path, index: int) -> List[str]:
+    """
+    Adds the MSG file at :param source: as an embedded MSG file attachment of
+    the MSG file at :param prefix:, returning the prefix of the new embedded
+    MSG file.
+    """
+    attDir = prefix + [f'__attach_version1.0_#{index:08X}']
+    writer.addEntry(attDir, storage = True)
+    # Attachment properties: 8 reserved bytes followed by the attach method,
+    # which is 5 for an embedded MSG file.
+    props = b'\x00' * 8 + struct.pack('<HHIQ', 0x0003, 0x3705, 6, 5)
+    writer.addEntry(attDir + ['__properties_version1.0'], props)
+    writer.addEntry(attDir + ['__substg1.0_3001001F'], f'Embedded {index}'.encode('utf-16-le'))
+
+    embedDir = attDir + ['__substg1.0_3701000D']
+    writer.addEntry(embedDir, storage = True)
+    with openMsg(source, delayAttachments = True) as msg:
+        entries = msg.listDir(True, True, False)
+        entries.sort(key = len)
+        for entry in entries:
+            # Embedded MSG files use the named properties of the root.
+            if entry[0] == '__nameid_version1.0':
+                continue
+            if msg._getOleEntry(entry).entry_type == 1:
+                writer.addEntry(embedDir + entry, storage = True)
+            else:
+                data = msg.getStream(entry)
+                if entry == ['__properties_version1.0']:
+                    # The header of an embedded properties stream doesn't have
+                    # the 8 reserved bytes at the end.
+                    data = data[:24] + data[32:]
+                writer.addEntry(embedDir + entry, data)
+
+    return embedDir
+
+
+def _addProperties(writer: OleWriter, count: int) -> None:
+    """
+    Adds :param count: extra properties to the top level of the MSG file,
+    cycling through a few of the common fixed length types and strings.
+    """
+    if count > 0x4000:
+        raise ValueError(':param count: must not be more than 0x4000.')
+    path = ['__properties_version1.0']
+    data = writer.getEntry(path).data
+    for index in range(count):
+        propId = 0x4000 + index
+        type_ = (0x0003, 0x0040, 0x000B, 0x001F)[index & 3]
+        if type_ == 0x001F:
+            value = f'Synthetic property {index}'.encode('utf-16-le')
+            writer.addEntry(f'__substg1.0_{propId:04X}{type_:04X}', value)
+            data += struct.pack('<HHIII', type_, propId, 6, len(value) + 2, 0)
+        else:
+            data += struct.pack('<HHIQ', type_, propId, 6, 0x01D99DB1D53E8000 + index)
+    writer.editEntry(path, data = data)
+
+
+def _addRecipients(writer: OleWriter, count: int, source: Path) -> None:
+    """
+    Adds recipients until there are :param count: of them, each of which is a
+    copy of the first recipient of :param source:.
+    """
+    with openMsg(source, delayAttachments = True) as msg:
+        existing = msg.props.recipientCount
+        entries = [x for x in msg.listDir() if x[0] == '__recip_version1.0_#00000000']
+        streams = [(x[1:], msg.getStream(x)) for x in entries]
+
+    for index in range(existing, count):
+        for entry, data in streams:
+            writer.addEntry([f'__recip_version1.0_#{index:08X}'] + entry, data)
+
+    # Update the next recipient ID and the recipient count in the header.
+    path = ['__properties_version1.0']
+    data = bytearray(writer.getEntry(path).data)
+    struct.pack_into('<I', data, 8, max(count, existing))
+    struct.pack_into('<I', data, 16, max(count, existing))
+    writer.editEntry(path, data = bytes(data))
+
+
+def _setBody(writer: OleWriter, paragraphs: int) -> None:
+    """
+    Replaces the plain text and RTF bodies with ones that have
+    :param paragraphs: paragraphs. The RTF body is encapsulated HTML.
+    """
+    lines = [f'Paragraph {index} of the synthetic body, with enough text to be a reasonable length.' for index in range(paragraphs)]
+    writer.editEntry('__substg1.0_1000001F', data = '\r\n'.join(lines).encode('utf-16-le'))
+
+    rtf = [
+        b'{\\rtf1\\ansi\\ansicpg1252\\fromhtml1 \\deff0{\\fonttbl\r\n{\\f0\\fswiss Arial;}}\r\n',
+        b'\\uc1\\pard\\plain\\deftab360 \\f0\\fs24 \r\n',
+        b'{\\*\\htmltag19 <html>}{\\*\\htmltag50 <body>}\r\n',
+    ]
+    for line in lines:
+        rtf.append(b'{\\*\\htmltag64 <p>}\\htmlrtf {\\htmlrtf0 ' + line.encode('ascii') + b'\r\n{\\*\\htmltag72 </p>}\\htmlrtf\\par}\\htmlrtf0\r\n')
+    rtf.append(b'{\\*\\htmltag58 </body>}{\\*\\htmltag27 </html>}}')
+    writer.editEntry('__substg1.0_10090102', data = compressed_rtf.compress(b''.join(rtf)))
+
+
+def createMsg(properties: int = 0, recipients: int = 0, attachmentSize: Optional[int] = None, paragraphs: int = 0, depth: int = 0, source: Path = TEST_FILE_DIR / 'unicode.msg') -> bytes:
+    """
+    Creates an MSG file based on :param source: with the specified shape.
+
+    :param properties: The number of extra properties to add to the top level.
+    :param recipients: The total number of recipients. If less than the number
+        in :param source:, nothing is changed.
+    :param attachmentSize: If set, the size of the data of the first
+        attachment.
+    :param paragraphs: If not 0, the number of paragraphs to put in the plain
+        text and RTF bodies.
+    :param depth: The number of levels of embedded MSG files, each of which is
+        a copy of :param source:.
+    """
+    writer = OleWriter()
+    with openMsg(source, delayAttachments = True) as msg:
+        writer.fromMsg(msg)
+
+    if properties:
+        _addProperties(writer, properties)
+    if recipients:
+        _addRecipients(writer, recipients, source)
+    if attachmentSize is not None:
+        data = bytes(range(256)) * (attachmentSize // 256 + 1)
+        writer.editEntry(['__attach_version1.0_#00000000', '__substg1.0_37010102'], data = data[:attachmentSize])
+    if paragraphs:
+        _setBody(writer, paragraphs)
+
+    prefix = []
+    for index in range(depth):
+        prefix = _addEmbedded(writer, prefix, source, 0x10 + index)
+
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def createNestedMsg(depth: int, source: Path = TEST_FILE_DIR / 'unicode.msg') -> bytes:
+    """
+    Creates an MSG file with :param depth: levels of embedded MSG files, each
+    of which is a copy of :param source:.
+    """
+    return createMsg(depth = depth, source = source)
@@ -3,6 +3,8 @@ __all__ = [
 ]
 
 
+import base64
+import time
 import unittest
 
 from extract_msg import utils
@@ -36,6 +38,34 @@ class UtilTests(unittest.TestCase):
         for divideBy, expectedResult in expectedOutputs.items():
             self.assertListEqual(utils.divide(inputString, divideBy), expectedResult)
 
+    def test_iterBase64(self):
+        data = bytes(range(256)) * 4
+        for size in (1, 2, 3, 4, 100, 1024):
+            chunks = (data[x:x + size] for x in range(0, len(data), size))
+            self.assertEqual(b''.join(utils.iterBase64(chunks)), base64.b64encode(data))
+        self.assertEqual(b''.join(utils.iterBase64([])), b'')
+
+    def test_stripHtml(self):
+        html = b'<html><head><meta charset="windows-1252"><style>p {}</style></head><body><!-- <p>Hidden</p> --><p>Caf\xe9 &amp;\r\n  co</p><div>two<br>three</div><script>hidden()</script>&nbsp;end</body></html>'
+        self.assertEqual(utils.stripHtml(html), 'Caf\xe9 & co\n\ntwo\nthree\nend')
+        self.assertEqual(utils.stripHtml(b'<p>Caf\xe9</p>', 'windows-1252'), 'Caf\xe9')
+        self.assertEqual(utils.stripHtml(b'<p>Caf\xe9</p>'), 'Caf\ufffd')
+
+    def test_stripHtmlUnterminated(self):
+        # Anything after a comment or hidden element that is never closed is
+        # hidden as well.
+        self.assertEqual(utils.stripHtml(b'<p>a</p><!-- b <p>c</p>'), 'a')
+        self.assertEqual(utils.stripHtml(b'<p>a</p><script>b<p>c</p>'), 'a')
+        self.assertEqual(utils.stripHtml(b'<p>a</p><style'), 'a')
+        self.assertEqual(utils.stripHtml(b'a < b <br>c'), 'a < b\nc')
+
+        # Many unterminated constructs should not make it take quadratic time.
+        for part in (b'<!--', b'<script>', b'<script', b'<br', b'<meta', b'<'):
+            with self.subTest(part):
+                start = time.perf_counter()
+                utils.stripHtml(part * 100000)
+                self.assertLess(time.perf_counter() - start, 1)
+
     def test_makeWeakRef(self):
         self.assertIsNone(utils.makeWeakRef(None))
         class TestClass:
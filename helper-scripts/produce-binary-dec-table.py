@@ -0,0 +1,29 @@
+"""
+Basic script to convert a document for a double-byte encoding into a binary
+decoding table for use by the module, in the format read by
+`extract_msg/encoding/_dt/_win950_dec.py`.
+"""
+
+
+import sys
+import zlib
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print('Invalid number of arguments (requires exactly one file name)!')
+        exit(-1)
+
+    # U+FFFE is used for every value that is not defined.
+    charmap = ['\uFFFE'] * 0x10000
+    with open(sys.argv[1], 'r') as f:
+        for line in f:
+            # Skip comment lines.
+            if not line.strip().startswith('#'):
+                items = line.split('\t')
+                # Lines for lead bytes have a comment instead of a value.
+                if len(items) != 1 and items[1].startswith('0x'):
+                    charmap[int(items[0], 16)] = chr(int(items[1], 16))
+
+    with open('.'.join(sys.argv[1].split('.')[:-1] + ['bin']), 'wb') as f:
+        f.write(zlib.compress(''.join(charmap).encode('utf-16-be'), 9))